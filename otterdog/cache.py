@@ -10,13 +10,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from otterdog.jsonnet_cache import file_jsonnet_cache
 from otterdog.providers.github.cache.file import file_cache
 from otterdog.utils import print_trace
 
 if TYPE_CHECKING:
+    from otterdog.jsonnet_cache import JsonnetCache
     from otterdog.providers.github.cache import CacheStrategy
 
 _GITHUB_CACHE = file_cache()
+_JSONNET_CACHE = file_jsonnet_cache()
 
 
 def get_github_cache() -> CacheStrategy:
@@ -31,3 +34,17 @@ def set_github_cache(cache: CacheStrategy) -> None:
 
     print_trace(f"Setting {cache} as GitHub cache strategy")
     _GITHUB_CACHE = cache
+
+
+def get_jsonnet_cache() -> JsonnetCache:
+    global _JSONNET_CACHE
+
+    print_trace(f"Using {_JSONNET_CACHE} as jsonnet cache")
+    return _JSONNET_CACHE
+
+
+def set_jsonnet_cache(cache: JsonnetCache) -> None:
+    global _JSONNET_CACHE
+
+    print_trace(f"Setting {cache} as jsonnet cache")
+    _JSONNET_CACHE = cache
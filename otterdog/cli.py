@@ -9,14 +9,20 @@
 import asyncio
 import sys
 import traceback
+from collections.abc import Coroutine
+from datetime import datetime
+from io import StringIO
 from typing import Any
 
 import click
 from click.shell_completion import CompletionItem
 
 from otterdog.cache import set_github_cache
+from otterdog.jsonnet_evaluator import shutdown_jsonnet_evaluator
 from otterdog.operations.review_app_permissions import ReviewAppPermissionsOperation
 from otterdog.providers.github.cache.file import file_cache
+from otterdog.providers.github.session import close_shared_session
+from otterdog.snapshot import SnapshotStore
 
 from . import __version__
 from .config import OtterdogConfig
@@ -42,12 +48,13 @@ from .operations.sync_template import SyncTemplateOperation
 from .operations.uninstall_app import UninstallAppOperation
 from .operations.validate import ValidateOperation
 from .operations.web_login import WebLoginOperation
-from .utils import IndentingPrinter, init, is_debug_enabled, print_error
+from .utils import IndentingPrinter, init, is_debug_enabled, print_error, style
 
 _CONFIG_FILE = "otterdog.json"
 _CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"], "max_content_width": 120}
 
 _CONFIG: OtterdogConfig | None = None
+_PARALLEL: int = 1
 
 
 def complete_organizations(ctx, param, incomplete):
@@ -91,6 +98,17 @@ class StdCommand(click.Command):
             ),
         )
 
+        self.params.insert(
+            0,
+            click.Option(
+                ["--parallel"],
+                default=1,
+                show_default=True,
+                type=click.IntRange(min=1),
+                help="number of organizations that are processed in parallel",
+            ),
+        )
+
         self.params.insert(
             0,
             click.Option(
@@ -105,13 +123,14 @@ class StdCommand(click.Command):
         self.params.insert(0, click.Argument(["organizations"], nargs=-1, shell_complete=complete_organizations))
 
     def invoke(self, ctx: click.Context) -> Any:
-        global _CONFIG
+        global _CONFIG, _PARALLEL
 
         verbose = ctx.params.pop("verbose")
         init(verbose)
 
         config_file = ctx.params.pop("config")
         local_mode = ctx.params.pop("local")
+        _PARALLEL = ctx.params.pop("parallel")
 
         try:
             _CONFIG = OtterdogConfig.from_file(config_file, local_mode)
@@ -360,22 +379,31 @@ def import_command(organizations: list[str], force, no_web_ui):
     default="*",
     help="a valid shell pattern to match webhook urls / secret names to be included for update",
 )
-def plan(organizations: list[str], no_web_ui, repo_filter, update_webhooks, update_secrets, update_filter):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help="only retrieve repositories that changed since the last run, re-using a local snapshot for the rest",
+)
+def plan(organizations: list[str], no_web_ui, repo_filter, update_webhooks, update_secrets, update_filter, incremental):
     """
     Show changes that would be applied by otterdog based on the current configuration
     compared to the current live configuration at GitHub.
     """
-    _execute_operation(
-        organizations,
-        PlanOperation(
-            no_web_ui=no_web_ui,
-            repo_filter=repo_filter,
-            update_webhooks=update_webhooks,
-            update_secrets=update_secrets,
-            update_filter=update_filter,
-        ),
+    operation = PlanOperation(
+        no_web_ui=no_web_ui,
+        repo_filter=repo_filter,
+        update_webhooks=update_webhooks,
+        update_secrets=update_secrets,
+        update_filter=update_filter,
     )
 
+    if incremental is True:
+        operation.snapshot_store = SnapshotStore()
+
+    _execute_operation(organizations, operation)
+
 
 @cli.command(cls=StdCommand, short_help="Show changes to another local configuration.")
 @click.option(
@@ -479,6 +507,13 @@ def local_plan(organizations: list[str], suffix, repo_filter, update_webhooks, u
     default=False,
     help="enables deletion of resources if they are missing in the definition",
 )
+@click.option(
+    "--concurrency",
+    show_default=True,
+    default=10,
+    type=click.IntRange(min=1),
+    help="maximum number of changes that are applied concurrently",
+)
 def apply(
     organizations: list[str],
     force,
@@ -488,6 +523,7 @@ def apply(
     update_secrets,
     update_filter,
     delete_resources,
+    concurrency,
 ):
     """
     Apply changes based on the current configuration to the live configuration at GitHub.
@@ -502,6 +538,7 @@ def apply(
             update_secrets=update_secrets,
             update_filter=update_filter,
             delete_resources=delete_resources,
+            apply_concurrency=concurrency,
         ),
     )
 
@@ -564,6 +601,13 @@ def apply(
     default=False,
     help="enables deletion of resources if they are missing in the definition",
 )
+@click.option(
+    "--concurrency",
+    show_default=True,
+    default=10,
+    type=click.IntRange(min=1),
+    help="maximum number of changes that are applied concurrently",
+)
 def local_apply(
     organizations: list[str],
     force,
@@ -573,6 +617,7 @@ def local_apply(
     update_secrets,
     update_filter,
     delete_resources,
+    concurrency,
     suffix,
 ):
     """
@@ -589,6 +634,7 @@ def local_apply(
             update_secrets=update_secrets,
             update_filter=update_filter,
             delete_resources=delete_resources,
+            apply_concurrency=concurrency,
         ),
     )
 
@@ -744,12 +790,18 @@ def _execute_operation(organizations: list[str], operation: Operation):
             organizations = config.organization_names
 
         total_num_orgs = len(organizations)
-        current_org_number = 1
 
-        for organization in organizations:
-            org_config = config.get_organization_config(organization)
-            exit_code = max(exit_code, asyncio.run(operation.execute(org_config, current_org_number, total_num_orgs)))
-            current_org_number += 1
+        if _PARALLEL > 1 and total_num_orgs > 1 and not operation.supports_parallel_execution():
+            printer.print_warn("operation does not support parallel execution, processing organizations sequentially")
+
+        if _PARALLEL > 1 and total_num_orgs > 1 and operation.supports_parallel_execution():
+            exit_code = asyncio.run(
+                _close_session_after(_execute_operation_in_parallel(organizations, operation, config, printer))
+            )
+        else:
+            exit_code = asyncio.run(
+                _close_session_after(_execute_operation_sequentially(organizations, operation, config))
+            )
 
         operation.post_execute()
         sys.exit(exit_code)
@@ -762,5 +814,90 @@ def _execute_operation(organizations: list[str], operation: Operation):
         sys.exit(2)
 
 
+async def _execute_operation_sequentially(
+    organizations: list[str],
+    operation: Operation,
+    config: OtterdogConfig,
+) -> int:
+    exit_code = 0
+    total_num_orgs = len(organizations)
+
+    for org_number, organization in enumerate(organizations, start=1):
+        org_config = config.get_organization_config(organization)
+        exit_code = max(exit_code, await operation.execute(org_config, org_number, total_num_orgs))
+
+    return exit_code
+
+
+async def _close_session_after(coro: Coroutine[Any, Any, int]) -> int:
+    # all organizations are processed within the same event loop to re-use connections
+    # of the shared session, which is closed once processing has finished.
+    try:
+        return await coro
+    finally:
+        await close_shared_session()
+        shutdown_jsonnet_evaluator()
+
+
+async def _execute_operation_in_parallel(
+    organizations: list[str],
+    operation: Operation,
+    config: OtterdogConfig,
+    printer: IndentingPrinter,
+) -> int:
+    start = datetime.now()
+    total_num_orgs = len(organizations)
+    sem = asyncio.Semaphore(_PARALLEL)
+
+    async def execute_for_org(org_number: int, organization: str) -> tuple[int, str]:
+        async with sem:
+            # buffer the output of each organization to avoid interleaving
+            output = StringIO()
+            org_operation = operation.clone()
+            org_operation.init(config, IndentingPrinter(output))
+
+            try:
+                org_config = config.get_organization_config(organization)
+                exit_code = await org_operation.execute(org_config, org_number, total_num_orgs)
+            except Exception as e:
+                if is_debug_enabled():
+                    traceback.print_exception(e)
+
+                org_operation.printer.print_error(f"failed to process organization '{organization}': {e!s}")
+                exit_code = 2
+
+            return exit_code, output.getvalue()
+
+    tasks = [
+        asyncio.create_task(execute_for_org(org_number, organization))
+        for org_number, organization in enumerate(organizations, start=1)
+    ]
+
+    exit_code = 0
+    failed_orgs = []
+
+    # flush the output of each organization in the original order as soon as it is available
+    for organization, task in zip(organizations, tasks, strict=True):
+        org_exit_code, output = await task
+        printer.writer.write(output)
+        printer.writer.flush()
+
+        exit_code = max(exit_code, org_exit_code)
+        if org_exit_code != 0:
+            failed_orgs.append(organization)
+
+    end = datetime.now()
+    printer.println(
+        f"\n{style('Summary', bright=True)}: processed {total_num_orgs} organization(s) "
+        f"in {(end - start).total_seconds():.1f}s, "
+        f"{total_num_orgs - len(failed_orgs)} succeeded, {len(failed_orgs)} failed."
+    )
+
+    if len(failed_orgs) > 0:
+        printer.println(f"Failed organizations: {', '.join(failed_orgs)}")
+
+    return exit_code
+
+
 if __name__ == "__main__":
     cli()
@@ -28,6 +28,8 @@ class Credentials:
     _password: str | None
     _totp_secret: str | None
     _github_token: str | None
+    # a stable identity of the token if it is renewed regularly, e.g. for app installations
+    _github_token_identity: str | None = None
 
     _last_totp: str | None = None
 
@@ -72,6 +74,10 @@ class Credentials:
         else:
             return self._github_token
 
+    @property
+    def github_token_identity(self) -> str | None:
+        return self._github_token_identity
+
     def __str__(self) -> str:
         return f"Credentials(username={self.username})"
 
@@ -22,13 +22,14 @@ class InMemoryVault(CredentialProvider):
     """
 
     KEY_API_TOKEN = "api_token"
+    KEY_API_TOKEN_IDENTITY = "api_token_identity"
 
     def get_credentials(self, org_name: str, data: dict[str, Any], only_token: bool = False) -> Credentials:
         if only_token is not True:
             raise RuntimeError("in-memory vault only contains github tokens")
 
         github_token = data[self.KEY_API_TOKEN]
-        return Credentials(None, None, None, github_token)
+        return Credentials(None, None, None, github_token, data.get(self.KEY_API_TOKEN_IDENTITY))
 
     def get_secret(self, key_data: str) -> str:
         raise RuntimeError("in-memory vault does not support secrets")
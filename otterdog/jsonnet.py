@@ -15,6 +15,7 @@ from typing import Any
 import aiofiles.os
 import aiofiles.ospath
 
+from .jsonnet_evaluator import jsonnet_evaluate_snippet_async
 from .utils import (
     jsonnet_evaluate_snippet,
     parse_github_url,
@@ -101,6 +102,8 @@ class JsonnetConfig:
         if not await aiofiles.ospath.exists(self.template_file):
             raise RuntimeError(f"template file '{template_file}' does not exist")
 
+        await self._init_default_configs()
+
         self._initialized = True
 
     def default_org_config_for_org_id(self, org_id: str) -> dict[str, Any]:
@@ -113,150 +116,184 @@ class JsonnetConfig:
 
     @cached_property
     def default_org_config(self) -> dict[str, Any]:
+        default_configs = self._default_configs
+        if default_configs is not None and default_configs.get(self.create_org) is not None:
+            return default_configs[self.create_org]
+
         return self.default_org_config_for_org_id("default")
 
     @cached_property
     def default_org_custom_property_config(self):
-        try:
-            # load the default org custom property config
-            org_custom_property_snippet = (
-                f"(import '{self.template_file}').{self.create_org_custom_property}('default')"
-            )
-            return jsonnet_evaluate_snippet(org_custom_property_snippet)
-        except RuntimeError:
-            print_debug("no default org custom property config found, custom properties will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_org_custom_property,
+            "no default org custom property config found, custom properties will be skipped",
+        )
 
     @cached_property
     def default_org_webhook_config(self):
-        try:
-            # load the default org webhook config
-            org_webhook_snippet = f"(import '{self.template_file}').{self.create_org_webhook}('default')"
-            return jsonnet_evaluate_snippet(org_webhook_snippet)
-        except RuntimeError:
-            print_debug("no default org webhook config found, webhooks will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_org_webhook,
+            "no default org webhook config found, webhooks will be skipped",
+        )
 
     @cached_property
     def default_org_secret_config(self):
-        try:
-            # load the default org secret config
-            org_secret_snippet = f"(import '{self.template_file}').{self.create_org_secret}('default')"
-            return jsonnet_evaluate_snippet(org_secret_snippet)
-        except RuntimeError:
-            print_debug("no default org secret config found, secrets will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_org_secret,
+            "no default org secret config found, secrets will be skipped",
+        )
 
     @cached_property
     def default_org_variable_config(self):
-        try:
-            # load the default org variable config
-            org_variable_snippet = f"(import '{self.template_file}').{self.create_org_variable}('default')"
-            return jsonnet_evaluate_snippet(org_variable_snippet)
-        except RuntimeError:
-            print_debug("no default org variable config found, variables will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_org_variable,
+            "no default org variable config found, variables will be skipped",
+        )
 
     @cached_property
     def default_repo_config(self):
-        try:
-            # load the default repo config
-            repo_snippet = f"(import '{self.template_file}').{self.create_repo}('default')"
-            return jsonnet_evaluate_snippet(repo_snippet)
-        except RuntimeError:
-            print_debug("no default repo config found, repos will be skipped")
-            return None
+        return self._get_default_config(self.create_repo, "no default repo config found, repos will be skipped")
 
     @cached_property
     def default_repo_webhook_config(self):
-        try:
-            # load the default repo webhook config
-            repo_webhook_snippet = f"(import '{self.template_file}').{self.create_repo_webhook}('default')"
-            return jsonnet_evaluate_snippet(repo_webhook_snippet)
-        except RuntimeError:
-            print_debug("no default repo webhook config found, webhooks will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_repo_webhook,
+            "no default repo webhook config found, webhooks will be skipped",
+        )
 
     @cached_property
     def default_repo_secret_config(self):
-        try:
-            # load the default repo secret config
-            repo_secret_snippet = f"(import '{self.template_file}').{self.create_repo_secret}('default')"
-            return jsonnet_evaluate_snippet(repo_secret_snippet)
-        except RuntimeError:
-            print_debug("no default repo secret config found, secrets will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_repo_secret,
+            "no default repo secret config found, secrets will be skipped",
+        )
 
     @cached_property
     def default_repo_variable_config(self):
-        try:
-            # load the default repo variable config
-            repo_variable_snippet = f"(import '{self.template_file}').{self.create_repo_variable}('default')"
-            return jsonnet_evaluate_snippet(repo_variable_snippet)
-        except RuntimeError:
-            print_debug("no default repo variable config found, variables will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_repo_variable,
+            "no default repo variable config found, variables will be skipped",
+        )
 
     @cached_property
     def default_branch_protection_rule_config(self):
-        try:
-            # load the default branch protection rule config
-            branch_protection_snippet = (
-                f"(import '{self.template_file}').{self.create_branch_protection_rule}('default')"
-            )
-            return jsonnet_evaluate_snippet(branch_protection_snippet)
-        except RuntimeError:
-            print_debug("no default branch protection rule config found, branch protection rules will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_branch_protection_rule,
+            "no default branch protection rule config found, branch protection rules will be skipped",
+        )
 
     @cached_property
     def default_repo_ruleset_config(self):
-        try:
-            # load the default repo ruleset config
-            repo_ruleset_snippet = f"(import '{self.template_file}').{self.create_repo_ruleset}('default')"
-            return jsonnet_evaluate_snippet(repo_ruleset_snippet)
-        except RuntimeError:
-            print_debug("no default repo ruleset config found, rulesets will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_repo_ruleset,
+            "no default repo ruleset config found, rulesets will be skipped",
+        )
 
     @cached_property
     def default_environment_config(self):
-        try:
-            # load the default environment config
-            environment_snippet = f"(import '{self.template_file}').{self.create_environment}('default')"
-            return jsonnet_evaluate_snippet(environment_snippet)
-        except RuntimeError:
-            print_debug("no default environment config found, environments will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_environment,
+            "no default environment config found, environments will be skipped",
+        )
 
     @cached_property
     def default_pull_request_config(self):
-        try:
-            # load the default pull request config
-            pull_request_snippet = f"(import '{self.template_file}').{self.create_pull_request}()"
-            return jsonnet_evaluate_snippet(pull_request_snippet)
-        except RuntimeError:
-            print_debug("no default pull request config found, pull requests will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_pull_request,
+            "no default pull request config found, pull requests will be skipped",
+        )
 
     @cached_property
     def default_status_checks_config(self):
-        try:
-            # load the default status check config
-            status_checks_snippet = f"(import '{self.template_file}').{self.create_status_checks}()"
-            return jsonnet_evaluate_snippet(status_checks_snippet)
-        except RuntimeError:
-            print_debug("no default status checks config found, status checks will be skipped")
-            return None
+        return self._get_default_config(
+            self.create_status_checks,
+            "no default status checks config found, status checks will be skipped",
+        )
 
     @cached_property
     def default_merge_queue_config(self):
+        return self._get_default_config(
+            self.create_merge_queue,
+            "no default merge queue config found, merge queues will be skipped",
+        )
+
+    @cached_property
+    def _default_configs(self) -> dict[str, Any] | None:
+        """
+        Evaluates the default configs of all resources with a single evaluation of the template,
+        a constructor that is not available in the template results in a None value.
+        """
+
+        try:
+            return jsonnet_evaluate_snippet(self._default_configs_snippet)
+        except RuntimeError as ex:
+            print_debug(f"failed to evaluate all default configs at once, evaluating them separately: {ex}")
+            return None
+
+    async def _init_default_configs(self) -> None:
+        # evaluate the default configs in a separate process to avoid blocking the event loop,
+        # the result is stored in place of the cached property.
+        try:
+            self._default_configs = await jsonnet_evaluate_snippet_async(self._default_configs_snippet)
+        except RuntimeError as ex:
+            print_debug(f"failed to evaluate all default configs at once, evaluating them separately: {ex}")
+            self._default_configs = None
+
+    @property
+    def _default_configs_snippet(self) -> str:
+        def constructors(names: list[str]) -> str:
+            return ", ".join(f"'{name}'" for name in names)
+
+        with_args = constructors(self._default_constructors)
+        without_args = constructors(self._default_constructors_without_args)
+
+        return (
+            f"local template = import '{self.template_file}';\n"
+            "local default(name) = if std.objectHasAll(template, name) then template[name]('default') else null;\n"
+            "local defaultWithoutArgs(name) = if std.objectHasAll(template, name) then template[name]() else null;\n"
+            f"{{ [name]: default(name) for name in [{with_args}] }} + "
+            f"{{ [name]: defaultWithoutArgs(name) for name in [{without_args}] }}"
+        )
+
+    @property
+    def _default_constructors(self) -> list[str]:
+        return [
+            self.create_org,
+            self.create_org_custom_property,
+            self.create_org_webhook,
+            self.create_org_secret,
+            self.create_org_variable,
+            self.create_repo,
+            self.create_repo_webhook,
+            self.create_repo_secret,
+            self.create_repo_variable,
+            self.create_branch_protection_rule,
+            self.create_repo_ruleset,
+            self.create_environment,
+        ]
+
+    @property
+    def _default_constructors_without_args(self) -> list[str]:
+        return [self.create_pull_request, self.create_status_checks, self.create_merge_queue]
+
+    def _get_default_config(self, constructor: str, skip_message: str) -> dict[str, Any] | None:
+        default_configs = self._default_configs
+        if default_configs is not None:
+            config = default_configs.get(constructor)
+        else:
+            config = self._evaluate_default_config(constructor)
+
+        if config is None:
+            print_debug(skip_message)
+
+        return config
+
+    def _evaluate_default_config(self, constructor: str) -> dict[str, Any] | None:
+        args = "()" if constructor in self._default_constructors_without_args else "('default')"
+
         try:
-            # load the default merge queue config
-            merge_queue_snippet = f"(import '{self.template_file}').{self.create_merge_queue}()"
-            return jsonnet_evaluate_snippet(merge_queue_snippet)
+            return jsonnet_evaluate_snippet(f"(import '{self.template_file}').{constructor}{args}")
         except RuntimeError:
-            print_debug("no default merge queue config found, merge queues will be skipped")
             return None
 
     @property
@@ -0,0 +1,235 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import aiofiles
+import aiofiles.os
+
+from otterdog.jsonnet_evaluator import jsonnet_evaluate_file_async
+from otterdog.utils import print_debug, print_trace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from redis.asyncio.client import Redis
+
+_JSONNET_CACHE_DIR = ".cache/jsonnet"
+
+# time in seconds an evaluated configuration is retained in redis
+_REDIS_EXPIRATION = 7 * 24 * 60 * 60
+
+# entries written with a different cache version are not re-used
+_CACHE_VERSION = "1"
+
+# jsonnet only supports string literals as import paths, so imports can be discovered without evaluation
+_IMPORT_PATTERN = re.compile(r"\bimport(?:str|bin)?\s*(['\"])(.+?)(?<!\\)\1")
+
+
+class JsonnetCache(ABC):
+    """
+    Caches the evaluated result of jsonnet files, keyed by the content of the file and all its imports.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> dict[str, Any] | None: ...
+
+    @abstractmethod
+    async def put(self, key: str, data: dict[str, Any]) -> None: ...
+
+
+def file_jsonnet_cache(cache_dir: str = _JSONNET_CACHE_DIR) -> JsonnetCache:
+    return _FileJsonnetCache(cache_dir)
+
+
+def redis_jsonnet_cache(uri: str, get_connection: Callable[[], Redis] | None = None) -> JsonnetCache:
+    """
+    Returns a jsonnet cache storing evaluations in redis, using the connection returned by the given function
+    if provided, e.g. the connection of a web application that is only available once it is serving.
+    """
+    return _RedisJsonnetCache(uri, get_connection)
+
+
+def get_imported_files(file: str) -> list[tuple[str, str]]:
+    """
+    Returns the transitive set of files imported by the given jsonnet file as tuples of
+    the import path as written in the importing file and the resolved file path.
+    """
+
+    result: list[tuple[str, str]] = []
+    visited = {os.path.realpath(file)}
+    pending = [file]
+
+    while len(pending) > 0:
+        current_file = pending.pop(0)
+
+        try:
+            with open(current_file) as f:
+                content = f.read()
+        except OSError:
+            continue
+
+        base_dir = os.path.dirname(current_file)
+        for _, import_path in _IMPORT_PATTERN.findall(content):
+            resolved_file = os.path.join(base_dir, import_path)
+            result.append((import_path, resolved_file))
+
+            real_path = os.path.realpath(resolved_file)
+            if real_path not in visited:
+                visited.add(real_path)
+                pending.append(resolved_file)
+
+    return result
+
+
+def get_cache_key(file: str) -> str:
+    """
+    Returns a key for the given jsonnet file that changes whenever the file or any of its imports changes.
+
+    Only the content of files and the import paths as written contribute to the key, so that the same
+    configuration checked out to different directories results in the same key.
+    """
+
+    digest = hashlib.sha256(_CACHE_VERSION.encode("utf-8"))
+    _update_digest(digest, file)
+
+    for import_path, resolved_file in get_imported_files(file):
+        digest.update(import_path.encode("utf-8"))
+        _update_digest(digest, resolved_file)
+
+    return digest.hexdigest()
+
+
+async def get_cache_key_async(file: str) -> str:
+    """Returns the cache key of the given jsonnet file without blocking the event loop."""
+    return await asyncio.to_thread(get_cache_key, file)
+
+
+def _update_digest(digest: Any, file: str) -> None:
+    try:
+        with open(file, "rb") as f:
+            content = f.read()
+    except OSError:
+        # a missing import will fail during evaluation, but still needs to be part of the key
+        content = b"<missing>"
+
+    digest.update(hashlib.sha256(content).digest())
+
+
+async def jsonnet_evaluate_file_cached(file: str, cache: JsonnetCache) -> dict[str, Any]:
+    """
+    Evaluates the given jsonnet file, re-using a previously evaluated result
+    if neither the file nor any of its imports have changed.
+    """
+
+    key = await get_cache_key_async(file)
+
+    data = await cache.get(key)
+    if data is not None:
+        print_debug(f"using cached evaluation of jsonnet file {file}")
+        return data
+
+    data = await jsonnet_evaluate_file_async(file)
+    await cache.put(key, data)
+    return data
+
+
+class _FileJsonnetCache(JsonnetCache):
+    def __init__(self, cache_dir: str):
+        self._cache_dir = cache_dir
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        cache_file = self._get_cache_file(key)
+        if not await aiofiles.os.path.exists(cache_file):
+            return None
+
+        try:
+            async with aiofiles.open(cache_file) as file:
+                return json.loads(await file.read())
+        except (OSError, ValueError) as ex:
+            print_debug(f"failed to read cached jsonnet evaluation '{cache_file}': {ex}")
+            return None
+
+    async def put(self, key: str, data: dict[str, Any]) -> None:
+        cache_file = self._get_cache_file(key)
+
+        try:
+            await aiofiles.os.makedirs(self._cache_dir, exist_ok=True)
+
+            # write to a temporary file first to never leave a partially written entry behind
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            async with aiofiles.open(tmp_file, "w") as file:
+                await file.write(json.dumps(data))
+
+            await aiofiles.os.replace(tmp_file, cache_file)
+        except OSError as ex:
+            print_debug(f"failed to store jsonnet evaluation in cache: {ex}")
+
+    def _get_cache_file(self, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{key}.json")
+
+    def __str__(self):
+        return f"file-jsonnet-cache('{self._cache_dir}')"
+
+
+class _RedisJsonnetCache(JsonnetCache):
+    def __init__(self, uri: str, get_connection: Callable[[], Redis] | None):
+        self._uri = uri
+        self._get_connection = get_connection
+        self._connection: Redis | None = None
+
+    @property
+    def connection(self) -> Redis:
+        if self._get_connection is not None:
+            return self._get_connection()
+
+        if self._connection is None:
+            from redis.asyncio import Redis
+
+            self._connection = Redis.from_url(self._uri)
+
+        return self._connection
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        from redis import RedisError
+
+        try:
+            value = await self.connection.get(self._get_redis_key(key))
+        except RedisError as ex:
+            print_debug(f"failed to read cached jsonnet evaluation from redis: {ex}")
+            return None
+
+        if value is None:
+            return None
+
+        print_trace(f"found cached jsonnet evaluation '{key}' in redis")
+        return json.loads(value)
+
+    async def put(self, key: str, data: dict[str, Any]) -> None:
+        from redis import RedisError
+
+        try:
+            await self.connection.set(self._get_redis_key(key), json.dumps(data), ex=_REDIS_EXPIRATION)
+        except RedisError as ex:
+            print_debug(f"failed to store jsonnet evaluation in redis: {ex}")
+
+    @staticmethod
+    def _get_redis_key(key: str) -> str:
+        return f"otterdog:jsonnet:{key}"
+
+    def __str__(self):
+        return f"redis-jsonnet-cache('{self._uri}')"
@@ -0,0 +1,75 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from otterdog.utils import jsonnet_evaluate_file, jsonnet_evaluate_snippet, print_debug
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+# upper bound of worker processes, evaluating a configuration is cpu bound
+# and each worker hosts its own jsonnet vm.
+_MAX_WORKERS = 8
+
+_EXECUTOR: ProcessPoolExecutor | None = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _EXECUTOR
+
+    if _EXECUTOR is None:
+        max_workers = max(1, min(os.cpu_count() or 1, _MAX_WORKERS))
+        print_debug(f"starting jsonnet evaluation pool with {max_workers} workers")
+        # workers are spawned rather than forked as the parent process
+        # is usually running an event loop and other threads.
+        _EXECUTOR = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    return _EXECUTOR
+
+
+async def _evaluate(function: Callable[[str], dict[str, Any]], arg: str) -> dict[str, Any]:
+    global _EXECUTOR
+
+    loop = asyncio.get_running_loop()
+
+    try:
+        return await loop.run_in_executor(_get_executor(), function, arg)
+    except BrokenProcessPool as ex:
+        # a crashed worker renders the whole pool unusable, start a new one on next use
+        _EXECUTOR = None
+        raise RuntimeError(f"jsonnet evaluation terminated unexpectedly: {ex!s}") from ex
+
+
+async def jsonnet_evaluate_file_async(file: str) -> dict[str, Any]:
+    """Evaluates the given jsonnet file in a separate process without blocking the event loop."""
+    return await _evaluate(jsonnet_evaluate_file, file)
+
+
+async def jsonnet_evaluate_snippet_async(snippet: str) -> dict[str, Any]:
+    """Evaluates the given jsonnet snippet in a separate process without blocking the event loop."""
+    return await _evaluate(jsonnet_evaluate_snippet, snippet)
+
+
+def shutdown_jsonnet_evaluator() -> None:
+    """Shuts down the worker processes, a new pool is started on next use."""
+
+    global _EXECUTOR
+
+    if _EXECUTOR is not None:
+        print_debug("shutting down jsonnet evaluation pool")
+        _EXECUTOR.shutdown()
+        _EXECUTOR = None
@@ -8,13 +8,16 @@
 
 from __future__ import annotations
 
+import copy
 import dataclasses
 import os
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast, final
+from functools import cache
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, cast, final
 
-from jsonbender import OptionalS, S, bend  # type: ignore
+from jsonbender import K, OptionalS, S, bend  # type: ignore
+from jsonbender.core import Bender, BendingException  # type: ignore
 
 from otterdog.utils import (
     UNSET,
@@ -42,6 +45,237 @@ MT = TypeVar("MT", bound="ModelObject")
 EMT = TypeVar("EMT", bound="EmbeddedModelObject")
 
 
+def _compile_mapping(mapping: dict[str, Any], cls: type) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """
+    Compiles a jsonbender mapping of a model class into a function that returns
+    the same result as bend(mapping, data).
+
+    Selecting a single key or a constant value is performed directly on the input data,
+    any other bender is executed by jsonbender. Entries taken over unchanged from the
+    default mapping of the class re-use their already compiled selectors.
+    """
+
+    default_mapping = _get_default_mapping(cls)
+    default_selectors = _get_default_selectors(cls)
+
+    selectors = [
+        (key, default_selectors[key] if default_mapping.get(key) is value else _compile_selector(value))
+        for key, value in mapping.items()
+    ]
+
+    def apply(data: dict[str, Any]) -> dict[str, Any]:
+        result = {}
+        for key, selector in selectors:
+            try:
+                result[key] = selector(data)
+            except Exception as ex:
+                raise BendingException(f"Error for key {key}: {ex!s}") from ex
+        return result
+
+    return apply
+
+
+def _compile_selector(bender: Any) -> Callable[[dict[str, Any]], Any]:
+    bender_type = type(bender)
+
+    # mutable default or constant values are copied to avoid sharing them between model objects.
+    if bender_type is OptionalS and len(bender._path) == 1:
+        key, default = bender._path[0], bender.default
+        if isinstance(default, list | dict):
+            return lambda data: data[key] if key in data else copy.copy(default)
+        else:
+            return lambda data: data.get(key, default)
+    elif bender_type is S and len(bender._path) == 1:
+        key = bender._path[0]
+        return lambda data: data[key]
+    elif bender_type is K:
+        value = bender._val
+        if isinstance(value, list | dict):
+            return lambda _: copy.copy(value)
+        else:
+            return lambda _: value
+    elif isinstance(bender, Bender):
+        return bender
+    else:
+        return lambda data: bend(bender, data)
+
+
+@cache
+def _get_default_mapping(cls: type) -> dict[str, Any]:
+    return {k: OptionalS(k, default=UNSET) for k in (x.name for x in _get_field_index(cls).fields)}
+
+
+@cache
+def _get_default_selectors(cls: type) -> dict[str, Callable[[dict[str, Any]], Any]]:
+    return {key: _compile_selector(value) for key, value in _get_default_mapping(cls).items()}
+
+
+@cache
+def _get_model_constructor(cls: type) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    return _compile_mapping(cls.get_mapping_from_model(), cls)  # type: ignore
+
+
+@cache
+def _get_default_provider_constructor(cls: type) -> Callable[[dict[str, Any]], dict[str, Any]] | None:
+    # custom provider mappings might depend on the org_id or the input data, and can not be compiled upfront
+    if cls.get_mapping_from_provider.__func__ not in _DEFAULT_PROVIDER_MAPPINGS:  # type: ignore
+        return None
+
+    return _compile_mapping(cls.get_mapping_from_provider("", {}), cls)  # type: ignore
+
+
+def _from_provider_data(cls: type, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
+    constructor = _get_default_provider_constructor(cls)
+    if constructor is not None:
+        return constructor(data)
+    else:
+        return _compile_mapping(cls.get_mapping_from_provider(org_id, data), cls)(data)  # type: ignore
+
+
+class ChildIndex:
+    """
+    Insertion-ordered indexes of the child collections of an object, keyed by a property of the children.
+
+    The index of a collection maps each key to the position of its child, it is built on first lookup
+    and kept in sync when children are added. A collection that has been replaced or whose length
+    changed is re-indexed on the next lookup, as is a collection whose child found for a key does
+    not have that key anymore, e.g. because it has been renamed or replaced in place. Only a key
+    that has been assigned to a child after indexing is not found without an explicit reset.
+    If multiple children share the same key, the first one is returned as for a linear scan.
+    """
+
+    __slots__ = ("_indexes", "_keys")
+
+    def __init__(self, **keys: str):
+        # maps the name of each collection to the property of its children used as key
+        self._keys = keys
+        self._indexes: dict[str, tuple[list[Any], int, dict[Any, int]]] = {}
+
+    def get(self, owner: Any, collection: str, key: Any) -> Any | None:
+        children = getattr(owner, collection)
+
+        entry = self._indexes.get(collection)
+        if entry is None or entry[0] is not children or entry[1] != len(children):
+            entry = self._build(collection, children)
+
+        position = entry[2].get(key)
+        if position is None:
+            return None
+
+        child = children[position]
+        if getattr(child, self._keys[collection]) != key:
+            entry = self._build(collection, children)
+            position = entry[2].get(key)
+            return children[position] if position is not None else None
+
+        return child
+
+    def add(self, owner: Any, collection: str, child: Any) -> None:
+        children = getattr(owner, collection)
+        children.append(child)
+
+        entry = self._indexes.get(collection)
+        if entry is not None and entry[0] is children and entry[1] == len(children) - 1:
+            entry[2].setdefault(getattr(child, self._keys[collection]), len(children) - 1)
+            self._indexes[collection] = (children, len(children), entry[2])
+        else:
+            self._indexes.pop(collection, None)
+
+    def reset(self, collection: str) -> None:
+        self._indexes.pop(collection, None)
+
+    def _build(self, collection: str, children: list[Any]) -> tuple[list[Any], int, dict[Any, int]]:
+        key_property = self._keys[collection]
+        index: dict[Any, int] = {}
+        for position, child in enumerate(children):
+            index.setdefault(getattr(child, key_property), position)
+
+        entry = (children, len(children), index)
+        self._indexes[collection] = entry
+        return entry
+
+
+class _FieldIndex:
+    """
+    The fields of a model class classified by their metadata, computed once per class.
+    """
+
+    def __init__(self, cls: type):
+        # fields that are not initialized via the constructor hold internal state of an object
+        self.fields: list[dataclasses.Field] = [field for field in dataclasses.fields(cls) if field.init]
+        self.fields_by_name: dict[str, dataclasses.Field] = {field.name: field for field in self.fields}
+
+        def with_metadata(name: str) -> frozenset[str]:
+            return frozenset(field.name for field in self.fields if field.metadata.get(name, False) is True)
+
+        self.external_only = with_metadata("external_only")
+        self.model_only = with_metadata("model_only")
+        self.read_only = with_metadata("read_only")
+        self.nested_models = with_metadata("nested_model")
+        self.embedded_models = with_metadata("embedded_model")
+
+        self.key: str | None = next((field.name for field in self.fields if field.metadata.get("key", False)), None)
+
+        self.model_fields = [field for field in self.fields if field.name not in self.external_only]
+        self.model_only_fields = [field for field in self.fields if field.name in self.model_only]
+        self.provider_fields = [
+            field
+            for field in self.model_fields
+            if field.name not in self.model_only
+            and field.name not in self.read_only
+            and field.name not in self.nested_models
+        ]
+
+        # the inclusion of fields for diff and patch computation can depend on the actual values,
+        # only consult the methods for each field if they are overridden by the class.
+        def is_overridden(name: str) -> bool:
+            return getattr(cls, name, None) is not getattr(ModelObject, name)
+
+        self.has_custom_diff_filter = is_overridden("include_field_for_diff_computation")
+        # the default implementation for patches delegates to the one for diffs
+        self.has_custom_patch_filter = self.has_custom_diff_filter or is_overridden(
+            "include_field_for_patch_computation"
+        )
+
+        self._key_candidates: dict[tuple[bool, bool], list[dataclasses.Field]] = {}
+
+    def get_field(self, key: str) -> dataclasses.Field:
+        field = self.fields_by_name.get(key)
+        if field is None:
+            raise ValueError(f"unknown key {key}")
+        return field
+
+    def get_key_candidates(self, exclude_model_only: bool, include_nested_models: bool) -> list[dataclasses.Field]:
+        """Returns the model fields remaining after applying the filters that only depend on field metadata."""
+
+        cache_key = (exclude_model_only, include_nested_models)
+        candidates = self._key_candidates.get(cache_key)
+        if candidates is None:
+            candidates = [
+                field
+                for field in self.model_fields
+                if not (exclude_model_only and field.name in self.model_only)
+                and (include_nested_models or field.name not in self.nested_models)
+            ]
+            self._key_candidates[cache_key] = candidates
+
+        return candidates
+
+
+@cache
+def _get_field_index(cls: type) -> _FieldIndex:
+    return _FieldIndex(cls)
+
+
+@cache
+def _get_field_defaults(cls: type) -> list[tuple[str, Any, Any]]:
+    return [
+        (field.name, field.default, field.default_factory)
+        for field in _get_field_index(cls).fields
+        if field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING
+    ]
+
+
 class FailureType(Enum):
     INFO = 1
     WARNING = 2
@@ -171,7 +405,7 @@ class LivePatchHandler(Protocol):
     def __call__(self, patch: LivePatch) -> None: ...
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EmbeddedModelObject(ABC):
     """
     The abstract base class for embedded model objects.
@@ -221,12 +455,12 @@ class EmbeddedModelObject(ABC):
 
     @classmethod
     def all_fields(cls) -> list[dataclasses.Field]:
-        return list(dataclasses.fields(cls))
+        return list(_get_field_index(cls).fields)
 
     def keys(self, exclude_unset_keys: bool = True) -> list[str]:
         result = []
 
-        for field in self.all_fields():
+        for field in _get_field_index(type(self)).fields:
             if exclude_unset_keys:
                 value = self.__getattribute__(field.name)
                 if not is_unset(value):
@@ -247,21 +481,19 @@ class EmbeddedModelObject(ABC):
 
     @classmethod
     def from_model_data(cls: type[EMT], data: dict[str, Any]) -> EMT:
-        mapping = cls.get_mapping_from_model()
-        return cls(**bend(mapping, data))  # type: ignore
+        return cls(**_get_model_constructor(cls)(data))  # type: ignore
 
     @classmethod
     def get_mapping_from_model(cls) -> dict[str, Any]:
-        return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        return dict(_get_default_mapping(cls))
 
     @classmethod
     def from_provider_data(cls: type[EMT], org_id: str, data: dict[str, Any]) -> EMT:
-        mapping = cls.get_mapping_from_provider(org_id, data)
-        return cls(**bend(mapping, data))  # type: ignore
+        return cls(**_from_provider_data(cls, org_id, data))  # type: ignore
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        return dict(_get_default_mapping(cls))
 
     @classmethod
     async def dict_to_provider_data(cls, org_id: str, data: dict[str, Any], provider: GitHubProvider) -> dict[str, Any]:
@@ -275,7 +507,7 @@ class EmbeddedModelObject(ABC):
         return {field.name: S(field.name) for field in cls.all_fields() if not is_unset(data.get(field.name, UNSET))}
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ModelObject(ABC):
     """
     The abstract base class for any model object.
@@ -285,13 +517,12 @@ class ModelObject(ABC):
         """
         Assigns to all field which are UNSET their default value, if one is available.
         """
-        for field in self.all_fields():
-            value = self.__getattribute__(field.name)
-            if is_unset(value):
-                if field.default is not dataclasses.MISSING:
-                    self.__setattr__(field.name, field.default)
-                elif field.default_factory is not dataclasses.MISSING:
-                    self.__setattr__(field.name, field.default_factory())
+        for name, default, default_factory in _get_field_defaults(type(self)):
+            if is_unset(self.__getattribute__(name)):
+                if default is not dataclasses.MISSING:
+                    self.__setattr__(name, default)
+                else:
+                    self.__setattr__(name, default_factory())
 
     @property
     @abstractmethod
@@ -299,17 +530,13 @@ class ModelObject(ABC):
 
     def is_keyed(self) -> bool:
         """Indicates whether the ModelObject is keyed by a property"""
-        return any(field.metadata.get("key", False) for field in self.all_fields())
+        return _get_field_index(type(self)).key is not None
 
     def get_key(self) -> str:
         """Returns the key property of this ModelObject if it keyed"""
-        assert self.is_keyed()
-        return next(
-            filter(
-                lambda field: field.metadata.get("key", False) is True,
-                self.all_fields(),
-            )
-        ).name
+        key = _get_field_index(type(self)).key
+        assert key is not None
+        return key
 
     def get_key_value(self) -> Any:
         """Returns the value of the key property"""
@@ -385,34 +612,23 @@ class ModelObject(ABC):
 
     @classmethod
     def all_fields(cls) -> list[dataclasses.Field]:
-        return list(dataclasses.fields(cls))
+        return list(_get_field_index(cls).fields)
 
     @classmethod
     def model_fields(cls) -> list[dataclasses.Field]:
-        return [field for field in dataclasses.fields(cls) if not cls.is_external_only(field)]
+        return list(_get_field_index(cls).model_fields)
 
     @classmethod
     def model_only_fields(cls) -> list[dataclasses.Field]:
-        return [field for field in dataclasses.fields(cls) if cls.is_model_only(field)]
+        return list(_get_field_index(cls).model_only_fields)
 
     @classmethod
     def provider_fields(cls) -> list[dataclasses.Field]:
-        return [
-            field
-            for field in dataclasses.fields(cls)
-            if not cls.is_external_only(field)
-            and not cls.is_model_only(field)
-            and not cls.is_read_only(field)
-            and not cls.is_nested_model(field)
-        ]
+        return list(_get_field_index(cls).provider_fields)
 
     @classmethod
     def _get_field(cls, key: str) -> dataclasses.Field:
-        for field in dataclasses.fields(cls):
-            if field.name == key:
-                return field
-
-        raise ValueError(f"unknown key {key}")
+        return _get_field_index(cls).get_field(key)
 
     @staticmethod
     def is_external_only(field: dataclasses.Field) -> bool:
@@ -424,15 +640,18 @@ class ModelObject(ABC):
 
     @classmethod
     def is_read_only_key(cls, key: str) -> bool:
-        return cls.is_read_only(cls._get_field(key))
+        index = _get_field_index(cls)
+        return index.get_field(key).name in index.read_only
 
     @classmethod
     def is_nested_model_key(cls, key: str) -> bool:
-        return cls.is_nested_model(cls._get_field(key))
+        index = _get_field_index(cls)
+        return index.get_field(key).name in index.nested_models
 
     @classmethod
     def is_embedded_model_key(cls, key: str) -> bool:
-        return cls.is_embedded_model(cls._get_field(key))
+        index = _get_field_index(cls)
+        return index.get_field(key).name in index.embedded_models
 
     @staticmethod
     def is_model_only(field: dataclasses.Field) -> bool:
@@ -478,22 +697,20 @@ class ModelObject(ABC):
     @classmethod
     @final
     def from_model_data(cls: type[MT], data: dict[str, Any]) -> MT:
-        mapping = cls.get_mapping_from_model()
-        return cls(**bend(mapping, data))  # type: ignore
+        return cls(**_get_model_constructor(cls)(data))  # type: ignore
 
     @classmethod
     def get_mapping_from_model(cls) -> dict[str, Any]:
-        return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        return dict(_get_default_mapping(cls))
 
     @classmethod
     @final
     def from_provider_data(cls: type[MT], org_id: str, data: dict[str, Any]) -> MT:
-        mapping = cls.get_mapping_from_provider(org_id, data)
-        return cls(**bend(mapping, data))  # type: ignore
+        return cls(**_from_provider_data(cls, org_id, data))  # type: ignore
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        return dict(_get_default_mapping(cls))
 
     async def to_provider_data(self, org_id: str, provider: GitHubProvider) -> dict[str, Any]:
         return await self.dict_to_provider_data(org_id, self.to_model_dict(), provider)
@@ -543,6 +760,14 @@ class ModelObject(ABC):
         """
         return True
 
+    def apply_live_patch_before_repositories(self) -> bool:
+        """
+        Indicates if live patches of this ModelObject need to be applied before any patch of a repository.
+
+        This method can be overridden if repositories depend on certain objects, e.g. custom properties
+        """
+        return False
+
     def keys(
         self,
         for_diff: bool = False,
@@ -553,17 +778,18 @@ class ModelObject(ABC):
     ) -> list[str]:
         result = []
 
-        for field in self.model_fields():
-            if for_diff is True and not self.include_field_for_diff_computation(field):
-                continue
-
-            if for_patch is True and not self.include_field_for_patch_computation(field):
-                continue
+        index = _get_field_index(type(self))
+        check_diff = for_diff is True and index.has_custom_diff_filter
+        check_patch = for_patch is True and index.has_custom_patch_filter
 
-            if (for_diff or for_patch) and not include_model_only_fields and self.is_model_only(field):
+        for field in index.get_key_candidates(
+            exclude_model_only=(for_diff or for_patch) and not include_model_only_fields,
+            include_nested_models=include_nested_models is not False,
+        ):
+            if check_diff and not self.include_field_for_diff_computation(field):
                 continue
 
-            if include_nested_models is False and self.is_nested_model(field):
+            if check_patch and not self.include_field_for_patch_computation(field):
                 continue
 
             if exclude_unset_keys:
@@ -584,6 +810,8 @@ class ModelObject(ABC):
     ) -> dict[str, Any]:
         result = {}
 
+        index = _get_field_index(type(self))
+
         for key in self.keys(
             for_diff=for_diff,
             include_model_only_fields=include_model_only_fields,
@@ -593,9 +821,9 @@ class ModelObject(ABC):
             value = self.__getattribute__(key)
             if exclude_none_values and not is_set_and_valid(value):
                 continue
-            elif self.is_nested_model_key(key):
+            elif key in index.nested_models:
                 result[key] = cast(ModelObject, value).to_model_dict(for_diff, include_nested_models)
-            elif self.is_embedded_model_key(key) and is_set_and_valid(value):
+            elif key in index.embedded_models and is_set_and_valid(value):
                 result[key] = cast(EmbeddedModelObject, value).to_model_dict()
             else:
                 result[key] = value
@@ -689,38 +917,102 @@ class ModelObject(ABC):
         context: LivePatchContext,
         handler: LivePatchHandler,
     ) -> None:
-        expected_objects_by_key = associate_by_key(expected_objects, lambda x: x.get_key_value())
-        expected_objects_by_all_keys = multi_associate_by_key(expected_objects, lambda x: x.get_all_key_values())
-
-        has_wildcard_keys = any(x.get_key_value().endswith("*") for x in expected_objects)
+        generator = LivePatchListGenerator(cls, expected_objects, parent_object, context, handler)
 
         for current_object in current_objects:
-            key = current_object.get_key_value()
-
-            expected_object = expected_objects_by_all_keys.get(key)
-            if expected_object is None and has_wildcard_keys:
-                for obj in expected_objects:
-                    stripped_key = obj.get_key_value().rstrip("*")
-                    if stripped_key and key.startswith(stripped_key):
-                        expected_object = obj
-                        break
-
-            if expected_object is None:
-                if current_object.include_existing_object_for_live_patch(context.org_id, parent_object):
-                    cls.generate_live_patch(None, current_object, parent_object, context, handler)
-                continue
-
-            if expected_object.include_for_live_patch(context):
-                cls.generate_live_patch(expected_object, current_object, parent_object, context, handler)
+            generator.process(current_object)
 
-            for k in expected_object.get_all_key_values():
-                expected_objects_by_all_keys.pop(k)
-            expected_objects_by_key.pop(expected_object.get_key_value())
-
-        for _, expected_object in expected_objects_by_key.items():
-            if expected_object.include_for_live_patch(context):
-                cls.generate_live_patch(expected_object, None, parent_object, context, handler)
+        generator.finish()
 
     @classmethod
     @abstractmethod
     async def apply_live_patch(cls, patch: LivePatch, org_id: str, provider: GitHubProvider) -> None: ...
+
+
+class LivePatchListGenerator(Generic[MT]):
+    """
+    Generates live patches for a list of expected objects with current objects that are processed one by one,
+    e.g. as soon as they have been retrieved from the provider.
+
+    Patches for a current object are passed to the handler when the object is processed,
+    patches to add expected objects without a current counterpart once all current objects have been processed.
+    """
+
+    def __init__(
+        self,
+        model_class: type[MT],
+        expected_objects: Sequence[MT],
+        parent_object: MT | None,
+        context: LivePatchContext,
+        handler: LivePatchHandler,
+    ):
+        self._model_class = model_class
+        self._parent_object = parent_object
+        self._context = context
+        self._handler = handler
+
+        self._expected_objects_by_key = associate_by_key(expected_objects, lambda x: x.get_key_value())
+        self._expected_objects_by_all_keys = multi_associate_by_key(expected_objects, lambda x: x.get_all_key_values())
+
+        # if any expected object has a wildcard key, a current object without an exact match is matched
+        # with the first expected object whose key stripped by trailing wildcards is a prefix of its key.
+        # expected objects are indexed by their stripped key, so that a lookup only needs to check
+        # the prefixes of a key whose length corresponds to any of the indexed keys.
+        self._objects_by_prefix: dict[str, tuple[int, MT]] = {}
+        if any(x.get_key_value().endswith("*") for x in expected_objects):
+            for position, obj in enumerate(expected_objects):
+                stripped_key = obj.get_key_value().rstrip("*")
+                if stripped_key:
+                    self._objects_by_prefix.setdefault(stripped_key, (position, obj))
+
+        self._prefix_lengths = sorted({len(x) for x in self._objects_by_prefix})
+
+    def _find_by_prefix(self, key: str) -> MT | None:
+        match: tuple[int, MT] | None = None
+
+        for length in self._prefix_lengths:
+            if length > len(key):
+                break
+
+            candidate = self._objects_by_prefix.get(key[:length])
+            if candidate is not None and (match is None or candidate[0] < match[0]):
+                match = candidate
+
+        return match[1] if match is not None else None
+
+    def process(self, current_object: MT) -> None:
+        key = current_object.get_key_value()
+
+        expected_object = self._expected_objects_by_all_keys.get(key)
+        if expected_object is None and len(self._objects_by_prefix) > 0:
+            expected_object = self._find_by_prefix(key)
+
+        if expected_object is None:
+            if current_object.include_existing_object_for_live_patch(self._context.org_id, self._parent_object):
+                self._model_class.generate_live_patch(
+                    None, current_object, self._parent_object, self._context, self._handler
+                )
+            return
+
+        if expected_object.include_for_live_patch(self._context):
+            self._model_class.generate_live_patch(
+                expected_object, current_object, self._parent_object, self._context, self._handler
+            )
+
+        for k in expected_object.get_all_key_values():
+            self._expected_objects_by_all_keys.pop(k)
+        self._expected_objects_by_key.pop(expected_object.get_key_value())
+
+    def finish(self) -> None:
+        for _, expected_object in self._expected_objects_by_key.items():
+            if expected_object.include_for_live_patch(self._context):
+                self._model_class.generate_live_patch(
+                    expected_object, None, self._parent_object, self._context, self._handler
+                )
+
+
+# the default provider mappings do not depend on the org_id or input data
+_DEFAULT_PROVIDER_MAPPINGS = {
+    EmbeddedModelObject.get_mapping_from_provider.__func__,  # type: ignore
+    ModelObject.get_mapping_from_provider.__func__,  # type: ignore
+}
@@ -34,7 +34,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BranchProtectionRule(ModelObject):
     """
     Represents a Branch Protection Rule within a Repository.
@@ -29,7 +29,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CustomProperty(ModelObject):
     """
     Represents a Custom Property defined in an Organization.
@@ -46,6 +46,10 @@ class CustomProperty(ModelObject):
     def model_object_name(self) -> str:
         return "custom_property"
 
+    def apply_live_patch_before_repositories(self) -> bool:
+        # repositories can only use custom properties that already exist
+        return True
+
     def validate(self, context: ValidationContext, parent_object: Any) -> None:
         if is_set_and_valid(self.value_type):
             if self.value_type not in {"string", "single_select", "multi_select", "true_false"}:
@@ -143,7 +147,7 @@ class CustomProperty(ModelObject):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(CustomProperty, cls).get_mapping_from_provider(org_id, data)
         mapping.update(
             {
                 "name": S("property_name"),
@@ -156,7 +160,7 @@ class CustomProperty(ModelObject):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = await super().get_mapping_to_provider(org_id, data, provider)
+        mapping = await super(CustomProperty, cls).get_mapping_to_provider(org_id, data, provider)
 
         if "name" in data:
             mapping.pop("name")
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Environment(ModelObject):
     """
     Represents a Deployment Environment of a Repository.
@@ -100,7 +100,7 @@ class Environment(ModelObject):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(Environment, cls).get_mapping_from_provider(org_id, data)
 
         def transform_reviewers(x):
             match x["type"]:
@@ -155,7 +155,7 @@ class Environment(ModelObject):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = await super().get_mapping_to_provider(org_id, data, provider)
+        mapping = await super(Environment, cls).get_mapping_to_provider(org_id, data, provider)
 
         if "reviewers" in mapping:
             reviewers = data["reviewers"]
@@ -10,20 +10,20 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
-import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from io import StringIO
 from typing import TYPE_CHECKING, Any
 
-import jsonschema
-from importlib_resources import as_file, files
 from jsonbender import F, Forall, OptionalS, S, bend  # type: ignore
 
-from otterdog import resources
+from otterdog.cache import get_jsonnet_cache
+from otterdog.jsonnet_cache import jsonnet_evaluate_file_cached
 from otterdog.models import (
+    ChildIndex,
     LivePatchContext,
     LivePatchHandler,
+    LivePatchListGenerator,
     ModelObject,
     PatchContext,
     ValidationContext,
@@ -42,12 +42,13 @@ from otterdog.models.repo_variable import RepositoryVariable
 from otterdog.models.repo_webhook import RepositoryWebhook
 from otterdog.models.repo_workflow_settings import RepositoryWorkflowSettings
 from otterdog.models.repository import Repository
+from otterdog.schemas import validate_org_data
+from otterdog.snapshot import OrganizationSnapshot, RepositorySnapshot, get_template_hash
 from otterdog.utils import (
     IndentingPrinter,
     associate_by_key,
     is_debug_enabled,
     is_info_enabled,
-    jsonnet_evaluate_file,
     print_debug,
 )
 
@@ -56,11 +57,10 @@ if TYPE_CHECKING:
 
     from otterdog.config import JsonnetConfig, OtterdogConfig, SecretResolver
     from otterdog.providers.github import GitHubProvider
+    from otterdog.snapshot import SnapshotStore
 
-_ORG_SCHEMA = json.loads(files(resources).joinpath("schemas/organization.json").read_text())
 
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GitHubOrganization:
     """
     Represents a GitHub Organization with its associated resources.
@@ -75,45 +75,56 @@ class GitHubOrganization:
 
     _secrets_resolved: bool = False
 
+    _children: ChildIndex = dataclasses.field(
+        default_factory=lambda: ChildIndex(webhooks="url", secrets="name", variables="name", repositories="name"),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
     @property
     def secrets_resolved(self) -> bool:
         return self._secrets_resolved
 
     def add_webhook(self, webhook: OrganizationWebhook) -> None:
-        self.webhooks.append(webhook)
+        self._children.add(self, "webhooks", webhook)
 
     def get_webhook(self, url: str) -> OrganizationWebhook | None:
-        return next(filter(lambda x: x.url == url, self.webhooks), None)  # type: ignore
+        return self._children.get(self, "webhooks", url)
 
     def set_webhooks(self, webhooks: list[OrganizationWebhook]) -> None:
         self.webhooks = webhooks
+        self._children.reset("webhooks")
 
     def add_secret(self, secret: OrganizationSecret) -> None:
-        self.secrets.append(secret)
+        self._children.add(self, "secrets", secret)
 
     def get_secret(self, name: str) -> OrganizationSecret | None:
-        return next(filter(lambda x: x.name == name, self.secrets), None)  # type: ignore
+        return self._children.get(self, "secrets", name)
 
     def set_secrets(self, secrets: list[OrganizationSecret]) -> None:
         self.secrets = secrets
+        self._children.reset("secrets")
 
     def add_variable(self, variable: OrganizationVariable) -> None:
-        self.variables.append(variable)
+        self._children.add(self, "variables", variable)
 
     def get_variable(self, name: str) -> OrganizationVariable | None:
-        return next(filter(lambda x: x.name == name, self.variables), None)  # type: ignore
+        return self._children.get(self, "variables", name)
 
     def set_variables(self, variables: list[OrganizationVariable]) -> None:
         self.variables = variables
+        self._children.reset("variables")
 
     def add_repository(self, repo: Repository) -> None:
-        self.repositories.append(repo)
+        self._children.add(self, "repositories", repo)
 
     def get_repository(self, repo_name: str) -> Repository | None:
-        return next(filter(lambda x: x.name == repo_name, self.repositories), None)  # type: ignore
+        return self._children.get(self, "repositories", repo_name)
 
     def set_repositories(self, repos: list[Repository]) -> None:
         self.repositories = repos
+        self._children.reset("repositories")
 
     def validate(self, secret_resolver: SecretResolver, template_dir: str) -> ValidationContext:
         context = ValidationContext(self, secret_resolver, template_dir)
@@ -130,13 +141,6 @@ class GitHubOrganization:
 
         return context
 
-    @staticmethod
-    def _validate_org_config(data: dict[str, Any]) -> None:
-        with as_file(files(resources).joinpath("schemas")) as resource_dir:
-            schema_root = resource_dir.as_uri()
-            resolver = jsonschema.validators.RefResolver(base_uri=f"{schema_root}/", referrer=data)
-            jsonschema.validate(instance=data, schema=_ORG_SCHEMA, resolver=resolver)
-
     def get_model_objects(self) -> Iterator[tuple[ModelObject, ModelObject | None]]:
         yield self.settings, None
         yield from self.settings.get_model_objects()
@@ -160,7 +164,7 @@ class GitHubOrganization:
     @classmethod
     def from_model_data(cls, data: dict[str, Any]) -> GitHubOrganization:
         # validate the input data with the json schema.
-        cls._validate_org_config(data)
+        validate_org_data(data)
 
         mapping = {
             "github_id": S("github_id"),
@@ -295,6 +299,60 @@ class GitHubOrganization:
 
     def generate_live_patch(
         self, current_organization: GitHubOrganization, context: LivePatchContext, handler: LivePatchHandler
+    ) -> None:
+        self._generate_live_patch_of_org_resources(current_organization, context, handler)
+
+        Repository.generate_live_patch_of_list(
+            self.repositories, current_organization.repositories, None, context, handler
+        )
+
+    async def generate_live_patch_from_provider(
+        self,
+        jsonnet_config: JsonnetConfig,
+        provider: GitHubProvider,
+        context_factory: Callable[[GitHubOrganization], LivePatchContext],
+        handler: LivePatchHandler,
+        no_web_ui: bool = False,
+        printer: IndentingPrinter | None = None,
+        concurrency: int | None = None,
+        snapshot_store: SnapshotStore | None = None,
+    ) -> LivePatchContext:
+        """
+        Generates live patches to the current organization as retrieved from the provider without loading
+        it completely first.
+
+        Patches to the settings, webhooks, secrets and variables of the organization are passed to the handler
+        once these resources have been retrieved, patches to a repository as soon as the repository
+        has been retrieved. Patches to repositories are thus not generated in a deterministic order.
+        """
+
+        current_organization = await self._load_org_resources_from_provider(
+            self.github_id, jsonnet_config, provider, no_web_ui, printer
+        )
+
+        context = context_factory(current_organization)
+        self._generate_live_patch_of_org_resources(current_organization, context, handler)
+
+        generator = LivePatchListGenerator(Repository, self.repositories, None, context, handler)
+
+        if jsonnet_config.default_repo_config is not None:
+            await _load_repos_from_provider(
+                self.github_id,
+                provider,
+                jsonnet_config,
+                printer,
+                concurrency,
+                snapshot_store,
+                generator.process,
+            )
+        else:
+            print_debug("not reading repos, no default config available")
+
+        generator.finish()
+        return context
+
+    def _generate_live_patch_of_org_resources(
+        self, current_organization: GitHubOrganization, context: LivePatchContext, handler: LivePatchHandler
     ) -> None:
         OrganizationSettings.generate_live_patch(self.settings, current_organization.settings, None, context, handler)
 
@@ -314,12 +372,8 @@ class GitHubOrganization:
             self.variables, current_organization.variables, None, context, handler
         )
 
-        Repository.generate_live_patch_of_list(
-            self.repositories, current_organization.repositories, None, context, handler
-        )
-
     @classmethod
-    def load_from_file(
+    async def load_from_file(
         cls,
         github_id: str,
         config_file: str,
@@ -331,7 +385,7 @@ class GitHubOrganization:
             raise RuntimeError(msg)
 
         print_debug(f"loading configuration for organization {github_id} from file {config_file}")
-        data = jsonnet_evaluate_file(config_file)
+        data = await jsonnet_evaluate_file_cached(config_file, get_jsonnet_cache())
 
         org = cls.from_model_data(data)
 
@@ -349,7 +403,36 @@ class GitHubOrganization:
         no_web_ui: bool = False,
         printer: IndentingPrinter | None = None,
         concurrency: int | None = None,
+        snapshot_store: SnapshotStore | None = None,
+    ) -> GitHubOrganization:
+        org = await cls._load_org_resources_from_provider(github_id, jsonnet_config, provider, no_web_ui, printer)
+
+        if jsonnet_config.default_repo_config is not None:
+            for repo in await _load_repos_from_provider(
+                github_id,
+                provider,
+                jsonnet_config,
+                printer,
+                concurrency,
+                snapshot_store,
+            ):
+                org.add_repository(repo)
+        else:
+            print_debug("not reading repos, no default config available")
+
+        return org
+
+    @classmethod
+    async def _load_org_resources_from_provider(
+        cls,
+        github_id: str,
+        jsonnet_config: JsonnetConfig,
+        provider: GitHubProvider,
+        no_web_ui: bool,
+        printer: IndentingPrinter | None,
     ) -> GitHubOrganization:
+        """Loads the organization from the provider with all its resources except its repositories."""
+
         start = datetime.now()
         if printer is not None and is_info_enabled():
             printer.println("\norganization settings: Reading...")
@@ -426,18 +509,6 @@ class GitHubOrganization:
         else:
             print_debug("not reading org secrets, no default config available")
 
-        if jsonnet_config.default_repo_config is not None:
-            for repo in await _load_repos_from_provider(
-                github_id,
-                provider,
-                jsonnet_config,
-                printer,
-                concurrency,
-            ):
-                org.add_repository(repo)
-        else:
-            print_debug("not reading repos, no default config available")
-
         return org
 
 
@@ -445,89 +516,126 @@ async def _process_single_repo(
     gh_client: GitHubProvider,
     github_id: str,
     repo_name: str,
+    repo_data: dict[str, Any],
     jsonnet_config: JsonnetConfig,
     teams: dict[str, Any],
     app_installations: dict[str, str],
+    branch_protection_rules: list[dict[str, Any]] | None = None,
 ) -> tuple[str, Repository]:
     rest_api = gh_client.rest_api
 
-    # get repo data
-    github_repo_data = await rest_api.repo.get_repo_data(github_id, repo_name)
-    repo = Repository.from_provider_data(github_id, github_repo_data)
+    async def get_branch_protection_rules() -> list[dict[str, Any]]:
+        if jsonnet_config.default_branch_protection_rule_config is not None:
+            # branch protection rules might have been retrieved in bulk already
+            if branch_protection_rules is not None:
+                return branch_protection_rules
 
-    github_repo_workflow_data = await rest_api.repo.get_workflow_settings(github_id, repo_name)
+            return await gh_client.get_branch_protection_rules(github_id, repo_name)
+        else:
+            print_debug("not reading branch protection rules, no default config available")
+            return []
+
+    async def get_rulesets() -> list[dict[str, Any]]:
+        # repository rulesets are not available for private repos and free plan
+        # TODO: support rulesets in private repos with enterprise plan
+        if jsonnet_config.default_repo_ruleset_config is not None and repo_data.get("private") is False:
+            return await rest_api.repo.get_rulesets(github_id, repo_name)
+        else:
+            print_debug("not reading repo rulesets, no default config available")
+            return []
+
+    async def get_webhooks() -> list[dict[str, Any]]:
+        if jsonnet_config.default_org_webhook_config is not None:
+            return await rest_api.repo.get_webhooks(github_id, repo_name)
+        else:
+            print_debug("not reading repo webhooks, no default config available")
+            return []
+
+    async def get_secrets() -> list[dict[str, Any]]:
+        if jsonnet_config.default_repo_secret_config is not None:
+            return await rest_api.repo.get_secrets(github_id, repo_name)
+        else:
+            print_debug("not reading repo secrets, no default config available")
+            return []
+
+    async def get_variables() -> list[dict[str, Any]]:
+        if jsonnet_config.default_repo_variable_config is not None:
+            return await rest_api.repo.get_variables(github_id, repo_name)
+        else:
+            print_debug("not reading repo variables, no default config available")
+            return []
+
+    async def get_environments() -> list[dict[str, Any]]:
+        if jsonnet_config.default_environment_config is not None:
+            return await rest_api.repo.get_environments(github_id, repo_name)
+        else:
+            print_debug("not reading environments, no default config available")
+            return []
+
+    # none of the sub-resources depend on each other, retrieve them concurrently,
+    # the overall number of requests in flight is limited by the rate limiter of the provider.
+    (
+        github_repo_data,
+        github_repo_workflow_data,
+        rules,
+        rulesets,
+        webhooks,
+        secrets,
+        variables,
+        environments,
+    ) = await asyncio.gather(
+        # complete the repo data retrieved in bulk with settings only available via the rest api
+        gh_client.complete_repo_data(github_id, repo_name, repo_data),
+        rest_api.repo.get_workflow_settings(github_id, repo_name),
+        get_branch_protection_rules(),
+        get_rulesets(),
+        get_webhooks(),
+        get_secrets(),
+        get_variables(),
+        get_environments(),
+    )
+
+    repo = Repository.from_provider_data(github_id, github_repo_data)
     repo.workflows = RepositoryWorkflowSettings.from_provider_data(github_id, github_repo_workflow_data)
 
-    if jsonnet_config.default_branch_protection_rule_config is not None:
-        # get branch protection rules of the repo
-        rules = await gh_client.get_branch_protection_rules(github_id, repo_name)
-        for github_rule in rules:
-            repo.add_branch_protection_rule(BranchProtectionRule.from_provider_data(github_id, github_rule))
-    else:
-        print_debug("not reading branch protection rules, no default config available")
-
-    # repository rulesets are not available for private repos and free plan
-    # TODO: support rulesets in private repos with enterprise plan
-    if jsonnet_config.default_repo_ruleset_config is not None and repo.private is False:
-        # get rulesets of the repo
-        rulesets = await rest_api.repo.get_rulesets(github_id, repo_name)
-        for github_ruleset in rulesets:
-            # FIXME: need to associate an app id to its slug
-            #        GitHub does not support that atm, so we lookup the currently installed
-            #        apps for an organization which provide a mapping from id to slug.
-            for actor in github_ruleset.get("bypass_actors", []):
-                if actor.get("actor_type", None) == "Integration":
-                    actor_id = str(actor.get("actor_id", 0))
-                    if actor_id in app_installations:
-                        actor["app_slug"] = app_installations[actor_id]
-                elif actor.get("actor_type", None) == "Team":
-                    actor_id = str(actor.get("actor_id", 0))
-                    if actor_id in teams:
-                        actor["team_slug"] = teams[actor_id]
-
-            for rule in github_ruleset.get("rules", []):
-                if rule.get("type", None) == "required_status_checks":
-                    required_status_checks = rule.get("parameters", {}).get("required_status_checks", [])
-                    for status_check in required_status_checks:
-                        integration_id = str(status_check.get("integration_id", 0))
-                        if integration_id in app_installations:
-                            status_check["app_slug"] = app_installations[integration_id]
-
-            repo.add_ruleset(RepositoryRuleset.from_provider_data(github_id, github_ruleset))
-    else:
-        print_debug("not reading repo rulesets, no default config available")
-
-    if jsonnet_config.default_org_webhook_config is not None:
-        # get webhooks of the repo
-        webhooks = await rest_api.repo.get_webhooks(github_id, repo_name)
-        for github_webhook in webhooks:
-            repo.add_webhook(RepositoryWebhook.from_provider_data(github_id, github_webhook))
-    else:
-        print_debug("not reading repo webhooks, no default config available")
-
-    if jsonnet_config.default_repo_secret_config is not None:
-        # get secrets of the repo
-        secrets = await rest_api.repo.get_secrets(github_id, repo_name)
-        for github_secret in secrets:
-            repo.add_secret(RepositorySecret.from_provider_data(github_id, github_secret))
-    else:
-        print_debug("not reading repo secrets, no default config available")
-
-    if jsonnet_config.default_repo_variable_config is not None:
-        # get variables of the repo
-        variables = await rest_api.repo.get_variables(github_id, repo_name)
-        for github_variable in variables:
-            repo.add_variable(RepositoryVariable.from_provider_data(github_id, github_variable))
-    else:
-        print_debug("not reading repo variables, no default config available")
-
-    if jsonnet_config.default_environment_config is not None:
-        # get environments of the repo
-        environments = await rest_api.repo.get_environments(github_id, repo_name)
-        for github_environment in environments:
-            repo.add_environment(Environment.from_provider_data(github_id, github_environment))
-    else:
-        print_debug("not reading environments, no default config available")
+    for github_rule in rules:
+        repo.add_branch_protection_rule(BranchProtectionRule.from_provider_data(github_id, github_rule))
+
+    for github_ruleset in rulesets:
+        # FIXME: need to associate an app id to its slug
+        #        GitHub does not support that atm, so we lookup the currently installed
+        #        apps for an organization which provide a mapping from id to slug.
+        for actor in github_ruleset.get("bypass_actors", []):
+            if actor.get("actor_type", None) == "Integration":
+                actor_id = str(actor.get("actor_id", 0))
+                if actor_id in app_installations:
+                    actor["app_slug"] = app_installations[actor_id]
+            elif actor.get("actor_type", None) == "Team":
+                actor_id = str(actor.get("actor_id", 0))
+                if actor_id in teams:
+                    actor["team_slug"] = teams[actor_id]
+
+        for rule in github_ruleset.get("rules", []):
+            if rule.get("type", None) == "required_status_checks":
+                required_status_checks = rule.get("parameters", {}).get("required_status_checks", [])
+                for status_check in required_status_checks:
+                    integration_id = str(status_check.get("integration_id", 0))
+                    if integration_id in app_installations:
+                        status_check["app_slug"] = app_installations[integration_id]
+
+        repo.add_ruleset(RepositoryRuleset.from_provider_data(github_id, github_ruleset))
+
+    for github_webhook in webhooks:
+        repo.add_webhook(RepositoryWebhook.from_provider_data(github_id, github_webhook))
+
+    for github_secret in secrets:
+        repo.add_secret(RepositorySecret.from_provider_data(github_id, github_secret))
+
+    for github_variable in variables:
+        repo.add_variable(RepositoryVariable.from_provider_data(github_id, github_variable))
+
+    for github_environment in environments:
+        repo.add_environment(Environment.from_provider_data(github_id, github_environment))
 
     if is_debug_enabled():
         print_debug(f"done retrieving data for repo '{repo_name}'")
@@ -541,45 +649,121 @@ async def _load_repos_from_provider(
     jsonnet_config: JsonnetConfig,
     printer: IndentingPrinter | None = None,
     concurrency: int | None = None,
+    snapshot_store: SnapshotStore | None = None,
+    repo_handler: Callable[[Repository], None] | None = None,
 ) -> list[Repository]:
+    """
+    Loads all repositories of an organization from the provider.
+
+    If a repo_handler is given, each repository is passed to it as soon as it has been retrieved and is only
+    retained afterwards if it needs to be stored in a snapshot, the returned list is empty in that case.
+    """
+
     start = datetime.now()
     if printer is not None and is_info_enabled():
         printer.println("\nrepositories: Reading...")
 
-    repo_names = await provider.get_repos(github_id)
+    # the snapshot time is taken before retrieving any data to not miss any concurrent changes
+    snapshot_time = datetime.now(timezone.utc)
 
-    teams = {
-        str(team["id"]): f"{github_id}/{team['slug']}" for team in await provider.rest_api.org.get_teams(github_id)
-    }
+    repos_data = await provider.get_repos_data(github_id)
+    repo_names = list(repos_data.keys())
+
+    unchanged_repos: dict[str, Repository] = {}
+    snapshot: OrganizationSnapshot | None = None
+    if snapshot_store is not None:
+        template_hash = get_template_hash(jsonnet_config)
+        snapshot = snapshot_store.load(github_id, template_hash)
+        if snapshot is not None:
+            unchanged_repos = await _get_unchanged_repos_from_snapshot(
+                github_id, provider, snapshot, repos_data, snapshot_store.max_age
+            )
+
+        if printer is not None and is_info_enabled():
+            printer.println(f"repositories: re-using {len(unchanged_repos)} unchanged repos from snapshot")
+
+    async def get_branch_protection_rules() -> dict[str, list[dict[str, Any]]]:
+        if jsonnet_config.default_branch_protection_rule_config is not None:
+            # retrieve the branch protection rules of all repos in bulk
+            changed_repo_names = [repo_name for repo_name in repo_names if repo_name not in unchanged_repos]
+            return await provider.get_branch_protection_rules_for_repos(github_id, changed_repo_names)
+        else:
+            return {}
+
+    github_teams, github_app_installations, branch_protection_rules = await asyncio.gather(
+        provider.rest_api.org.get_teams(github_id),
+        provider.rest_api.org.get_app_installations(github_id),
+        get_branch_protection_rules(),
+    )
+
+    teams = {str(team["id"]): f"{github_id}/{team['slug']}" for team in github_teams}
 
     app_installations = {
-        str(installation["app_id"]): installation["app_slug"]
-        for installation in await provider.rest_api.org.get_app_installations(github_id)
+        str(installation["app_id"]): installation["app_slug"] for installation in github_app_installations
     }
 
-    # limit the number of repos that are processed concurrently to avoid hitting secondary rate limits
-    sem = asyncio.Semaphore(50 if concurrency is None else concurrency)
+    # requests are throttled by the rate limiter of the provider, which acts as global budget
+    # for all requests in flight, an explicit concurrency further narrows this budget.
+    if concurrency is not None:
+        provider.rate_limiter.max_concurrency = concurrency
+
+    retain_repos = repo_handler is None or snapshot_store is not None
 
-    async def safe_process(repo_name):
-        async with sem:
-            return await _process_single_repo(provider, github_id, repo_name, jsonnet_config, teams, app_installations)
+    async def safe_process(repo_name: str) -> Repository:
+        repo = unchanged_repos.get(repo_name)
+        if repo is None:
+            _, repo = await _process_single_repo(
+                provider,
+                github_id,
+                repo_name,
+                repos_data[repo_name],
+                jsonnet_config,
+                teams,
+                app_installations,
+                branch_protection_rules.get(repo_name),
+            )
 
-    if concurrency is not None:
-        chunk_size = 50
-        result = []
-        for chunk in divide_chunks(repo_names, chunk_size):
-            result.extend(await asyncio.gather(*[safe_process(repo_name) for repo_name in chunk]))
+        return repo
+
+    tasks = [asyncio.create_task(safe_process(repo_name)) for repo_name in repo_names]
+
+    # pass each repository to the handler in the original order as soon as it and all
+    # earlier ones are available to keep the resulting output deterministic.
+    result: list[tuple[str, Repository | None]] = []
+    try:
+        for repo_name, task in zip(repo_names, tasks, strict=True):
+            loaded_repo = await task
+            if repo_handler is not None:
+                repo_handler(loaded_repo)
 
-            # after processing a full chunk, wait for 30s to avoid hitting secondary rate limits
-            if len(chunk) == chunk_size:
-                await asyncio.sleep(30)
-    else:
-        result = await asyncio.gather(*[safe_process(repo_name) for repo_name in repo_names])
+            result.append((repo_name, loaded_repo if retain_repos else None))
+    finally:
+        for task in tasks:
+            task.cancel()
 
     github_repos = []
-    for data in result:
-        _, repo_data = data
-        github_repos.append(repo_data)
+    if repo_handler is None:
+        for _, repo in result:
+            assert repo is not None
+            github_repos.append(repo)
+
+    if snapshot_store is not None:
+        new_snapshot = OrganizationSnapshot(template_hash, snapshot_time)
+        for repo_name, repo in result:
+            assert repo is not None
+            repo_data = repos_data[repo_name]
+
+            # re-used repos retain the time they have actually been loaded to expire eventually
+            if snapshot is not None and repo_name in unchanged_repos:
+                fetched_at = snapshot.repositories[repo_name].fetched_at
+            else:
+                fetched_at = snapshot_time
+
+            new_snapshot.repositories[repo_name] = RepositorySnapshot(
+                repo_data.get("pushed_at"), repo_data.get("updated_at"), repo, fetched_at
+            )
+
+        snapshot_store.save(github_id, new_snapshot)
 
     if printer is not None and is_info_enabled():
         end = datetime.now()
@@ -588,7 +772,23 @@ async def _load_repos_from_provider(
     return github_repos
 
 
-def divide_chunks(input_list, n):
-    # looping till length of input_list
-    for i in range(0, len(input_list), n):
-        yield input_list[i : i + n]
+async def _get_unchanged_repos_from_snapshot(
+    github_id: str,
+    provider: GitHubProvider,
+    snapshot: OrganizationSnapshot,
+    repos_data: dict[str, dict[str, Any]],
+    max_age: timedelta,
+) -> dict[str, Repository]:
+    try:
+        changed_repos: set[str] | None = await provider.get_repos_with_audit_events(github_id, snapshot.created_at)
+    except RuntimeError as ex:
+        print_debug(f"audit log not accessible, re-using snapshot entries up to an age of {max_age}: {ex}")
+        changed_repos = None
+
+    unchanged_repos = {}
+    for repo_name, repo_data in repos_data.items():
+        repo = snapshot.get_unchanged_repository(repo_name, repo_data, changed_repos, max_age)
+        if repo is not None:
+            unchanged_repos[repo_name] = repo
+
+    return unchanged_repos
@@ -42,7 +42,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OrganizationSettings(ModelObject):
     """
     Represents settings of a GitHub Organization.
@@ -145,7 +145,7 @@ class OrganizationSettings(ModelObject):
 
     @classmethod
     def get_mapping_from_model(cls) -> dict[str, Any]:
-        mapping = super().get_mapping_from_model()
+        mapping = super(OrganizationSettings, cls).get_mapping_from_model()
 
         mapping.update(
             {
@@ -163,7 +163,7 @@ class OrganizationSettings(ModelObject):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(OrganizationSettings, cls).get_mapping_from_provider(org_id, data)
         mapping["plan"] = OptionalS("plan", "name", default=UNSET)
         return mapping
 
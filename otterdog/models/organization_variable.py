@@ -22,7 +22,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OrganizationVariable(Variable):
     """
     Represents a Variable defined on organization level.
@@ -36,7 +36,7 @@ class OrganizationVariable(Variable):
         return "org_variable"
 
     def validate(self, context: ValidationContext, parent_object: Any) -> None:
-        super().validate(context, parent_object)
+        super(OrganizationVariable, self).validate(context, parent_object)
 
         if is_set_and_valid(self.visibility):
             from .github_organization import GitHubOrganization
@@ -67,7 +67,7 @@ class OrganizationVariable(Variable):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(OrganizationVariable, cls).get_mapping_from_provider(org_id, data)
 
         mapping.update(
             {
@@ -86,7 +86,7 @@ class OrganizationVariable(Variable):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = await super().get_mapping_to_provider(org_id, data, provider)
+        mapping = await super(OrganizationVariable, cls).get_mapping_to_provider(org_id, data, provider)
 
         if "visibility" in mapping:
             mapping["visibility"] = If(S("visibility") == K("public"), K("all"), S("visibility"))
@@ -29,7 +29,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OrganizationWorkflowSettings(WorkflowSettings):
     """
     Represents workflow settings defined on organization level.
@@ -55,10 +55,10 @@ class OrganizationWorkflowSettings(WorkflowSettings):
             else:
                 return False
 
-        return super().include_field_for_diff_computation(field)
+        return super(OrganizationWorkflowSettings, self).include_field_for_diff_computation(field)
 
     def validate(self, context: ValidationContext, parent_object: Any) -> None:
-        super().validate(context, parent_object)
+        super(OrganizationWorkflowSettings, self).validate(context, parent_object)
 
         if is_set_and_valid(self.enabled_repositories):
             if self.enabled_repositories not in {"all", "none", "selected"}:
@@ -80,7 +80,7 @@ class OrganizationWorkflowSettings(WorkflowSettings):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(OrganizationWorkflowSettings, cls).get_mapping_from_provider(org_id, data)
 
         mapping.update(
             {
@@ -98,7 +98,7 @@ class OrganizationWorkflowSettings(WorkflowSettings):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = await super().get_mapping_to_provider(org_id, data, provider)
+        mapping = await super(OrganizationWorkflowSettings, cls).get_mapping_to_provider(org_id, data, provider)
 
         if "selected_repositories" in data:
             mapping.pop("selected_repositories")
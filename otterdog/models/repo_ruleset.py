@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RepositoryRuleset(Ruleset):
     """
     Represents a ruleset defined on repo level.
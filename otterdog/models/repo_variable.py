@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RepositoryVariable(Variable):
     """
     Represents a Variable defined on repo level.
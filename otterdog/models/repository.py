@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 from jsonbender import F, Forall, If, K, OptionalS, S  # type: ignore
 
 from otterdog.models import (
+    ChildIndex,
     FailureType,
     LivePatch,
     LivePatchContext,
@@ -50,7 +51,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Repository(ModelObject):
     """
     Represents a Repository of an Organization.
@@ -119,6 +120,20 @@ class Repository(ModelObject):
     rulesets: list[RepositoryRuleset] = dataclasses.field(metadata={"nested_model": True}, default_factory=list)
     environments: list[Environment] = dataclasses.field(metadata={"nested_model": True}, default_factory=list)
 
+    _children: ChildIndex = dataclasses.field(
+        default_factory=lambda: ChildIndex(
+            webhooks="url",
+            secrets="name",
+            variables="name",
+            branch_protection_rules="pattern",
+            rulesets="name",
+            environments="name",
+        ),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
     _security_properties: ClassVar[list[str]] = [
         "secret_scanning",
         "secret_scanning_push_protection",
@@ -189,49 +204,64 @@ class Repository(ModelObject):
         return self.get_all_names()
 
     def add_branch_protection_rule(self, rule: BranchProtectionRule) -> None:
-        self.branch_protection_rules.append(rule)
+        self._children.add(self, "branch_protection_rules", rule)
+
+    def get_branch_protection_rule(self, pattern: str) -> BranchProtectionRule | None:
+        return self._children.get(self, "branch_protection_rules", pattern)
 
     def set_branch_protection_rules(self, rules: list[BranchProtectionRule]) -> None:
         self.branch_protection_rules = rules
+        self._children.reset("branch_protection_rules")
 
     def add_ruleset(self, rule: RepositoryRuleset) -> None:
-        self.rulesets.append(rule)
+        self._children.add(self, "rulesets", rule)
+
+    def get_ruleset(self, name: str) -> RepositoryRuleset | None:
+        return self._children.get(self, "rulesets", name)
 
     def set_rulesets(self, rules: list[RepositoryRuleset]) -> None:
         self.rulesets = rules
+        self._children.reset("rulesets")
 
     def add_webhook(self, webhook: RepositoryWebhook) -> None:
-        self.webhooks.append(webhook)
+        self._children.add(self, "webhooks", webhook)
 
     def get_webhook(self, url: str) -> RepositoryWebhook | None:
-        return next(filter(lambda x: x.url == url, self.webhooks), None)  # type: ignore
+        return self._children.get(self, "webhooks", url)
 
     def set_webhooks(self, webhooks: list[RepositoryWebhook]) -> None:
         self.webhooks = webhooks
+        self._children.reset("webhooks")
 
     def add_secret(self, secret: RepositorySecret) -> None:
-        self.secrets.append(secret)
+        self._children.add(self, "secrets", secret)
 
     def get_secret(self, name: str) -> RepositorySecret | None:
-        return next(filter(lambda x: x.name == name, self.secrets), None)  # type: ignore
+        return self._children.get(self, "secrets", name)
 
     def set_secrets(self, secrets: list[RepositorySecret]) -> None:
         self.secrets = secrets
+        self._children.reset("secrets")
 
     def add_variable(self, variable: RepositoryVariable) -> None:
-        self.variables.append(variable)
+        self._children.add(self, "variables", variable)
 
     def get_variable(self, name: str) -> RepositoryVariable | None:
-        return next(filter(lambda x: x.name == name, self.variables), None)  # type: ignore
+        return self._children.get(self, "variables", name)
 
     def set_variables(self, variables: list[RepositoryVariable]) -> None:
         self.variables = variables
+        self._children.reset("variables")
 
     def add_environment(self, environment: Environment) -> None:
-        self.environments.append(environment)
+        self._children.add(self, "environments", environment)
+
+    def get_environment(self, name: str) -> Environment | None:
+        return self._children.get(self, "environments", name)
 
     def set_environments(self, environments: list[Environment]) -> None:
         self.environments = environments
+        self._children.reset("environments")
 
     def coerce_from_org_settings(self, org_settings: OrganizationSettings) -> Repository:
         copy = dataclasses.replace(self)
@@ -577,7 +607,7 @@ class Repository(ModelObject):
 
     @classmethod
     def get_mapping_from_model(cls) -> dict[str, Any]:
-        mapping = super().get_mapping_from_model()
+        mapping = super(Repository, cls).get_mapping_from_model()
 
         mapping.update(
             {
@@ -602,7 +632,7 @@ class Repository(ModelObject):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(Repository, cls).get_mapping_from_provider(org_id, data)
 
         def status_to_bool(status):
             if status == "enabled":
@@ -673,7 +703,7 @@ class Repository(ModelObject):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = await super().get_mapping_to_provider(org_id, data, provider)
+        mapping = await super(Repository, cls).get_mapping_to_provider(org_id, data, provider)
 
         # add mapping for items that GitHub expects in a nested structure.
 
@@ -40,7 +40,7 @@ if TYPE_CHECKING:
 RS = TypeVar("RS", bound="Ruleset")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PullRequestSettings(EmbeddedModelObject):
     required_approving_review_count: int
     dismisses_stale_reviews: bool
@@ -72,7 +72,7 @@ class PullRequestSettings(EmbeddedModelObject):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(PullRequestSettings, cls).get_mapping_from_provider(org_id, data)
 
         mapping.update(
             {
@@ -90,7 +90,7 @@ class PullRequestSettings(EmbeddedModelObject):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(PullRequestSettings, cls).get_mapping_from_provider(org_id, data)
 
         mapping.update(
             {
@@ -113,7 +113,7 @@ class PullRequestSettings(EmbeddedModelObject):
         return mapping
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StatusCheckSettings(EmbeddedModelObject):
     do_not_enforce_on_create: bool
     strict: bool
@@ -134,7 +134,7 @@ class StatusCheckSettings(EmbeddedModelObject):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(StatusCheckSettings, cls).get_mapping_from_provider(org_id, data)
 
         def transform_status_check(status_check):
             if "app_slug" in status_check:
@@ -156,7 +156,7 @@ class StatusCheckSettings(EmbeddedModelObject):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(StatusCheckSettings, cls).get_mapping_from_provider(org_id, data)
 
         if "status_checks" in data:
 
@@ -208,7 +208,7 @@ class StatusCheckSettings(EmbeddedModelObject):
         return mapping
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MergeQueueSettings(EmbeddedModelObject):
     merge_method: str
     build_concurrency: int
@@ -256,7 +256,7 @@ class MergeQueueSettings(EmbeddedModelObject):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(MergeQueueSettings, cls).get_mapping_from_provider(org_id, data)
 
         mapping.update(
             {
@@ -277,7 +277,7 @@ class MergeQueueSettings(EmbeddedModelObject):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(MergeQueueSettings, cls).get_mapping_from_provider(org_id, data)
 
         mapping.update(
             {
@@ -306,7 +306,7 @@ class MergeQueueSettings(EmbeddedModelObject):
         return mapping
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Ruleset(ModelObject, abc.ABC):
     """
     Represents a Ruleset.
@@ -439,7 +439,7 @@ class Ruleset(ModelObject, abc.ABC):
 
     @classmethod
     def get_mapping_from_model(cls) -> dict[str, Any]:
-        mapping = super().get_mapping_from_model()
+        mapping = super(Ruleset, cls).get_mapping_from_model()
 
         mapping.update(
             {
@@ -465,7 +465,7 @@ class Ruleset(ModelObject, abc.ABC):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(Ruleset, cls).get_mapping_from_provider(org_id, data)
 
         mapping.update(
             {
@@ -33,7 +33,7 @@ if TYPE_CHECKING:
 ST = TypeVar("ST", bound="Secret")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Secret(ModelObject, abc.ABC):
     """
     Represents a Secret.
@@ -91,7 +91,7 @@ class Secret(ModelObject, abc.ABC):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(Secret, cls).get_mapping_from_provider(org_id, data)
         # the provider will never send the value itself, use a dummy secret.
         mapping["value"] = K("********")
         return mapping
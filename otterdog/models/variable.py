@@ -17,7 +17,7 @@ from otterdog.models import FailureType, ModelObject, ValidationContext
 VT = TypeVar("VT", bound="Variable")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Variable(ModelObject, abc.ABC):
     """
     Represents a Variable.
@@ -33,7 +33,7 @@ if TYPE_CHECKING:
 WT = TypeVar("WT", bound="Webhook")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Webhook(ModelObject, abc.ABC):
     """
     Represents a Webhook.
@@ -109,7 +109,7 @@ class Webhook(ModelObject, abc.ABC):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(Webhook, cls).get_mapping_from_provider(org_id, data)
         mapping.update(
             {
                 "url": OptionalS("config", "url", default=UNSET),
@@ -124,7 +124,7 @@ class Webhook(ModelObject, abc.ABC):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = await super().get_mapping_to_provider(org_id, data, provider)
+        mapping = await super(Webhook, cls).get_mapping_to_provider(org_id, data, provider)
 
         config_mapping = {}
         for config_prop in ["url", "content_type", "insecure_ssl", "secret"]:
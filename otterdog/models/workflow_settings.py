@@ -27,7 +27,7 @@ if TYPE_CHECKING:
     from otterdog.providers.github import GitHubProvider
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WorkflowSettings(ModelObject, abc.ABC):
     """
     Represents workflow settings on organizational / repository level.
@@ -109,7 +109,7 @@ class WorkflowSettings(ModelObject, abc.ABC):
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = super().get_mapping_from_provider(org_id, data)
+        mapping = super(WorkflowSettings, cls).get_mapping_from_provider(org_id, data)
         mapping.update(
             {
                 "allow_github_owned_actions": OptionalS("github_owned_allowed", default=None),
@@ -126,7 +126,7 @@ class WorkflowSettings(ModelObject, abc.ABC):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        mapping = await super().get_mapping_to_provider(org_id, data, provider)
+        mapping = await super(WorkflowSettings, cls).get_mapping_to_provider(org_id, data, provider)
 
         if "allow_github_owned_actions" in data:
             mapping.pop("allow_github_owned_actions")
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -58,6 +59,14 @@ class Operation(ABC):
     def post_execute(self) -> None:
         return
 
+    def supports_parallel_execution(self) -> bool:
+        """Indicates whether the operation can be executed for multiple organizations in parallel"""
+        return False
+
+    def clone(self) -> Operation:
+        """Returns a copy of this operation that can be executed concurrently with other copies"""
+        return copy.copy(self)
+
     async def check_config_file_exists(self, file_name: str) -> bool:
         from aiofiles import ospath
 
@@ -8,14 +8,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from otterdog.models import LivePatch, LivePatchType
+from otterdog.snapshot import SnapshotStore
 from otterdog.utils import Change, IndentingPrinter, get_approval, style
 
 from .plan import PlanOperation
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any
 
     from otterdog.config import OrganizationConfig, OtterdogConfig
@@ -36,12 +39,14 @@ class ApplyOperation(PlanOperation):
         delete_resources: bool,
         resolve_secrets: bool = True,
         include_resources_with_secrets: bool = True,
+        apply_concurrency: int = 10,
     ):
         super().__init__(no_web_ui, repo_filter, update_webhooks, update_secrets, update_filter)
         self._force_processing = force_processing
         self._delete_resources = delete_resources
         self._resolve_secrets = resolve_secrets
         self._include_resources_with_secrets = include_resources_with_secrets
+        self._apply_concurrency = apply_concurrency
 
     def init(self, config: OtterdogConfig, printer: IndentingPrinter) -> None:
         super().init(config, printer)
@@ -50,6 +55,10 @@ class ApplyOperation(PlanOperation):
         self.printer.println("Applying changes:")
         self.print_legend()
 
+    def supports_parallel_execution(self) -> bool:
+        # interactive approvals can not be requested while processing organizations in parallel
+        return self._force_processing
+
     def include_resources_with_secrets(self) -> bool:
         return self._include_resources_with_secrets
 
@@ -119,20 +128,14 @@ class ApplyOperation(PlanOperation):
         # apply patches
         import click
 
-        errors = 0
-
         self.printer.println("\nApplying changes:\n")
-        with click.progressbar(patches, file=self.printer.writer) as bar:
-            for patch in bar:
-                if patch.patch_type == LivePatchType.REMOVE and not self._delete_resources:
-                    continue
-                else:
-                    try:
-                        await patch.apply(org_id, self.gh_client)
-                    except RuntimeError as ex:
-                        errors += 1
-                        self.printer.println()
-                        self.printer.print_error(f"failed to apply patch: {patch!r}\n{ex}")
+        with click.progressbar(length=len(patches), file=self.printer.writer) as bar:
+            errors = await self.apply_patches(org_id, patches, bar.update)
+
+        # applied changes are not necessarily reflected in the timestamps of repositories,
+        # discard any snapshot of the organization so that it is fully loaded next time.
+        snapshot_store = self.snapshot_store if self.snapshot_store is not None else SnapshotStore()
+        snapshot_store.invalidate(org_id)
 
         delete_snippet = "deleted" if self._delete_resources else "live resources ignored"
 
@@ -146,6 +149,82 @@ class ApplyOperation(PlanOperation):
 
         return errors
 
+    async def apply_patches(
+        self, org_id: str, patches: list[LivePatch], progress_callback: Callable[[int], None] | None = None
+    ) -> int:
+        """
+        Applies the given patches and returns the number of patches that failed to apply.
+
+        Patches to settings of the organization itself and to objects that repositories depend on,
+        e.g. custom properties, are applied first and sequentially. Patches of different top-level objects,
+        e.g. repositories, are applied concurrently, whereas patches of objects sharing the same parent are
+        applied in the order they have been generated, after the patch of their parent object.
+        """
+
+        errors = 0
+        org_patches = [patch for patch in patches if _is_org_settings_patch(patch)]
+        other_patches = [patch for patch in patches if not _is_org_settings_patch(patch)]
+
+        for patch in org_patches:
+            errors += await self._apply_patch(org_id, patch, progress_callback)
+
+        # patches are generated depth-first, so any parent patch precedes the patches of its children
+        patches_by_object: dict[int, LivePatch] = {}
+        for patch in other_patches:
+            for model_object in (patch.expected_object, patch.current_object):
+                if model_object is not None:
+                    patches_by_object.setdefault(id(model_object), patch)
+
+        sem = asyncio.Semaphore(self._apply_concurrency)
+
+        async def apply_after(patch: LivePatch, preceding_tasks: list[asyncio.Task[int]]) -> int:
+            if len(preceding_tasks) > 0:
+                # patches are applied even if a preceding patch failed, errors are reported per patch
+                await asyncio.wait(preceding_tasks)
+
+            async with sem:
+                return await self._apply_patch(org_id, patch, progress_callback)
+
+        tasks: dict[int, asyncio.Task[int]] = {}
+        # the task of the last patch per parent object, siblings might depend on each other,
+        # e.g. a branch protection rule requiring an environment created before
+        last_sibling_tasks: dict[int, asyncio.Task[int]] = {}
+        for patch in other_patches:
+            preceding_tasks = []
+            if patch.parent_object is not None:
+                parent_patch = patches_by_object.get(id(patch.parent_object))
+                if parent_patch is not None:
+                    preceding_tasks.append(tasks[id(parent_patch)])
+
+                sibling_task = last_sibling_tasks.get(id(patch.parent_object))
+                if sibling_task is not None:
+                    preceding_tasks.append(sibling_task)
+
+            task = asyncio.create_task(apply_after(patch, preceding_tasks))
+            tasks[id(patch)] = task
+            if patch.parent_object is not None:
+                last_sibling_tasks[id(patch.parent_object)] = task
+
+        errors += sum(await asyncio.gather(*tasks.values()))
+        return errors
+
+    async def _apply_patch(
+        self, org_id: str, patch: LivePatch, progress_callback: Callable[[int], None] | None = None
+    ) -> int:
+        try:
+            if patch.patch_type == LivePatchType.REMOVE and not self._delete_resources:
+                return 0
+
+            await patch.apply(org_id, self.gh_client)
+            return 0
+        except RuntimeError as ex:
+            self.printer.println()
+            self.printer.print_error(f"failed to apply patch: {patch!r}\n{ex}")
+            return 1
+        finally:
+            if progress_callback is not None:
+                progress_callback(1)
+
     def execute_custom_hook_if_present(
         self, org_config: OrganizationConfig, model_object: ModelObject, filename: str
     ) -> None:
@@ -155,3 +234,20 @@ class ApplyOperation(PlanOperation):
         if os.path.exists(hook_script):
             with open(hook_script) as file:
                 exec(file.read())
+
+
+def _is_org_settings_patch(patch: LivePatch) -> bool:
+    """
+    Indicates whether the patch targets settings of the organization itself, e.g. its workflow settings
+    or custom properties.
+    """
+    model_object = patch.expected_object if patch.expected_object is not None else patch.current_object
+    assert model_object is not None
+
+    if model_object.apply_live_patch_before_repositories():
+        return True
+
+    if model_object.is_keyed():
+        return False
+
+    return patch.parent_object is None or not patch.parent_object.is_keyed()
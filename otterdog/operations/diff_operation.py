@@ -9,7 +9,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, cast
 
 import aiofiles.ospath
 
@@ -26,7 +26,8 @@ if TYPE_CHECKING:
 
     from otterdog.config import OrganizationConfig, OtterdogConfig
     from otterdog.jsonnet import JsonnetConfig
-    from otterdog.models import ModelObject
+    from otterdog.models import LivePatchHandler, ModelObject
+    from otterdog.snapshot import SnapshotStore
 
 
 class DiffStatus:
@@ -68,6 +69,7 @@ class DiffOperation(Operation):
         self._org_config: OrganizationConfig | None = None
         self._callback: CallbackFn | None = None
         self._concurrency: int | None = None
+        self._snapshot_store: SnapshotStore | None = None
 
     @property
     def template_dir(self) -> str:
@@ -87,6 +89,14 @@ class DiffOperation(Operation):
     def concurrency(self, value: int) -> None:
         self._concurrency = value
 
+    @property
+    def snapshot_store(self) -> SnapshotStore | None:
+        return self._snapshot_store
+
+    @snapshot_store.setter
+    def snapshot_store(self, value: SnapshotStore) -> None:
+        self._snapshot_store = value
+
     def set_callback(self, fn: CallbackFn) -> None:
         self._callback = fn
 
@@ -94,6 +104,14 @@ class DiffOperation(Operation):
         super().init(config, printer)
         self._validator.init(config, printer)
 
+    def supports_parallel_execution(self) -> bool:
+        return True
+
+    def clone(self) -> DiffOperation:
+        operation = cast(DiffOperation, super().clone())
+        operation._validator = ValidateOperation()
+        return operation
+
     async def execute(
         self,
         org_config: OrganizationConfig,
@@ -156,7 +174,7 @@ class DiffOperation(Operation):
             return 1
 
         try:
-            expected_org = self.load_expected_org(github_id, org_file_name)
+            expected_org = await self.load_expected_org(github_id, org_file_name)
         except RuntimeError as e:
             self.printer.print_error(f"failed to load configuration\n{e!s}")
             return 1
@@ -178,14 +196,6 @@ class DiffOperation(Operation):
                 f"enable verbose output with '-v' to to display them."
             )
 
-        try:
-            current_org = await self.load_current_org(github_id, jsonnet_config)
-        except RuntimeError as e:
-            self.printer.print_error(f"failed to load current configuration\n{e!s}")
-            return 1
-
-        expected_org, current_org = self.preprocess_orgs(expected_org, current_org)
-
         diff_status = DiffStatus()
         live_patches = []
 
@@ -219,16 +229,11 @@ class DiffOperation(Operation):
                         patch.parent_object,
                     )
 
-        context = LivePatchContext(
-            github_id,
-            self.repo_filter,
-            self.update_webhooks,
-            self.update_secrets,
-            self.update_filter,
-            current_org.settings if self.coerce_current_org() else None,
-            expected_org.settings,
-        )
-        expected_org.generate_live_patch(current_org, context, handle)
+        try:
+            context = await self.generate_live_patches(github_id, jsonnet_config, expected_org, handle)
+        except RuntimeError as e:
+            self.printer.print_error(f"failed to load current configuration\n{e!s}")
+            return 1
 
         # add a warning that otterdog potentially must be run a second time
         # to fully apply all settings.
@@ -257,15 +262,67 @@ class DiffOperation(Operation):
 
         return status
 
-    def load_expected_org(self, github_id: str, org_file_name: str) -> GitHubOrganization:
-        return GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
+    async def load_expected_org(self, github_id: str, org_file_name: str) -> GitHubOrganization:
+        return await GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
+
+    async def generate_live_patches(
+        self,
+        github_id: str,
+        jsonnet_config: JsonnetConfig,
+        expected_org: GitHubOrganization,
+        handler: LivePatchHandler,
+    ) -> LivePatchContext:
+        def create_context(current_org: GitHubOrganization) -> LivePatchContext:
+            return LivePatchContext(
+                github_id,
+                self.repo_filter,
+                self.update_webhooks,
+                self.update_secrets,
+                self.update_filter,
+                current_org.settings if self.coerce_current_org() else None,
+                expected_org.settings,
+            )
+
+        if self.stream_current_org():
+            # patches are generated while the current organization is still being retrieved
+            return await expected_org.generate_live_patch_from_provider(
+                jsonnet_config,
+                self.gh_client,
+                create_context,
+                handler,
+                self.no_web_ui,
+                self.printer,
+                self.concurrency,
+                self.snapshot_store,
+            )
+
+        current_org = await self.load_current_org(github_id, jsonnet_config)
+        expected_org, current_org = self.preprocess_orgs(expected_org, current_org)
+
+        context = create_context(current_org)
+        expected_org.generate_live_patch(current_org, context, handler)
+        return context
+
+    def stream_current_org(self) -> bool:
+        """
+        Indicates whether the current organization is retrieved from GitHub and patches are generated
+        while it is being retrieved, operations that override load_current_org or preprocess_orgs need to
+        return False.
+        """
+        return True
 
     def coerce_current_org(self) -> bool:
         return False
 
     async def load_current_org(self, github_id: str, jsonnet_config: JsonnetConfig) -> GitHubOrganization:
         return await GitHubOrganization.load_from_provider(
-            github_id, jsonnet_config, self.gh_client, self.no_web_ui, self.printer, self.concurrency
+            github_id,
+            jsonnet_config,
+            self.gh_client,
+            self.no_web_ui,
+            self.printer,
+            self.concurrency,
+            self.snapshot_store,
         )
 
     def preprocess_orgs(
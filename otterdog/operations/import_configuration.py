@@ -97,7 +97,7 @@ class ImportOperation(Operation):
 
             # copy secrets from existing configuration if it is present.
             if sync_from_previous_config:
-                previous_organization = GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
+                previous_organization = await GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
 
                 self.printer.println("Copying secrets from previous configuration.")
                 organization.copy_secrets(previous_organization)
@@ -108,12 +108,16 @@ class ImportOperation(Operation):
                     if org_webhook.url.endswith("*"):
                         masked_urls += _mask_webhook_url(organization.webhooks, org_webhook)
 
+                # webhooks are indexed by their url, re-index them after masking
+                organization.set_webhooks(organization.webhooks)
+
                 for repo in previous_organization.repositories:
                     for repo_webhook in repo.webhooks:
                         if repo_webhook.url.endswith("*"):
                             new_repo = organization.get_repository(repo.name)
                             if new_repo is not None:
                                 masked_urls += _mask_webhook_url(new_repo.webhooks, repo_webhook)
+                                new_repo.set_webhooks(new_repo.webhooks)
 
                 self.printer.println(f"{masked_urls} URLs have been masked.")
 
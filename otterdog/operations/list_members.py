@@ -66,7 +66,7 @@ class ListMembersOperation(Operation):
                 return 1
 
             try:
-                organization = GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
+                organization = await GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
             except RuntimeError as ex:
                 self.printer.print_error(f"failed to load configuration: {ex!s}")
                 return 1
@@ -78,10 +78,10 @@ class ListMembersOperation(Operation):
                 return 1
 
             async with GitHubProvider(credentials) as provider:
-                members = await provider.rest_api.org.list_members(github_id, self.two_factor_disabled)
+                num_members = await self._count_members(provider, github_id, self.two_factor_disabled)
 
                 if self.two_factor_disabled is True:
-                    all_members = await provider.rest_api.org.list_members(github_id, False)
+                    num_all_members = await self._count_members(provider, github_id, False)
                     two_factor_status = (
                         style("enabled", fg="green")
                         if organization.settings.two_factor_requirement is True
@@ -89,18 +89,25 @@ class ListMembersOperation(Operation):
                     )
 
                     member_status = (
-                        style(str(len(members)), fg="green")
-                        if len(members) == 0
-                        else style(str(len(members)), fg="red")
+                        style(str(num_members), fg="green") if num_members == 0 else style(str(num_members), fg="red")
                     )
 
                     self.printer.println(
-                        f"Found {member_status} / {len(all_members)} members with 2FA disabled. "
+                        f"Found {member_status} / {num_all_members} members with 2FA disabled. "
                         f"Organization has 2FA '{two_factor_status}'"
                     )
                 else:
-                    self.printer.println(f"Found {len(members)} members.")
+                    self.printer.println(f"Found {num_members} members.")
 
             return 0
         finally:
             self.printer.level_down()
+
+    @staticmethod
+    async def _count_members(provider: GitHubProvider, github_id: str, two_factor_disabled: bool) -> int:
+        # members are streamed page by page, they do not need to be kept in memory
+        count = 0
+        async for _ in provider.rest_api.org.stream_members(github_id, two_factor_disabled):
+            count += 1
+
+        return count
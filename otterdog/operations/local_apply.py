@@ -33,6 +33,7 @@ class LocalApplyOperation(ApplyOperation):
         delete_resources: bool,
         resolve_secrets: bool = True,
         include_resources_with_secrets: bool = True,
+        apply_concurrency: int = 10,
     ) -> None:
         super().__init__(
             force_processing=force_processing,
@@ -44,6 +45,7 @@ class LocalApplyOperation(ApplyOperation):
             delete_resources=delete_resources,
             resolve_secrets=resolve_secrets,
             include_resources_with_secrets=include_resources_with_secrets,
+            apply_concurrency=apply_concurrency,
         )
 
         self._suffix = suffix
@@ -65,6 +67,9 @@ class LocalApplyOperation(ApplyOperation):
     def verbose_output(self):
         return False
 
+    def stream_current_org(self) -> bool:
+        return False
+
     def coerce_current_org(self) -> bool:
         return True
 
@@ -74,4 +79,4 @@ class LocalApplyOperation(ApplyOperation):
         if not await ospath.exists(other_org_file_name):
             raise RuntimeError(f"configuration file '{other_org_file_name}' does not exist")
 
-        return GitHubOrganization.load_from_file(github_id, other_org_file_name, self.config)
+        return await GitHubOrganization.load_from_file(github_id, other_org_file_name, self.config)
@@ -60,6 +60,9 @@ class LocalPlanOperation(PlanOperation):
     def setup_github_client(self, org_config: OrganizationConfig) -> GitHubProvider:
         return GitHubProvider(None)
 
+    def stream_current_org(self) -> bool:
+        return False
+
     def coerce_current_org(self) -> bool:
         return True
 
@@ -69,7 +72,7 @@ class LocalPlanOperation(PlanOperation):
         if not await ospath.exists(other_org_file_name):
             raise RuntimeError(f"configuration file '{other_org_file_name}' does not exist")
 
-        return GitHubOrganization.load_from_file(github_id, other_org_file_name, self.config)
+        return await GitHubOrganization.load_from_file(github_id, other_org_file_name, self.config)
 
     def preprocess_orgs(
         self, expected_org: GitHubOrganization, current_org: GitHubOrganization
@@ -58,7 +58,7 @@ class SyncTemplateOperation(Operation):
                 return 1
 
             try:
-                organization = GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
+                organization = await GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
             except RuntimeError as ex:
                 self.printer.print_error(f"failed to load configuration: {ex!s}")
                 return 1
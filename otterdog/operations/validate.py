@@ -31,6 +31,9 @@ class ValidateOperation(Operation):
     def pre_execute(self) -> None:
         self.printer.println("Validating organization configurations:")
 
+    def supports_parallel_execution(self) -> bool:
+        return True
+
     async def execute(
         self,
         org_config: OrganizationConfig,
@@ -53,7 +56,7 @@ class ValidateOperation(Operation):
                 return 1
 
             try:
-                organization = GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
+                organization = await GitHubOrganization.load_from_file(github_id, org_file_name, self.config)
             except RuntimeError as ex:
                 self.printer.print_error(f"Validation failed\nfailed to load configuration: {ex!s}")
                 return 1
@@ -19,9 +19,11 @@ from otterdog import resources
 from otterdog.utils import is_ghsa_repo, is_set_and_present, print_trace, print_warn
 
 if TYPE_CHECKING:
+    from datetime import datetime
     from typing import Any
 
     from otterdog.credentials import Credentials
+    from otterdog.providers.github.rate_limit import RateLimiter
 
 
 _ORG_SETTINGS_SCHEMA = json.loads(files(resources).joinpath("schemas/settings.json").read_text())
@@ -67,9 +69,17 @@ class GitHubProvider:
         from .rest import RestApi
         from .web import WebClient
 
-        self.rest_api = RestApi(token_auth(self._credentials.github_token), get_github_cache())
+        auth_strategy = token_auth(self._credentials.github_token, self._credentials.github_token_identity)
+
+        # both clients use the rate limiter shared by all clients using the same token,
+        # as secondary rate limits apply to all requests made with the same token
+        self.rest_api = RestApi(auth_strategy, get_github_cache())
         self.web_client = WebClient(self._credentials)
-        self.graphql_client = GraphQLClient(token_auth(self._credentials.github_token), get_github_cache())
+        self.graphql_client = GraphQLClient(auth_strategy, get_github_cache())
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self.rest_api.requester.rate_limiter
 
     async def get_content(self, org_id: str, repo_name: str, path: str, ref: str | None = None) -> str:
         return await self.rest_api.content.get_content(org_id, repo_name, path, ref)
@@ -177,6 +187,28 @@ class GitHubProvider:
         # they should not be part of the visible configuration
         return list(filter(lambda name: not is_ghsa_repo(name), await self.rest_api.org.get_repos(org_id)))
 
+    async def get_repos_data(self, org_id: str) -> dict[str, dict[str, Any]]:
+        # the org listing via the rest api does not contain all repo settings, e.g. merge settings,
+        # retrieve them in bulk via the graphql api and merge them with the listing.
+        repos_data = {
+            repo["name"]: repo
+            for repo in await self.rest_api.org.get_repos_data(org_id)
+            if not is_ghsa_repo(repo["name"])
+        }
+
+        for repo in await self.graphql_client.get_repositories(org_id):
+            repo_data = repos_data.get(repo["name"])
+            if repo_data is not None:
+                repo_data.update(repo)
+
+        return repos_data
+
+    async def complete_repo_data(self, org_id: str, repo_name: str, repo_data: dict[str, Any]) -> dict[str, Any]:
+        return await self.rest_api.repo.complete_repo_data(org_id, repo_name, repo_data)
+
+    async def get_repos_with_audit_events(self, org_id: str, since: datetime) -> set[str]:
+        return await self.rest_api.org.get_repos_with_audit_events(org_id, since)
+
     async def get_repo_data(self, org_id: str, repo_name: str) -> dict[str, Any]:
         return await self.rest_api.repo.get_repo_data(org_id, repo_name)
 
@@ -213,6 +245,11 @@ class GitHubProvider:
     async def get_branch_protection_rules(self, org_id: str, repo: str) -> list[dict[str, Any]]:
         return await self.graphql_client.get_branch_protection_rules(org_id, repo)
 
+    async def get_branch_protection_rules_for_repos(
+        self, org_id: str, repos: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        return await self.graphql_client.get_branch_protection_rules_for_repos(org_id, repos)
+
     async def update_branch_protection_rule(
         self,
         org_id: str,
@@ -20,6 +20,11 @@ class AuthImpl:
     @abstractmethod
     def update_headers_with_authorization(self, headers: MutableMapping[str, Any]) -> None: ...
 
+    @property
+    @abstractmethod
+    def identity(self) -> str:
+        """Returns an identity of the authenticated principal that stays the same when credentials are renewed."""
+
 
 class AuthStrategy(ABC):
     @abstractmethod
@@ -32,7 +37,7 @@ def app_auth(app_id: str, private_key: str) -> AuthStrategy:
     return AppAuthStrategy(app_id, private_key)
 
 
-def token_auth(github_token: str) -> AuthStrategy:
+def token_auth(github_token: str, identity: str | None = None) -> AuthStrategy:
     from .token import TokenAuthStrategy
 
-    return TokenAuthStrategy(github_token)
+    return TokenAuthStrategy(github_token, identity)
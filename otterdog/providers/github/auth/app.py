@@ -79,3 +79,7 @@ class _AppAuth(AuthImpl):
 
     def update_headers_with_authorization(self, headers: MutableMapping[str, Any]) -> None:
         headers["Authorization"] = f"Bearer {self.get_jwt()}"
+
+    @property
+    def identity(self) -> str:
+        return f"app:{self.app_id}"
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -22,17 +23,21 @@ if TYPE_CHECKING:
 class TokenAuthStrategy(AuthStrategy):
     """
     An AuthStrategy using classic PATs.
+
+    Tokens that are renewed regularly, e.g. installation tokens, should specify a stable identity.
     """
 
     token: str
+    token_identity: str | None = None
 
     def get_auth(self) -> AuthImpl:
-        return _TokenAuth(self.token)
+        return _TokenAuth(self.token, self.token_identity)
 
 
 @dataclass(frozen=True)
 class _TokenAuth(AuthImpl):
     token: str
+    token_identity: str | None = None
 
     def __call__(self, r):
         self.update_headers_with_authorization(r.headers)
@@ -40,3 +45,11 @@ class _TokenAuth(AuthImpl):
 
     def update_headers_with_authorization(self, headers: MutableMapping[str, Any]) -> None:
         headers["Authorization"] = f"Bearer {self.token}"
+
+    @property
+    def identity(self) -> str:
+        if self.token_identity is not None:
+            return self.token_identity
+
+        # only a hash of the token is exposed
+        return "token:" + hashlib.sha256(self.token.encode("utf-8")).hexdigest()
@@ -40,7 +40,7 @@ class _FileCache(CacheStrategy):
         return False
 
     def get_request_parameters(self) -> dict[str, Any]:
-        return {"refresh": True}
+        return {}
 
     def __str__(self):
         return f"file-cache('{self._cache_dir}')"
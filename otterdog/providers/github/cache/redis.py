@@ -37,7 +37,7 @@ class _RedisCache(CacheStrategy):
         return False
 
     def get_request_parameters(self) -> dict[str, Any]:
-        return {"refresh": True}
+        return {}
 
     def __str__(self):
         return f"redis-cache('{self._redis_uri}')"
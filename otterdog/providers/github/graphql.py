@@ -8,13 +8,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from functools import cache
 from typing import TYPE_CHECKING
 
-from aiohttp.client import ClientSession, ClientTimeout, TCPConnector
 from aiohttp_retry import ExponentialRetry, RetryClient
 
+from otterdog.providers.github.rate_limit import RateLimiter, get_rate_limiter
+from otterdog.providers.github.session import get_shared_session
 from otterdog.providers.github.stats import RequestStatistics
 from otterdog.utils import is_trace_enabled, print_debug, print_trace, query_json
 
@@ -25,10 +27,34 @@ if TYPE_CHECKING:
     from otterdog.providers.github.cache import CacheStrategy
 
 
+# maximum number of retries for queries that hit a rate limit
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# number of repos whose branch protection rules are retrieved with a single query
+_BRANCH_PROTECTION_RULES_REPO_BATCH_SIZE = 10
+# number of allowance pages that are retrieved with a single query
+_ALLOWANCES_BATCH_SIZE = 20
+# number of comments that are minimized with a single mutation
+_MINIMIZE_COMMENTS_BATCH_SIZE = 50
+
+# maps the allowance connections of a branch protection rule to the keys used by the model
+_ALLOWANCE_KEYS = {
+    "pushAllowances": "pushRestrictions",
+    "reviewDismissalAllowances": "reviewDismissalAllowances",
+    "bypassPullRequestAllowances": "bypassPullRequestAllowances",
+    "bypassForcePushAllowances": "bypassForcePushAllowances",
+}
+
+
 class GraphQLClient:
     _GH_GRAPHQL_URL_ROOT = "api.github.com/graphql"
 
-    def __init__(self, auth_strategy: AuthStrategy, cache_strategy: CacheStrategy | None = None):
+    def __init__(
+        self,
+        auth_strategy: AuthStrategy,
+        cache_strategy: CacheStrategy | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
         self._auth = auth_strategy.get_auth()
 
         self._headers = {
@@ -36,6 +62,7 @@ class GraphQLClient:
         }
 
         self._statistics = RequestStatistics()
+        self._rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter(self._auth.identity)
 
         self._cache_strategy = cache_strategy
 
@@ -46,15 +73,7 @@ class GraphQLClient:
             self._base_url = f"https://{self._GH_GRAPHQL_URL_ROOT}"
             self._use_proxy = False
 
-        self._session = ClientSession(
-            timeout=ClientTimeout(connect=3, sock_connect=3),
-            connector=TCPConnector(limit=10),
-        )
-
-        self._client = RetryClient(
-            retry_options=ExponentialRetry(3, exceptions={Exception}),
-            client_session=self._session,
-        )
+        self._retry_options = ExponentialRetry(3, exceptions={Exception})
 
     async def __aenter__(self):
         return self
@@ -63,12 +82,27 @@ class GraphQLClient:
         await self.close()
 
     async def close(self) -> None:
-        await self._session.close()
+        # the underlying session is shared with other clients and stays open
+        pass
+
+    def _get_client(self) -> RetryClient:
+        return RetryClient(client_session=get_shared_session(), retry_options=self._retry_options)
 
     @property
     def statistics(self) -> RequestStatistics:
         return self._statistics
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
+
+    async def get_repositories(self, org_id: str) -> list[dict[str, Any]]:
+        print_debug(f"retrieving repositories for org '{org_id}'")
+
+        variables = {"organization": org_id}
+        repositories = await self._run_paged_query(variables, "get-repositories.gql", "data.organization.repositories")
+        return [self._transform_repository(x) for x in repositories]
+
     async def get_branch_protection_rule_id(self, org_id: str, repo_name: str, pattern: str) -> str:
         print_debug(f"getting branch protection rule id for pattern '{pattern}' at repo '{org_id}/{repo_name}'")
 
@@ -84,59 +118,179 @@ class GraphQLClient:
     async def get_branch_protection_rules(self, org_id: str, repo_name: str) -> list[dict[str, Any]]:
         print_debug(f"retrieving branch protection rules for repo '{org_id}/{repo_name}'")
 
+        branch_protection_rules = await self._get_paged_branch_protection_rules(org_id, repo_name)
+        await self._fill_allowances(branch_protection_rules)
+        return branch_protection_rules
+
+    async def get_branch_protection_rules_for_repos(
+        self, org_id: str, repo_names: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Retrieves the branch protection rules of multiple repos using a single query per batch of repos.
+        """
+
+        print_debug(f"retrieving branch protection rules for {len(repo_names)} repos of org '{org_id}'")
+
+        batches = [
+            repo_names[i : i + _BRANCH_PROTECTION_RULES_REPO_BATCH_SIZE]
+            for i in range(0, len(repo_names), _BRANCH_PROTECTION_RULES_REPO_BATCH_SIZE)
+        ]
+
+        result: dict[str, list[dict[str, Any]]] = {}
+        for batch_result in await asyncio.gather(
+            *[self._get_branch_protection_rules_batch(org_id, batch) for batch in batches]
+        ):
+            result.update(batch_result)
+
+        await self._fill_allowances([rule for rules in result.values() for rule in rules])
+        return result
+
+    async def _get_paged_branch_protection_rules(self, org_id: str, repo_name: str) -> list[dict[str, Any]]:
         variables = {"organization": org_id, "repository": repo_name}
-        branch_protection_rules = await self._run_paged_query(variables, "get-branch-protection-rules.gql")
+        return await self._run_paged_query(
+            variables,
+            "get-branch-protection-rules.gql",
+            fragment_files=("fragment-branch-protection-rule.gql", "fragment-actor.gql"),
+        )
 
-        for branch_protection_rule in branch_protection_rules:
-            await self._fill_paged_results_if_needed(
-                branch_protection_rule,
-                "pushAllowances",
-                "pushRestrictions",
-                "get-push-allowances.gql",
+    async def _get_branch_protection_rules_batch(
+        self, org_id: str, repo_names: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        # every repo is queried using a separate alias
+        parameters = ["$organization: String!"]
+        selections = []
+        variables: dict[str, Any] = {"organization": org_id}
+
+        for index, repo_name in enumerate(repo_names):
+            parameters.append(f"$repo{index}: String!")
+            selections.append(
+                f"  repo{index}: repository(owner: $organization, name: $repo{index}) {{\n"
+                "    branchProtectionRules(first: 100) {\n"
+                "      nodes {\n"
+                "        ...BranchProtectionRuleFields\n"
+                "      }\n"
+                "      pageInfo {\n"
+                "        hasNextPage\n"
+                "        endCursor\n"
+                "      }\n"
+                "    }\n"
+                "  }"
             )
+            variables[f"repo{index}"] = repo_name
+
+        query = (
+            f"query({', '.join(parameters)}) {{\n"
+            + "\n".join(selections)
+            + "\n}\n"
+            + _get_query_from_file("fragment-branch-protection-rule.gql")
+            + _get_query_from_file("fragment-actor.gql")
+        )
 
-            await self._fill_paged_results_if_needed(
-                branch_protection_rule,
-                "reviewDismissalAllowances",
-                "reviewDismissalAllowances",
-                "get-review-dismissal-allowances.gql",
-            )
+        _, body = await self._request_raw("POST", query, variables)
+        json_data = json.loads(body)
+        if json_data.get("data") is None:
+            raise RuntimeError(f"failed retrieving branch protection rules for org '{org_id}': {body}")
 
-            await self._fill_paged_results_if_needed(
-                branch_protection_rule,
-                "bypassPullRequestAllowances",
-                "bypassPullRequestAllowances",
-                "get-bypass-pull-request-allowances.gql",
-            )
+        result = {}
+        for index, repo_name in enumerate(repo_names):
+            rules_data = query_json(f"repo{index}.branchProtectionRules", json_data["data"])
+
+            # fall back to a dedicated paged query for repos that could not be resolved
+            # or that have more rules than fit into a single page.
+            if rules_data is None or rules_data["pageInfo"]["hasNextPage"] is True:
+                result[repo_name] = await self._get_paged_branch_protection_rules(org_id, repo_name)
+            else:
+                result[repo_name] = rules_data["nodes"]
+
+        return result
 
-            await self._fill_paged_results_if_needed(
-                branch_protection_rule,
-                "bypassForcePushAllowances",
-                "bypassForcePushAllowances",
-                "get-bypass-force-push-allowances.gql",
+    async def _fill_allowances(self, branch_protection_rules: list[dict[str, Any]]) -> None:
+        """
+        Transforms the allowances of the given branch protection rules into lists of actors.
+
+        Allowances that do not fit into a single page are retrieved for all rules
+        at once using batched queries until all pages have been processed.
+        """
+
+        pending_allowances: list[tuple[dict[str, Any], str, str, str]] = []
+
+        for branch_protection_rule in branch_protection_rules:
+            for input_key, output_key in _ALLOWANCE_KEYS.items():
+                value = branch_protection_rule.pop(input_key)
+                branch_protection_rule[output_key] = self._transform_actors(value["nodes"])
+
+                if bool(query_json("pageInfo.hasNextPage", value) or False) is True:
+                    end_cursor = value["pageInfo"]["endCursor"]
+                    pending_allowances.append((branch_protection_rule, input_key, output_key, end_cursor))
+
+        while len(pending_allowances) > 0:
+            batches = [
+                pending_allowances[i : i + _ALLOWANCES_BATCH_SIZE]
+                for i in range(0, len(pending_allowances), _ALLOWANCES_BATCH_SIZE)
+            ]
+
+            pending_allowances = []
+            for remaining in await asyncio.gather(*[self._fill_allowances_batch(batch) for batch in batches]):
+                pending_allowances.extend(remaining)
+
+    async def _fill_allowances_batch(
+        self, batch: list[tuple[dict[str, Any], str, str, str]]
+    ) -> list[tuple[dict[str, Any], str, str, str]]:
+        # every allowance connection needs its own cursor, thus each rule is queried using a separate alias
+        parameters = []
+        selections = []
+        variables: dict[str, Any] = {}
+
+        for index, (branch_protection_rule, input_key, _, end_cursor) in enumerate(batch):
+            parameters.append(f"$id{index}: ID!, $cursor{index}: String")
+            selections.append(
+                f"  rule{index}: node(id: $id{index}) {{\n"
+                "    ... on BranchProtectionRule {\n"
+                f"      {input_key}(first: 100, after: $cursor{index}) {{\n"
+                "        nodes {\n"
+                "          actor {\n"
+                "            __typename\n"
+                "            ...AppActor\n"
+                "            ...TeamActor\n"
+                "            ...UserActor\n"
+                "          }\n"
+                "        }\n"
+                "        pageInfo {\n"
+                "          hasNextPage\n"
+                "          endCursor\n"
+                "        }\n"
+                "      }\n"
+                "    }\n"
+                "  }"
             )
+            variables[f"id{index}"] = branch_protection_rule["id"]
+            variables[f"cursor{index}"] = end_cursor
+
+        query = (
+            f"query({', '.join(parameters)}) {{\n"
+            + "\n".join(selections)
+            + "\n}\n"
+            + _get_query_from_file("fragment-actor.gql")
+        )
 
-        return branch_protection_rules
+        _, body = await self._request_raw("POST", query, variables)
+        json_data = json.loads(body)
+        if json_data.get("data") is None:
+            raise RuntimeError(f"failed retrieving allowances of branch protection rules: {body}")
 
-    async def _fill_paged_results_if_needed(
-        self,
-        branch_protection_rule: dict[str, Any],
-        input_key: str,
-        output_key: str,
-        query_file: str,
-    ):
-        value = branch_protection_rule.pop(input_key)
+        remaining = []
+        for index, (branch_protection_rule, input_key, output_key, _) in enumerate(batch):
+            value = query_json(f"rule{index}.{input_key}", json_data["data"])
+            if value is None:
+                raise RuntimeError(f"failed retrieving {input_key} of branch protection rule: {body}")
 
-        nodes = value["nodes"]
-        all_actors = self._transform_actors(nodes)
-        has_more = bool(query_json("pageInfo.hasNextPage", value) or False)
+            branch_protection_rule[output_key].extend(self._transform_actors(value["nodes"]))
 
-        if has_more is True:
-            variables = {"branchProtectionRuleId": branch_protection_rule["id"]}
-            more_actors = await self._run_paged_query(variables, query_file, f"data.node.{input_key}")
-            all_actors.extend(self._transform_actors(more_actors))
+            page_info = value["pageInfo"]
+            if page_info["hasNextPage"] is True:
+                remaining.append((branch_protection_rule, input_key, output_key, page_info["endCursor"]))
 
-        branch_protection_rule[output_key] = all_actors
+        return remaining
 
     async def update_branch_protection_rule(
         self,
@@ -175,9 +329,7 @@ class GraphQLClient:
         self, org_id: str, repo_name: str, repo_node_id: str, data: dict[str, Any]
     ) -> None:
         rule_pattern = data["pattern"]
-        print_debug(
-            f"creating branch_protection_rule with pattern '{rule_pattern}' " f"for repo '{org_id}/{repo_name}'"
-        )
+        print_debug(f"creating branch_protection_rule with pattern '{rule_pattern}' for repo '{org_id}/{repo_name}'")
 
         data["repositoryId"] = repo_node_id
         variables = {"ruleInput": data}
@@ -232,21 +384,33 @@ class GraphQLClient:
         return issue_comments
 
     async def minimize_comment(self, comment_id: str, classifier: str) -> None:
-        print_debug("minimizing comment")
+        await self.minimize_comments([comment_id], classifier)
 
-        variables = {"input": {"subjectId": comment_id, "classifier": classifier}}
+    async def minimize_comments(self, comment_ids: list[str], classifier: str) -> None:
+        print_debug(f"minimizing {len(comment_ids)} comment(s)")
 
-        query = """mutation($input: MinimizeCommentInput!) {
-           minimizeComment(input: $input) {
-             clientMutationId
-           }
-        }"""
+        for batch_start in range(0, len(comment_ids), _MINIMIZE_COMMENTS_BATCH_SIZE):
+            batch = comment_ids[batch_start : batch_start + _MINIMIZE_COMMENTS_BATCH_SIZE]
 
-        status, body = await self._request_raw("POST", query, variables)
-        if status >= 400:
-            raise RuntimeError(f"failed minimizing comment: {body}")
+            # every comment is minimized using a separate alias
+            parameters = []
+            selections = []
+            variables: dict[str, Any] = {}
 
-        print_debug("successfully minimized comment")
+            for index, comment_id in enumerate(batch):
+                parameters.append(f"$input{index}: MinimizeCommentInput!")
+                selections.append(
+                    f"  comment{index}: minimizeComment(input: $input{index}) {{\n    clientMutationId\n  }}"
+                )
+                variables[f"input{index}"] = {"subjectId": comment_id, "classifier": classifier}
+
+            query = f"mutation({', '.join(parameters)}) {{\n" + "\n".join(selections) + "\n}\n"
+
+            status, body = await self._request_raw("POST", query, variables)
+            if status >= 400 or "errors" in json.loads(body):
+                raise RuntimeError(f"failed minimizing comments: {body}")
+
+        print_debug(f"successfully minimized {len(comment_ids)} comment(s)")
 
     async def get_team_membership(self, org_id: str, user_login: str) -> list[dict[str, Any]]:
         print_debug(f"retrieving team membership for user '{user_login}' in org '{org_id}'")
@@ -259,10 +423,11 @@ class GraphQLClient:
         input_variables: dict[str, Any],
         query_file: str,
         prefix_selector: str = "data.repository.branchProtectionRules",
+        fragment_files: tuple[str, ...] = (),
     ) -> list[dict[str, Any]]:
         print_debug(f"running graphql query '{query_file}' with input '{json.dumps(input_variables)}'")
 
-        query = _get_query_from_file(query_file)
+        query = _get_query_from_file(query_file) + "".join(map(_get_query_from_file, fragment_files))
 
         finished = False
         end_cursor = None
@@ -304,29 +469,90 @@ class GraphQLClient:
         else:
             kwargs = {}
 
-        async with self._client.request(
-            method,
-            url=self._base_url,
-            headers=headers,
-            json={"query": query, "variables": variables},
-            **kwargs,
-        ) as response:
-            self._statistics.sent_request()
+        retries = 0
+        while True:
+            async with (
+                self._rate_limiter.throttle() as throttled_request,
+                self._get_client().request(
+                    method,
+                    url=self._base_url,
+                    headers=headers,
+                    json={"query": query, "variables": variables},
+                    **kwargs,
+                ) as response,
+            ):
+                self._statistics.sent_request()
+
+                text = await response.text()
+                status = response.status
+
+                self._statistics.update_remaining_rate_limit(int(response.headers.get("x-ratelimit-remaining", -1)))
+                rate_limited = _is_rate_limited(status, text)
+                throttled_request.update(status, response.headers, text, rate_limited)
 
-            text = await response.text()
-            status = response.status
-
-            if status == 403 or status == 429:
+            if is_trace_enabled():
                 print_trace(f"graphql '{method}' result = ({status}, {text})")
-                raise RuntimeError("failed running graphql query, hitting rate limit")
 
-            self._statistics.update_remaining_rate_limit(int(response.headers.get("x-ratelimit-remaining", -1)))
+            if throttled_request.retry and retries < _MAX_RATE_LIMIT_RETRIES:
+                retries += 1
+                print_debug(f"retrying graphql query after hitting rate limit, try {retries}")
+                continue
 
-            if is_trace_enabled():
-                print_trace(f"graphql '{method}' result = ({status}, {text})")
+            if status == 403 or status == 429 or rate_limited:
+                raise RuntimeError("failed running graphql query, hitting rate limit")
 
             return status, text
 
+    @staticmethod
+    def _transform_repository(repository: dict[str, Any]) -> dict[str, Any]:
+        """
+        Transforms a repository node as returned by the GraphQL API into the format
+        returned by the REST API, so that it can be consumed by Repository.from_provider_data.
+        """
+
+        result = {
+            "id": repository["databaseId"],
+            "node_id": repository["id"],
+            "name": repository["name"],
+            "description": repository["description"],
+            "homepage": repository["homepageUrl"],
+            "private": repository["isPrivate"],
+            "archived": repository["isArchived"],
+            "is_template": repository["isTemplate"],
+            "has_discussions": repository["hasDiscussionsEnabled"],
+            "has_issues": repository["hasIssuesEnabled"],
+            "has_projects": repository["hasProjectsEnabled"],
+            "has_wiki": repository["hasWikiEnabled"],
+            "topics": [x["topic"]["name"] for x in repository["repositoryTopics"]["nodes"]],
+            "allow_rebase_merge": repository["rebaseMergeAllowed"],
+            "allow_merge_commit": repository["mergeCommitAllowed"],
+            "allow_squash_merge": repository["squashMergeAllowed"],
+            "allow_auto_merge": repository["autoMergeAllowed"],
+            "delete_branch_on_merge": repository["deleteBranchOnMerge"],
+            "allow_update_branch": repository["allowUpdateBranch"],
+            "squash_merge_commit_title": repository["squashMergeCommitTitle"],
+            "squash_merge_commit_message": repository["squashMergeCommitMessage"],
+            "merge_commit_title": repository["mergeCommitTitle"],
+            "merge_commit_message": repository["mergeCommitMessage"],
+            "allow_forking": repository["forkingAllowed"],
+            "web_commit_signoff_required": repository["webCommitSignoffRequired"],
+        }
+
+        template_repository = repository.get("templateRepository")
+        if template_repository is not None:
+            result["template_repository"] = {"full_name": template_repository["nameWithOwner"]}
+
+        # empty repositories do not have a default branch
+        default_branch_ref = repository.get("defaultBranchRef")
+        if default_branch_ref is not None:
+            result["default_branch"] = default_branch_ref["name"]
+
+        # vulnerability alerts are only retrieved for active repositories
+        if repository["isArchived"] is False:
+            result["dependabot_alerts_enabled"] = repository["hasVulnerabilityAlertsEnabled"]
+
+        return result
+
     @staticmethod
     def _transform_actors(actors: list[dict[str, Any]]) -> list[str]:
         result = []
@@ -358,3 +584,23 @@ def _get_query_from_file(query_file: str) -> str:
     from otterdog import resources
 
     return files(resources).joinpath(f"graphql/{query_file}").read_text()
+
+
+def _is_rate_limited(status: int, body: str) -> bool:
+    """
+    Indicates whether a GraphQL query hit the primary rate limit, which is reported
+    as an error of type 'RATE_LIMITED' in a response with status 200.
+    """
+
+    # avoid parsing the body of regular responses twice
+    if status != 200 or "RATE_LIMITED" not in body:
+        return False
+
+    try:
+        errors = json.loads(body).get("errors")
+    except (ValueError, AttributeError):
+        return False
+
+    return isinstance(errors, list) and any(
+        isinstance(error, dict) and error.get("type") == "RATE_LIMITED" for error in errors
+    )
@@ -0,0 +1,217 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import weakref
+from typing import TYPE_CHECKING
+
+from otterdog.utils import print_debug
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+
+# time to wait when hitting a secondary rate limit without any hint when to retry
+_DEFAULT_SECONDARY_RATE_LIMIT_WAIT = 60
+
+# rate limiters per event loop and identity, limiters can not be shared across event loops
+_RATE_LIMITERS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, RateLimiter]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_rate_limiter(identity: str | None) -> RateLimiter:
+    """
+    Returns the rate limiter shared by all clients authenticating with the given identity,
+    as rate limits apply to all requests made by the same user, app or installation.
+    """
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if identity is None or loop is None:
+        return RateLimiter()
+
+    rate_limiters = _RATE_LIMITERS.setdefault(loop, {})
+    rate_limiter = rate_limiters.get(identity)
+    if rate_limiter is None:
+        rate_limiter = rate_limiters[identity] = RateLimiter()
+
+    return rate_limiter
+
+
+class RateLimitedRequest:
+    """Captures the rate limit related information of a response while holding a request slot."""
+
+    def __init__(self) -> None:
+        self.status: int | None = None
+        self.headers: Mapping[str, str] = {}
+        self.body: str = ""
+        self.rate_limited: bool = False
+        self.retry: bool = False
+
+    def update(self, status: int, headers: Mapping[str, str], body: str, rate_limited: bool = False) -> None:
+        """
+        Updates the request with its response, rate_limited indicates a rate limit that is not signaled
+        by the status of the response, e.g. for GraphQL queries.
+        """
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.rate_limited = rate_limited
+
+
+class RateLimiter:
+    """
+    An adaptive scheduler for requests to the GitHub API.
+
+    The number of concurrent requests is adjusted on the fly: it is increased by one
+    for every successful response and halved whenever a rate limit is hit.
+    In addition, once the remaining primary rate limit budget drops below a threshold,
+    requests are spread evenly over the time till the rate limit is reset using a token bucket.
+    """
+
+    def __init__(self, max_concurrency: int = 50, min_concurrency: int = 1, low_budget_threshold: int = 500):
+        self._max_concurrency = max_concurrency
+        self._min_concurrency = min_concurrency
+        self._low_budget_threshold = low_budget_threshold
+
+        self._concurrency = max_concurrency
+        self._in_flight = 0
+
+        # token rate per second, None indicates that requests are not rate limited
+        self._rate: float | None = None
+        self._tokens = float(max_concurrency)
+        self._last_refill = time.monotonic()
+
+        self._blocked_until = 0.0
+        self._condition = asyncio.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value: int) -> None:
+        self._max_concurrency = max(self._min_concurrency, value)
+        self._concurrency = min(self._concurrency, self._max_concurrency)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @contextlib.asynccontextmanager
+    async def throttle(self) -> AsyncIterator[RateLimitedRequest]:
+        await self._acquire()
+
+        request = RateLimitedRequest()
+        try:
+            yield request
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                if request.status is not None:
+                    request.retry = self._update(request.status, request.headers, request.body, request.rate_limited)
+
+                # only wake up as many waiting requests as there are free slots, waking up
+                # all of them would be costly with thousands of queued requests.
+                self._condition.notify(max(1, self._concurrency - self._in_flight))
+
+    async def _acquire(self) -> None:
+        async with self._condition:
+            while True:
+                now = time.monotonic()
+                delay = self._blocked_until - now
+
+                if delay <= 0 and self._in_flight < self._concurrency:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._in_flight += 1
+                        return
+
+                    assert self._rate is not None
+                    delay = (1 - self._tokens) / self._rate
+
+                if delay > 0:
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._condition.wait(), delay)
+                else:
+                    await self._condition.wait()
+
+    def _refill(self, now: float) -> None:
+        if self._rate is None:
+            self._tokens = float(self._concurrency)
+        else:
+            self._tokens = min(float(self._concurrency), self._tokens + (now - self._last_refill) * self._rate)
+
+        self._last_refill = now
+
+    def _update(self, status: int, headers: Mapping[str, str], body: str, rate_limited: bool) -> bool:
+        """Adapts the scheduler to the response and returns whether the request should be retried"""
+
+        remaining = _get_int_header(headers, "x-ratelimit-remaining")
+        reset = _get_int_header(headers, "x-ratelimit-reset")
+        retry_after = _get_int_header(headers, "retry-after")
+
+        now = time.monotonic()
+        seconds_till_reset = max(reset - time.time(), 1.0) if reset is not None else None
+
+        if rate_limited or (
+            status in (403, 429) and (retry_after is not None or remaining == 0 or "rate limit" in body.lower())
+        ):
+            if retry_after is not None:
+                wait = float(retry_after)
+            elif remaining == 0 and seconds_till_reset is not None:
+                wait = seconds_till_reset
+            else:
+                wait = _DEFAULT_SECONDARY_RATE_LIMIT_WAIT
+
+            # only narrow the concurrency once for requests that were in flight concurrently
+            if self._blocked_until <= now:
+                self._concurrency = max(self._min_concurrency, self._concurrency // 2)
+
+            self._blocked_until = max(self._blocked_until, now + wait)
+            print_debug(f"hit rate limit, pausing requests for {wait:.0f}s with concurrency {self._concurrency}")
+            return True
+
+        if self._concurrency < self._max_concurrency:
+            self._concurrency += 1
+
+        if remaining is not None and seconds_till_reset is not None:
+            if remaining == 0:
+                self._blocked_until = max(self._blocked_until, now + seconds_till_reset)
+                self._rate = None
+            elif remaining < self._low_budget_threshold:
+                # spread the remaining budget till the rate limit is reset
+                self._rate = remaining / seconds_till_reset
+            else:
+                self._rate = None
+
+        return False
+
+
+def _get_int_header(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
@@ -19,6 +19,7 @@ from .requester import Requester
 if TYPE_CHECKING:
     from otterdog.providers.github.auth import AuthStrategy
     from otterdog.providers.github.cache import CacheStrategy
+    from otterdog.providers.github.rate_limit import RateLimiter
     from otterdog.providers.github.stats import RequestStatistics
 
 _DEFAULT_CACHE_STRATEGY = file_cache()
@@ -33,10 +34,13 @@ class RestApi:
         self,
         auth_strategy: AuthStrategy | None = None,
         cache_strategy: CacheStrategy = _DEFAULT_CACHE_STRATEGY,
+        rate_limiter: RateLimiter | None = None,
     ):
         self._auth_strategy = auth_strategy
         self._cache_strategy = cache_strategy
-        self._requester = Requester(auth_strategy, cache_strategy, self._GH_API_URL_ROOT, self._GH_API_VERSION)
+        self._requester = Requester(
+            auth_strategy, cache_strategy, self._GH_API_URL_ROOT, self._GH_API_VERSION, rate_limiter
+        )
 
     async def __aenter__(self):
         return self
@@ -8,6 +8,8 @@
 
 import json
 import re
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
 from otterdog.providers.github.exception import GitHubException
@@ -206,12 +208,24 @@ class OrgClient(RestClient):
         print_debug(f"removed org webhook with url '{url}'")
 
     async def get_repos(self, org_id: str) -> list[str]:
+        return [repo["name"] async for repo in self.stream_repos_data(org_id)]
+
+    async def stream_repos_data(self, org_id: str) -> AsyncIterator[dict[str, Any]]:
+        print_debug(f"streaming repos for organization {org_id}")
+
+        params = {"type": "all"}
+        try:
+            async for repo in self.requester.request_paged_json_stream("GET", f"/orgs/{org_id}/repos", params=params):
+                yield repo
+        except GitHubException as ex:
+            raise RuntimeError(f"failed to retrieve repos for organization '{org_id}':\n{ex}") from ex
+
+    async def get_repos_data(self, org_id: str) -> list[dict[str, Any]]:
         print_debug(f"retrieving repos for organization {org_id}")
 
         params = {"type": "all"}
         try:
-            repos = await self.requester.request_paged_json("GET", f"/orgs/{org_id}/repos", params=params)
-            return [repo["name"] for repo in repos]
+            return await self.requester.request_paged_json("GET", f"/orgs/{org_id}/repos", params=params)
         except GitHubException as ex:
             raise RuntimeError(f"failed to retrieve repos for organization '{org_id}':\n{ex}") from ex
 
@@ -564,6 +578,27 @@ class OrgClient(RestClient):
                     f"failed disabling default code security configuration with id {configuration_id}:\n{ex}"
                 ) from ex
 
+    async def get_repos_with_audit_events(self, org_id: str, since: datetime) -> set[str]:
+        """
+        Returns the names of all repos of an organization that have audit log events since the given time.
+
+        Note: the audit log is only accessible for organizations on an enterprise plan.
+        """
+
+        print_debug(f"retrieving audit log events for org '{org_id}' since {since.isoformat()}")
+
+        params = {"phrase": f"created:>={since.strftime('%Y-%m-%dT%H:%M:%SZ')}", "include": "all"}
+        try:
+            repos = set()
+            url = f"/orgs/{org_id}/audit-log"
+            async for event in self.requester.request_paged_json_stream("GET", url, params=params):
+                repo = event.get("repo")
+                if repo is not None:
+                    repos.add(repo.split("/")[-1])
+            return repos
+        except GitHubException as ex:
+            raise RuntimeError(f"failed retrieving audit log for org '{org_id}':\n{ex}") from ex
+
     async def list_members(self, org_id: str, two_factor_disabled: bool) -> list[dict[str, Any]]:
         print_debug(f"retrieving list of organization members for org '{org_id}'")
 
@@ -572,3 +607,14 @@ class OrgClient(RestClient):
             return await self.requester.request_paged_json("GET", f"/orgs/{org_id}/members", params=params)
         except GitHubException as ex:
             raise RuntimeError(f"failed retrieving members:\n{ex}") from ex
+
+    async def stream_members(self, org_id: str, two_factor_disabled: bool) -> AsyncIterator[dict[str, Any]]:
+        print_debug(f"streaming organization members for org '{org_id}'")
+
+        try:
+            params = {"filter": "2fa_disabled"} if two_factor_disabled is True else None
+            url = f"/orgs/{org_id}/members"
+            async for member in self.requester.request_paged_json_stream("GET", url, params=params):
+                yield member
+        except GitHubException as ex:
+            raise RuntimeError(f"failed retrieving members:\n{ex}") from ex
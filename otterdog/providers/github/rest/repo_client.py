@@ -6,6 +6,7 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+import asyncio
 import json
 import os
 import pathlib
@@ -29,6 +30,13 @@ from otterdog.utils import (
 
 
 class RepoClient(RestClient):
+    _REQUIRED_REPO_DATA_KEYS = (
+        "default_branch",
+        "allow_squash_merge",
+        "squash_merge_commit_title",
+        "web_commit_signoff_required",
+    )
+
     def __init__(self, rest_api: RestApi):
         super().__init__(rest_api)
 
@@ -52,23 +60,71 @@ class RepoClient(RestClient):
         try:
             repo_data = await self.get_simple_repo_data(org_id, repo_name)
 
-            archived = repo_data.get("archived", False)
-            if not archived:
-                await self._fill_vulnerability_alerts(org_id, repo_name, repo_data)
+            # the additional data is stored under distinct keys, retrieve it concurrently
+            fill_tasks = [
+                self._fill_topics(org_id, repo_name, repo_data),
+                self._fill_rest_only_data(org_id, repo_name, repo_data),
+            ]
 
-                private = repo_data.get("private", False)
-                if not private:
-                    await self._fill_private_vulnerability_reporting(org_id, repo_name, repo_data)
+            if not repo_data.get("archived", False):
+                fill_tasks.append(self._fill_vulnerability_alerts(org_id, repo_name, repo_data))
 
-            await self._fill_github_pages_config(org_id, repo_name, repo_data)
-            await self._fill_topics(org_id, repo_name, repo_data)
-            await self._fill_code_scanning_config(org_id, repo_name, repo_data)
-            await self._fill_custom_properties(org_id, repo_name, repo_data)
+            await asyncio.gather(*fill_tasks)
 
             return repo_data
         except GitHubException as ex:
             raise RuntimeError(f"failed retrieving data for repo '{repo_name}':\n{ex}") from ex
 
+    async def complete_repo_data(self, org_id: str, repo_name: str, repo_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Completes repo data that has been retrieved in bulk (e.g. via the GraphQL API) with
+        settings that are only accessible via dedicated REST endpoints.
+        """
+
+        print_debug(f"completing repo data for '{org_id}/{repo_name}'")
+
+        try:
+            # bulk queries do not always contain all settings, e.g. the security settings are only
+            # included for admins, fall back to the full repo data in such cases.
+            if any(key not in repo_data for key in self._REQUIRED_REPO_DATA_KEYS) or (
+                repo_data.get("security_and_analysis") is None and not repo_data.get("private", False)
+            ):
+                simple_repo_data = await self.get_simple_repo_data(org_id, repo_name)
+                for key, value in simple_repo_data.items():
+                    repo_data.setdefault(key, value)
+
+                if repo_data.get("security_and_analysis") is None:
+                    repo_data["security_and_analysis"] = simple_repo_data.get("security_and_analysis")
+
+            fill_tasks = [self._fill_rest_only_data(org_id, repo_name, repo_data)]
+
+            if not repo_data.get("archived", False) and "dependabot_alerts_enabled" not in repo_data:
+                fill_tasks.append(self._fill_vulnerability_alerts(org_id, repo_name, repo_data))
+
+            if "topics" not in repo_data:
+                fill_tasks.append(self._fill_topics(org_id, repo_name, repo_data))
+
+            await asyncio.gather(*fill_tasks)
+
+            return repo_data
+        except GitHubException as ex:
+            raise RuntimeError(f"failed retrieving data for repo '{repo_name}':\n{ex}") from ex
+
+    async def _fill_rest_only_data(self, org_id: str, repo_name: str, repo_data: dict[str, Any]) -> None:
+        fill_tasks = [
+            self._fill_code_scanning_config(org_id, repo_name, repo_data),
+            self._fill_custom_properties(org_id, repo_name, repo_data),
+        ]
+
+        if not repo_data.get("archived", False) and not repo_data.get("private", False):
+            fill_tasks.append(self._fill_private_vulnerability_reporting(org_id, repo_name, repo_data))
+
+        # skip retrieving the pages config if the repo is known to have no pages site
+        if repo_data.get("has_pages", True):
+            fill_tasks.append(self._fill_github_pages_config(org_id, repo_name, repo_data))
+
+        await asyncio.gather(*fill_tasks)
+
     async def get_repo_by_id(self, repo_id: int) -> dict[str, Any]:
         print_debug(f"retrieving repo by id for '{repo_id}'")
 
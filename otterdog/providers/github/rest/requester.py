@@ -6,19 +6,46 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+import asyncio
+import hashlib
 import json
-from collections.abc import AsyncIterable
-from typing import Any
+import pickle
+import re
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlparse
 
-from aiohttp import ClientSession, ClientTimeout, TCPConnector
-from aiohttp_client_cache.session import CachedSession as AsyncCachedSession
 from aiohttp_retry import ExponentialRetry, RetryClient
+from redis import RedisError
 
 from otterdog.providers.github.auth import AuthStrategy
 from otterdog.providers.github.cache import CacheStrategy
 from otterdog.providers.github.exception import BadCredentialsException, GitHubException
+from otterdog.providers.github.rate_limit import RateLimiter, get_rate_limiter
+from otterdog.providers.github.session import get_shared_session
 from otterdog.providers.github.stats import RequestStatistics
-from otterdog.utils import is_trace_enabled, print_trace
+from otterdog.utils import is_trace_enabled, print_debug, print_trace
+
+if TYPE_CHECKING:
+    from aiohttp_client_cache import CacheBackend
+
+# maximum number of retries for requests that hit a rate limit
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# number of items requested per page for paged requests
+_PAGE_SIZE = 100
+# maximum number of pages of a paged request that are retrieved concurrently
+_MAX_CONCURRENT_PAGES = 10
+
+# time in seconds a response is retained to perform conditional requests
+_CONDITIONAL_ENTRY_EXPIRATION = 24 * 60 * 60
+
+# errors that might occur when accessing entries of the supported cache backends
+_CACHE_BACKEND_ERRORS = (OSError, ValueError, pickle.PickleError, RedisError)
+
+_LINK_PATTERN = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
 
 
 class Requester:
@@ -28,6 +55,7 @@ class Requester:
         cache_strategy: CacheStrategy,
         base_url: str,
         api_version: str,
+        rate_limiter: RateLimiter | None = None,
     ):
         self._auth = auth_strategy.get_auth() if auth_strategy is not None else None
 
@@ -39,31 +67,38 @@ class Requester:
 
         self._statistics = RequestStatistics()
         self._cache_strategy = cache_strategy
+        self._rate_limiter = (
+            rate_limiter
+            if rate_limiter is not None
+            else get_rate_limiter(self._auth.identity if self._auth is not None else None)
+        )
+
+        # validators and bodies of previous responses, used to perform conditional requests
+        self._cache_backend: CacheBackend | None = None
 
         if self._cache_strategy.is_external():
             self._base_url = f"http://{base_url}"
-            self._session = ClientSession()
         else:
             self._base_url = f"https://{base_url}"
-            self._session = AsyncCachedSession(
-                cache=self._cache_strategy.get_cache_backend(),
-                timeout=ClientTimeout(connect=3, sock_connect=3),
-                connector=TCPConnector(
-                    limit=30,
-                ),
-            )
-
-        self._client = RetryClient(
-            retry_options=ExponentialRetry(3, exceptions={Exception}),
-            client_session=self._session,
-        )
+            self._cache_backend = self._cache_strategy.get_cache_backend()
+
+        self._retry_options = ExponentialRetry(3, exceptions={Exception})
 
     @property
     def statistics(self) -> RequestStatistics:
         return self._statistics
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
+
     async def close(self) -> None:
-        await self._session.close()
+        # the underlying session is shared with other clients and stays open
+        if self._cache_backend is not None:
+            await self._cache_backend.close()
+
+    def _get_client(self) -> RetryClient:
+        return RetryClient(client_session=get_shared_session(), retry_options=self._retry_options)
 
     def _build_url(self, url_path: str) -> str:
         return f"{self._base_url}{url_path}"
@@ -76,23 +111,80 @@ class Requester:
         params: dict[str, str] | None = None,
     ) -> list[dict[str, Any]]:
         result = []
-        current_page = 1
-        while current_page > 0:
-            query_params = {"per_page": "100", "page": current_page}
+        async for page in self._request_pages(method, url_path, data, params):
+            result.extend(page)
+
+        return result
+
+    async def request_paged_json_stream(
+        self,
+        method: str,
+        url_path: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        async for page in self._request_pages(method, url_path, data, params):
+            for item in page:
+                yield item
+
+    async def _request_pages(
+        self,
+        method: str,
+        url_path: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        input_data = None
+        if data is not None:
+            input_data = json.dumps(data)
+
+        async def request_page(page: int, cursor: str | None = None) -> tuple[list[dict[str, Any]], dict[str, str]]:
+            # some endpoints, e.g. the audit log, use cursor based pagination instead of page numbers
+            query_params: dict[str, Any] = {"per_page": str(_PAGE_SIZE)}
+            if cursor is not None:
+                query_params["after"] = cursor
+            else:
+                query_params["page"] = page
+
             if params is not None:
                 query_params.update(params)
 
-            response: list[dict[str, Any]] = await self.request_json(method, url_path, data, query_params)
+            status, body, link = await self._request(method, url_path, input_data, query_params)
+            self._check_response(url_path, status, body)
+            return json.loads(body), _parse_link_header(link)
 
-            if len(response) == 0:
-                current_page = -1
-            else:
-                for item in response:
-                    result.append(item)
+        response, links = await request_page(1)
+        yield response
+
+        last_page = _get_page_number(links.get("last"))
+        if last_page is not None:
+            # the number of pages is known, retrieve the remaining pages concurrently
+            # while still returning them in order.
+            pending: deque[asyncio.Task] = deque()
+            next_page = 2
+            try:
+                while next_page <= last_page or len(pending) > 0:
+                    while next_page <= last_page and len(pending) < _MAX_CONCURRENT_PAGES:
+                        pending.append(asyncio.create_task(request_page(next_page)))
+                        next_page += 1
 
+                    response, _ = await pending.popleft()
+                    yield response
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        else:
+            # without a link to the last page, follow the pages one by one. GitHub omits the
+            # Link header if all items fit into a single page, only keep going if the page is full.
+            current_page = 1
+            while "next" in links or (len(links) == 0 and len(response) >= _PAGE_SIZE):
                 current_page += 1
+                response, links = await request_page(current_page, _get_query_parameter(links.get("next"), "after"))
+                if len(response) == 0:
+                    break
 
-        return result
+                yield response
 
     async def request_json(
         self,
@@ -116,6 +208,18 @@ class Requester:
         data: str | None = None,
         params: dict[str, Any] | None = None,
     ) -> tuple[int, str]:
+        status, text, _ = await self._request(method, url_path, data, params)
+        return status, text
+
+    async def _request(
+        self,
+        method: str,
+        url_path: str,
+        data: str | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[int, str, str | None]:
+        """Performs a request and returns the status, body and Link header of the response."""
+
         print_trace(f"'{method}' url = {url_path}, data = {data}, params = {params}, headers = {self._headers}")
 
         headers = self._headers.copy()
@@ -123,32 +227,57 @@ class Requester:
             self._auth.update_headers_with_authorization(headers)
 
         url = self._build_url(url_path)
-        async with self._client.request(
-            method,
-            url=url,
-            headers=headers,
-            params=params,
-            data=data,
-            **self._cache_strategy.get_request_parameters(),
-        ) as response:
-            self._statistics.sent_request()
-
-            text = await response.text()
-            status = response.status
-
-            if (
-                hasattr(response, "from_cache")
-                and response.from_cache
-                or response.headers.get("X-From-Cache", 0) == "1"
+
+        # GET requests are sent as conditional requests if a previous response is known,
+        # GitHub does not count responses with status 304 against the primary rate limit.
+        conditional_key = self._get_conditional_key(method, url, params, headers)
+        cached_entry = await self._read_conditional_entry(conditional_key)
+        if cached_entry is not None:
+            if cached_entry.get("etag") is not None:
+                headers["If-None-Match"] = cached_entry["etag"]
+            if cached_entry.get("last_modified") is not None:
+                headers["If-Modified-Since"] = cached_entry["last_modified"]
+
+        retries = 0
+        while True:
+            async with (
+                self._rate_limiter.throttle() as throttled_request,
+                self._get_client().request(
+                    method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    data=data,
+                    **self._cache_strategy.get_request_parameters(),
+                ) as response,
             ):
-                self._statistics.received_cached_response()
-            else:
-                self._statistics.update_remaining_rate_limit(int(response.headers.get("x-ratelimit-remaining", -1)))
+                self._statistics.sent_request()
+
+                text = await response.text()
+                status = response.status
+                link = response.headers.get("Link")
+
+                if response.headers.get("X-From-Cache", 0) == "1":
+                    self._statistics.received_cached_response()
+                else:
+                    self._statistics.update_remaining_rate_limit(int(response.headers.get("x-ratelimit-remaining", -1)))
+                    throttled_request.update(status, response.headers, text)
+
+                if status == 304 and cached_entry is not None:
+                    self._statistics.received_revalidated_response()
+                    status, text, link = 200, cached_entry["body"], cached_entry.get("link")
+                elif status == 200 and conditional_key is not None:
+                    await self._write_conditional_entry(conditional_key, response.headers, text)
+
+            if throttled_request.retry and retries < _MAX_RATE_LIMIT_RETRIES:
+                retries += 1
+                print_debug(f"retrying '{method}' url = {url_path} after hitting rate limit, try {retries}")
+                continue
 
             if is_trace_enabled():
                 print_trace(f"'{method}' result = ({status}, {text})")
 
-            return status, text
+            return status, text, link
 
     async def request_stream(
         self,
@@ -164,17 +293,80 @@ class Requester:
             self._auth.update_headers_with_authorization(headers)
 
         url = self._build_url(url_path)
-        async with self._client.request(
-            method,
-            url=url,
-            headers=headers,
-            params=params,
-            data=data,
-            **self._cache_strategy.get_request_parameters(),
-        ) as response:
+        async with (
+            self._rate_limiter.throttle(),
+            self._get_client().request(
+                method,
+                url=url,
+                headers=headers,
+                params=params,
+                data=data,
+                **self._cache_strategy.get_request_parameters(),
+            ) as response,
+        ):
             async for chunk, _ in response.content.iter_chunks():
                 yield chunk
 
+    def _get_conditional_key(
+        self, method: str, url: str, params: dict[str, Any] | None, headers: dict[str, str]
+    ) -> str | None:
+        if method != "GET" or self._cache_backend is None:
+            return None
+
+        # include the auth identity as responses may differ depending on the permissions,
+        # the identity does not change when a token is renewed, e.g. for app installations.
+        key_data = {
+            "url": url,
+            "params": {k: str(v) for k, v in params.items()} if params is not None else {},
+            "auth": self._auth.identity if self._auth is not None else None,
+            "accept": headers.get("Accept"),
+        }
+
+        return "conditional-" + hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    async def _read_conditional_entry(self, key: str | None) -> dict[str, Any] | None:
+        if key is None or self._cache_backend is None:
+            return None
+
+        try:
+            entry = await self._cache_backend.responses.read(key)  # type: ignore
+        except _CACHE_BACKEND_ERRORS as ex:
+            print_debug(f"failed to read conditional request entry: {ex}")
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+
+        if entry.get("expires_at", 0) < time.time():
+            try:
+                await self._cache_backend.responses.delete(key)
+            except _CACHE_BACKEND_ERRORS as ex:
+                print_debug(f"failed to delete expired conditional request entry: {ex}")
+            return None
+
+        return entry
+
+    async def _write_conditional_entry(self, key: str, response_headers: Any, body: str) -> None:
+        assert self._cache_backend is not None
+
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "link": response_headers.get("Link"),
+            "body": body,
+            "expires_at": time.time() + _CONDITIONAL_ENTRY_EXPIRATION,
+        }
+
+        try:
+            await self._cache_backend.responses.write(key, entry)  # type: ignore
+        except _CACHE_BACKEND_ERRORS as ex:
+            print_debug(f"failed to write conditional request entry: {ex}")
+
     def _check_response(self, url_path: str, status_code: int, body: str) -> None:
         if status_code >= 400:
             self._create_exception(self._build_url(url_path), status_code, body)
@@ -185,3 +377,29 @@ class Requester:
             raise BadCredentialsException(url, status_code, body)
         else:
             raise GitHubException(url, status_code, body)
+
+
+def _parse_link_header(value: str | None) -> dict[str, str]:
+    if value is None:
+        return {}
+
+    return {rel: url for url, rel in _LINK_PATTERN.findall(value)}
+
+
+def _get_query_parameter(url: str | None, name: str) -> str | None:
+    if url is None:
+        return None
+
+    values = parse_qs(urlparse(url).query).get(name)
+    return values[0] if values is not None else None
+
+
+def _get_page_number(url: str | None) -> int | None:
+    page = _get_query_parameter(url, "page")
+    if page is None:
+        return None
+
+    try:
+        return int(page)
+    except ValueError:
+        return None
@@ -0,0 +1,64 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+from weakref import WeakKeyDictionary
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from otterdog.utils import print_debug
+
+# maximum number of simultaneous connections in the shared pool
+_CONNECTION_LIMIT = 100
+# time in seconds an idle connection is kept open for re-use
+_KEEPALIVE_TIMEOUT = 60
+# time in seconds resolved host names are cached
+_DNS_CACHE_TTL = 300
+
+# a ClientSession is bound to the event loop it has been created in,
+# keep one shared session per running loop.
+_SESSIONS: WeakKeyDictionary[asyncio.AbstractEventLoop, ClientSession] = WeakKeyDictionary()
+
+
+def get_shared_session() -> ClientSession:
+    """
+    Returns the process-wide session used for all requests to GitHub.
+
+    The session maintains a pool of keep-alive connections and caches DNS lookups,
+    authorization headers are supplied per request by the individual clients,
+    so the session can be safely shared between clients using different credentials.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    session = _SESSIONS.get(loop)
+    if session is None or session.closed:
+        print_debug("creating shared http session")
+        session = ClientSession(
+            timeout=ClientTimeout(connect=3, sock_connect=3),
+            connector=TCPConnector(
+                limit=_CONNECTION_LIMIT,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                use_dns_cache=True,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+            ),
+        )
+        _SESSIONS[loop] = session
+
+    return session
+
+
+async def close_shared_session() -> None:
+    """Closes the shared session of the running event loop, a new one is created on next use."""
+
+    session = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        print_debug("closing shared http session")
+        await session.close()
@@ -15,11 +15,13 @@ import dataclasses
 class RequestStatistics:
     total_requests: int = 0
     cached_responses: int = 0
+    revalidated_responses: int = 0
     remaining_rate_limit: int = -1
 
     def merge(self, other: RequestStatistics) -> None:
         self.total_requests += other.total_requests
         self.cached_responses += other.cached_responses
+        self.revalidated_responses += other.revalidated_responses
 
         if self.remaining_rate_limit == -1:
             self.remaining_rate_limit = other.remaining_rate_limit
@@ -34,5 +36,8 @@ class RequestStatistics:
     def received_cached_response(self) -> None:
         self.cached_responses += 1
 
+    def received_revalidated_response(self) -> None:
+        self.revalidated_responses += 1
+
     def update_remaining_rate_limit(self, remaining: int) -> None:
         self.remaining_rate_limit = remaining
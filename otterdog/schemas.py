@@ -0,0 +1,122 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import json
+from functools import cache
+from typing import TYPE_CHECKING
+
+from importlib_resources import files
+from jsonschema.validators import validator_for
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT202012
+
+from otterdog import resources
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from jsonschema import ValidationError
+    from jsonschema.protocols import Validator
+
+_SCHEMA_DIR = "schemas"
+
+_ORG_SCHEMA = "organization.json"
+_REPO_SCHEMA = "repository.json"
+
+
+@cache
+def _get_registry() -> Registry:
+    """
+    Returns a registry of all schemas, the schemas refer to each other by their file name.
+    """
+
+    schema_resources = []
+    for schema_file in files(resources).joinpath(_SCHEMA_DIR).iterdir():
+        if schema_file.name.endswith(".json"):
+            contents = json.loads(schema_file.read_text())
+            schema_resources.append(
+                (schema_file.name, Resource.from_contents(contents, default_specification=DRAFT202012))
+            )
+
+    return Registry().with_resources(schema_resources).crawl()
+
+
+@cache
+def get_schema_validator(schema_name: str) -> Validator:
+    """
+    Returns a validator for the given schema, the schema is checked and compiled only once.
+    """
+
+    schema = _get_registry().contents(schema_name)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema, registry=_get_registry())
+
+
+def validate_org_data(data: dict[str, Any], validate_repositories: bool = True) -> None:
+    """
+    Validates the data of an organization with its json schema,
+    reporting all errors rather than failing on the first one.
+
+    If validate_repositories is False, the repositories of the organization are not validated,
+    e.g. if they are validated individually using validate_repo_data.
+    """
+
+    if not validate_repositories:
+        data = {k: v for k, v in data.items() if k != "repositories"}
+
+    errors = list(get_schema_validator(_ORG_SCHEMA).iter_errors(data))
+    if len(errors) > 0:
+        raise RuntimeError(_format_errors(errors, data))
+
+
+def validate_repo_data(data: dict[str, Any]) -> None:
+    """
+    Validates the data of a single repository with its json schema,
+    reporting all errors rather than failing on the first one.
+    """
+
+    errors = list(get_schema_validator(_REPO_SCHEMA).iter_errors(data))
+    if len(errors) > 0:
+        repo_name = str(data.get("name", "<unknown>"))
+        lines = [f"repository '{repo_name}' does not match the schema, found {len(errors)} error(s):"]
+        lines.extend(
+            f"  - {_get_repo_error_prefix(repo_name, list(error.absolute_path))}: {error.message}" for error in errors
+        )
+        raise RuntimeError("\n".join(lines))
+
+
+def _format_errors(errors: list[ValidationError], data: dict[str, Any]) -> str:
+    lines = [f"configuration does not match the schema, found {len(errors)} error(s):"]
+
+    for error in errors:
+        path = list(error.absolute_path)
+
+        # errors within a repository are reported by the name of the repo
+        if len(path) >= 2 and path[0] == "repositories" and isinstance(path[1], int):
+            prefix = _get_repo_error_prefix(_get_repo_name(data, path[1]), path[2:])
+        else:
+            prefix = f"at '{error.json_path}'"
+
+        lines.append(f"  - {prefix}: {error.message}")
+
+    return "\n".join(lines)
+
+
+def _get_repo_name(data: dict[str, Any], index: int) -> str:
+    try:
+        return str(data["repositories"][index]["name"])
+    except (KeyError, IndexError, TypeError):
+        return f"#{index}"
+
+
+def _get_repo_error_prefix(repo_name: str, path: list[Any]) -> str:
+    location = "/".join(str(x) for x in path)
+    return f"repository '{repo_name}'" + (f" at '{location}'" if location else "")
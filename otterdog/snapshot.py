@@ -0,0 +1,152 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pickle
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from otterdog import __version__
+from otterdog.utils import print_debug
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from otterdog.jsonnet import JsonnetConfig
+    from otterdog.models.repository import Repository
+
+_SNAPSHOT_DIR = ".cache/snapshots"
+
+# snapshots written by a different version of otterdog are discarded
+# as the structure of the model classes might have changed
+_SNAPSHOT_VERSION = f"2-{__version__}"
+
+# maximum age of a snapshot entry if changes can not be determined from the audit log
+_DEFAULT_MAX_AGE = timedelta(hours=1)
+
+
+@dataclasses.dataclass
+class RepositorySnapshot:
+    """
+    A live repository as it has been loaded from GitHub along with the timestamps
+    that indicate whether it has been modified since and the time it has been loaded.
+    """
+
+    pushed_at: str | None
+    updated_at: str | None
+    repository: Repository
+    fetched_at: datetime
+
+
+@dataclasses.dataclass
+class OrganizationSnapshot:
+    """
+    A snapshot of the live repositories of an organization.
+    """
+
+    template_hash: str
+    created_at: datetime
+    repositories: dict[str, RepositorySnapshot] = dataclasses.field(default_factory=dict)
+
+    def get_unchanged_repository(
+        self,
+        repo_name: str,
+        repo_data: dict[str, Any],
+        changed_repos: set[str] | None,
+        max_age: timedelta,
+    ) -> Repository | None:
+        """
+        Returns the repository from this snapshot if it is unchanged according to the given repo data.
+
+        GitHub does not update the timestamps of a repository when its sub-resources, e.g. webhooks
+        or secrets, are modified. If the set of changed repos could be determined from the audit log,
+        it is used to detect these changes, otherwise the repository is only re-used up to the given age
+        since it has been loaded from GitHub.
+        """
+
+        entry = self.repositories.get(repo_name)
+        if entry is None:
+            return None
+
+        if entry.pushed_at != repo_data.get("pushed_at") or entry.updated_at != repo_data.get("updated_at"):
+            return None
+
+        if changed_repos is not None:
+            return entry.repository if repo_name not in changed_repos else None
+        elif datetime.now(timezone.utc) - entry.fetched_at <= max_age:
+            return entry.repository
+        else:
+            return None
+
+
+class SnapshotStore:
+    """
+    Stores snapshots of the live repositories of organizations on local disk
+    to avoid re-fetching repositories which did not change between runs.
+    """
+
+    def __init__(self, snapshot_dir: str = _SNAPSHOT_DIR, max_age: timedelta = _DEFAULT_MAX_AGE):
+        self._snapshot_dir = snapshot_dir
+        self._max_age = max_age
+
+    @property
+    def max_age(self) -> timedelta:
+        return self._max_age
+
+    def load(self, org_id: str, template_hash: str) -> OrganizationSnapshot | None:
+        snapshot_file = self._get_snapshot_file(org_id)
+        if not os.path.exists(snapshot_file):
+            return None
+
+        try:
+            with open(snapshot_file, "rb") as file:
+                version, snapshot = pickle.load(file)
+        except Exception as ex:
+            print_debug(f"failed to read snapshot for org '{org_id}': {ex}")
+            return None
+
+        if version != _SNAPSHOT_VERSION or snapshot.template_hash != template_hash:
+            print_debug(f"discarding outdated snapshot for org '{org_id}'")
+            return None
+
+        return snapshot
+
+    def save(self, org_id: str, snapshot: OrganizationSnapshot) -> None:
+        snapshot_file = self._get_snapshot_file(org_id)
+        os.makedirs(os.path.dirname(snapshot_file), exist_ok=True)
+
+        # write to a temporary file first to never leave a partially written snapshot behind
+        tmp_file = f"{snapshot_file}.tmp"
+        with open(tmp_file, "wb") as file:
+            pickle.dump((_SNAPSHOT_VERSION, snapshot), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_file, snapshot_file)
+        print_debug(f"stored snapshot of {len(snapshot.repositories)} repos for org '{org_id}'")
+
+    def invalidate(self, org_id: str) -> None:
+        snapshot_file = self._get_snapshot_file(org_id)
+        if os.path.exists(snapshot_file):
+            print_debug(f"invalidating snapshot for org '{org_id}'")
+            os.remove(snapshot_file)
+
+    def _get_snapshot_file(self, org_id: str) -> str:
+        return os.path.join(self._snapshot_dir, f"{org_id}.pickle")
+
+
+def get_template_hash(jsonnet_config: JsonnetConfig) -> str:
+    """
+    Returns a hash of the default template used by an organization, as the template
+    determines which resources are retrieved from GitHub.
+    """
+
+    with open(jsonnet_config.template_file, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
@@ -136,6 +136,10 @@ class _Unset:
     def __deepcopy__(self, memo: dict[int, Any]):
         return UNSET
 
+    def __reduce__(self):
+        # keep the singleton identity when unpickling
+        return "UNSET"
+
 
 UNSET = _Unset()
 
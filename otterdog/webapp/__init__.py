@@ -20,12 +20,16 @@ from flask_github import GitHub  # type: ignore
 from quart import Quart
 from quart.json.provider import DefaultJSONProvider
 from quart_auth import QuartAuth
-from quart_redis import RedisHandler  # type: ignore
+from quart_redis import RedisHandler, get_redis  # type: ignore
 
-from otterdog.cache import set_github_cache
+from otterdog.cache import set_github_cache, set_jsonnet_cache
+from otterdog.jsonnet_cache import redis_jsonnet_cache
+from otterdog.jsonnet_evaluator import shutdown_jsonnet_evaluator
+from otterdog.providers.github.session import close_shared_session
 
 from .db import Mongo, init_mongo_database
 from .filters import register_filters
+from .queue import TaskQueue
 from .utils import close_rest_apis, get_github_ghproxy_cache, get_temporary_base_directory
 
 if TYPE_CHECKING:
@@ -35,6 +39,7 @@ _BLUEPRINT_MODULES: list[str] = ["home", "api", "internal", "auth"]
 
 mongo = Mongo()
 redis_handler = RedisHandler()
+task_queue = TaskQueue()
 auth_manager = QuartAuth(cookie_secure=False)  # type: ignore
 oauth_github = GitHub()
 
@@ -42,6 +47,7 @@ oauth_github = GitHub()
 def register_extensions(app):
     mongo.init_app(app)
     redis_handler.init_app(app)
+    task_queue.init_app(app)
 
     from otterdog.webapp.auth import User
 
@@ -103,6 +109,7 @@ def create_app(app_config: AppConfig):
         return {"asset": asset}
 
     set_github_cache(get_github_ghproxy_cache(app.config))
+    set_jsonnet_cache(redis_jsonnet_cache(app.config["REDIS_URI"], get_redis))
 
     register_extensions(app)
     register_github_webhook(app)
@@ -127,5 +134,7 @@ def create_app(app_config: AppConfig):
 
         await rmtree(get_temporary_base_directory(app))
         await close_rest_apis()
+        await close_shared_session()
+        shutdown_jsonnet_evaluator()
 
     return app
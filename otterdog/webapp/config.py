@@ -28,6 +28,10 @@ class AppConfig:
     REDIS_URI = config("REDIS_URI", default="redis://redis:6379")
     GHPROXY_URI = config("GHPROXY_URI", default="http://ghproxy:8888")
 
+    # number of workers per process executing queued tasks and attempts per task before giving up
+    TASK_QUEUE_WORKERS = config("TASK_QUEUE_WORKERS", default=4, cast=int)
+    TASK_QUEUE_MAX_ATTEMPTS = config("TASK_QUEUE_MAX_ATTEMPTS", default=3, cast=int)
+
     OTTERDOG_CONFIG_OWNER = config("OTTERDOG_CONFIG_OWNER", default=None)
     OTTERDOG_CONFIG_REPO = config("OTTERDOG_CONFIG_REPO", default=None)
     OTTERDOG_CONFIG_PATH = config("OTTERDOG_CONFIG_PATH", default=None)
@@ -0,0 +1,362 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import importlib
+import json
+import time
+import uuid
+from enum import Enum
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+from quart import current_app
+from quart_redis import get_redis  # type: ignore
+from redis import RedisError
+
+if TYPE_CHECKING:
+    from quart import Quart
+
+    from otterdog.webapp.tasks import Task
+
+logger = getLogger(__name__)
+
+# time in seconds a claimed task is leased to a worker, the lease is extended
+# while the task is running, tasks of crashed workers are re-scheduled once it expired
+_LEASE_TIME = 60
+
+# interval in seconds in which idle workers check for due tasks enqueued by other processes
+_POLL_INTERVAL = 1.0
+
+# delay in seconds before a failed task is retried, doubled on each further attempt
+_RETRY_DELAY = 30
+
+# time in seconds running tasks are given to finish when shutting down
+_SHUTDOWN_TIMEOUT = 30
+
+# only tasks and values of classes defined in these packages are loaded from the queue
+_TASK_PACKAGE = "otterdog.webapp.tasks"
+_VALUE_PACKAGE = "otterdog"
+
+# adds a task, replacing a still pending task with the same coalescing key
+_ENQUEUE_SCRIPT = """
+local coalesced = 0
+redis.call('HSET', KEYS[2], 'payload', ARGV[2], 'key', ARGV[3], 'attempts', 0)
+if ARGV[3] ~= '' then
+  local previous = redis.call('GET', KEYS[3])
+  if previous and redis.call('ZREM', KEYS[1], previous) == 1 then
+    redis.call('DEL', ARGV[5] .. previous)
+    coalesced = 1
+  end
+  redis.call('SET', KEYS[3], ARGV[1])
+end
+redis.call('ZADD', KEYS[1], ARGV[4], ARGV[1])
+return coalesced
+"""
+
+# moves the first due task to the processing set, leasing it until the given time
+_CLAIM_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 1)
+if #ids == 0 then
+  return nil
+end
+local task_id = ids[1]
+local task_key = ARGV[3] .. task_id
+redis.call('ZREM', KEYS[1], task_id)
+redis.call('ZADD', KEYS[2], ARGV[2], task_id)
+local attempts = redis.call('HINCRBY', task_key, 'attempts', 1)
+local key = redis.call('HGET', task_key, 'key')
+if key and key ~= '' then
+  local key_ref = ARGV[4] .. key
+  if redis.call('GET', key_ref) == task_id then
+    redis.call('DEL', key_ref)
+  end
+end
+local payload = redis.call('HGET', task_key, 'payload')
+if not payload then
+  payload = ''
+end
+return {task_id, payload, attempts}
+"""
+
+# re-schedules all tasks whose lease has expired
+_RECOVER_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, task_id in ipairs(ids) do
+  redis.call('ZREM', KEYS[1], task_id)
+  redis.call('ZADD', KEYS[2], ARGV[1], task_id)
+end
+return #ids
+"""
+
+
+class TaskQueue:
+    """
+    A task queue backed by redis that is shared by all processes of the app.
+
+    Tasks are persisted until they have been executed. Tasks that fail or whose worker is terminated
+    are only retried if they are retryable, otherwise they are recorded as failed. While a task is pending, enqueueing
+    another task with the same coalescing key replaces it, so that only the latest one is executed.
+    """
+
+    def __init__(self, prefix: str = "otterdog:tasks"):
+        self._scheduled_key = f"{prefix}:scheduled"
+        self._processing_key = f"{prefix}:processing"
+        self._task_prefix = f"{prefix}:task:"
+        self._coalescing_prefix = f"{prefix}:key:"
+
+        self._workers = 0
+        self._max_attempts = 1
+
+        self._redis: Any = None
+        self._scripts: dict[str, Any] = {}
+
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._last_recovery = 0.0
+
+    def init_app(self, app: Quart) -> None:
+        self._workers = app.config["TASK_QUEUE_WORKERS"]
+        self._max_attempts = app.config["TASK_QUEUE_MAX_ATTEMPTS"]
+
+        @app.while_serving
+        async def run_workers():
+            self._stopping = asyncio.Event()
+            self._wakeup = asyncio.Event()
+
+            workers = [asyncio.create_task(self._work(app)) for _ in range(self._workers)]
+            app.logger.info(f"started task queue with {len(workers)} workers")
+
+            yield
+
+            self._stopping.set()
+            self._wakeup.set()
+
+            if len(workers) > 0:
+                _, pending = await asyncio.wait(workers, timeout=_SHUTDOWN_TIMEOUT)
+                for worker in pending:
+                    worker.cancel()
+
+                # tasks that have been interrupted are retried once their lease expires
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def enqueue(self, task: Task, delay: float = 0) -> None:
+        """
+        Enqueues the given task to be executed by one of the workers after the given delay in seconds.
+
+        If the task can not be stored in redis, it is executed as background task of the current app instead.
+        """
+
+        task_id = uuid.uuid4().hex
+        key = task.coalescing_key or ""
+
+        try:
+            coalesced = await self._run_script(
+                "enqueue",
+                keys=[self._scheduled_key, self._task_prefix + task_id, self._coalescing_prefix + key],
+                args=[task_id, _serialize_task(task), key, time.time() + delay, self._task_prefix],
+            )
+        except RedisError as ex:
+            logger.warning(f"failed to enqueue task '{task!r}', executing it in the background: {ex!s}")
+            current_app.add_background_task(task)
+            return
+
+        if coalesced == 1:
+            logger.debug(f"replaced pending task with key '{key}' by '{task!r}'")
+
+        self._wakeup.set()
+
+    async def _work(self, app: Quart) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self._recover_expired_tasks()
+                claimed = await self._claim()
+
+                if claimed is not None:
+                    task_id, payload, attempts = claimed
+                    await self._process(app, task_id, payload, attempts)
+                    continue
+            except RedisError as ex:
+                logger.warning(f"failed to process task from queue: {ex!s}")
+            except Exception as ex:
+                # keep the worker running, a claimed task is re-scheduled once its lease expires
+                logger.exception("failed to process task from queue", exc_info=ex)
+
+            self._wakeup.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=_POLL_INTERVAL)
+
+    async def _process(self, app: Quart, task_id: str, payload: bytes, attempts: int) -> None:
+        try:
+            task = _deserialize_task(payload)
+        except (ValueError, KeyError, TypeError, ImportError, AttributeError) as ex:
+            logger.error(f"failed to load task '{task_id}', discarding it: {ex!s}")
+            await self._complete(task_id)
+            return
+
+        # tasks are only executed again after a failure if they are retryable,
+        # so any other task with more than one attempt has been interrupted.
+        if attempts > self._max_attempts or (attempts > 1 and not task.retryable):
+            logger.error(f"task '{task!r}' has been interrupted {attempts - 1} time(s), discarding it")
+
+            try:
+                async with app.app_context():
+                    await task.fail(f"task has been interrupted {attempts - 1} time(s)")
+            except Exception as ex:
+                logger.exception(f"failed to record interrupted task '{task!r}'", exc_info=ex)
+
+            await self._complete(task_id)
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(task_id))
+        try:
+            async with app.app_context():
+                result = await task.execute()
+        finally:
+            heartbeat.cancel()
+
+        try:
+            if isinstance(result, Exception) and task.retryable and attempts < self._max_attempts:
+                delay = _RETRY_DELAY * 2 ** (attempts - 1)
+                logger.info(f"retrying task '{task!r}' in {delay}s, attempt {attempts}/{self._max_attempts} failed")
+                await self._retry(task_id, delay)
+            else:
+                await self._complete(task_id)
+        except RedisError as ex:
+            logger.warning(f"failed to update state of task '{task!r}': {ex!s}")
+
+    async def _claim(self) -> tuple[str, bytes, int] | None:
+        now = time.time()
+        result = await self._run_script(
+            "claim",
+            keys=[self._scheduled_key, self._processing_key],
+            args=[now, now + _LEASE_TIME, self._task_prefix, self._coalescing_prefix],
+        )
+
+        if result is None:
+            return None
+
+        task_id, payload, attempts = result
+        return task_id.decode("utf-8"), payload, int(attempts)
+
+    async def _heartbeat(self, task_id: str) -> None:
+        while True:
+            await asyncio.sleep(_LEASE_TIME / 3)
+            try:
+                await self._get_redis().zadd(self._processing_key, {task_id: time.time() + _LEASE_TIME}, xx=True)
+            except RedisError as ex:
+                logger.warning(f"failed to extend lease of task '{task_id}': {ex!s}")
+
+    async def _retry(self, task_id: str, delay: float) -> None:
+        async with self._get_redis().pipeline(transaction=True) as pipe:
+            pipe.zrem(self._processing_key, task_id)
+            pipe.zadd(self._scheduled_key, {task_id: time.time() + delay})
+            await pipe.execute()
+
+    async def _complete(self, task_id: str) -> None:
+        async with self._get_redis().pipeline(transaction=True) as pipe:
+            pipe.zrem(self._processing_key, task_id)
+            pipe.delete(self._task_prefix + task_id)
+            await pipe.execute()
+
+    async def _recover_expired_tasks(self) -> None:
+        now = time.time()
+        if now - self._last_recovery < _LEASE_TIME / 2:
+            return
+
+        self._last_recovery = now
+        recovered = await self._run_script("recover", keys=[self._processing_key, self._scheduled_key], args=[now])
+        if recovered > 0:
+            logger.info(f"re-scheduled {recovered} task(s) with expired lease")
+
+    async def _run_script(self, name: str, keys: list[str], args: list[Any]) -> Any:
+        redis = self._get_redis()
+        if redis is not self._redis:
+            self._redis = redis
+            self._scripts = {
+                "enqueue": redis.register_script(_ENQUEUE_SCRIPT),
+                "claim": redis.register_script(_CLAIM_SCRIPT),
+                "recover": redis.register_script(_RECOVER_SCRIPT),
+            }
+
+        return await self._scripts[name](keys=keys, args=args)
+
+    @staticmethod
+    def _get_redis() -> Any:
+        return get_redis()
+
+
+def _serialize_task(task: Task) -> str:
+    """
+    Serializes the given task as json, consisting of its type and the arguments of its constructor.
+
+    Tasks are not pickled as anyone with write access to redis could otherwise execute code when they are loaded.
+    """
+
+    if not dataclasses.is_dataclass(task):
+        raise TypeError(f"task '{task!r}' is not a dataclass")
+
+    args = {field.name: _encode_value(getattr(task, field.name)) for field in dataclasses.fields(task) if field.init}
+    return json.dumps({"type": _get_class_name(type(task)), "args": args})
+
+
+def _deserialize_task(payload: bytes) -> Task:
+    from otterdog.webapp.tasks import Task
+
+    data = json.loads(payload)
+    task_class = _load_class(data["type"], _TASK_PACKAGE, Task)
+    return task_class(**{name: _decode_value(value) for name, value in data["args"].items()})
+
+
+def _encode_value(value: Any) -> Any:
+    if value is None or (isinstance(value, str | int | float | bool) and not isinstance(value, Enum)):
+        return value
+    elif isinstance(value, list):
+        return [_encode_value(x) for x in value]
+    elif isinstance(value, Enum):
+        return {"enum": _get_class_name(type(value)), "value": value.value}
+    elif isinstance(value, BaseModel):
+        return {"model": _get_class_name(type(value)), "data": value.model_dump(mode="json")}
+    else:
+        raise TypeError(f"unsupported task argument '{value!r}'")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_value(x) for x in value]
+    elif isinstance(value, dict):
+        if "enum" in value:
+            return _load_class(value["enum"], _VALUE_PACKAGE, Enum)(value["value"])
+        else:
+            return _load_class(value["model"], _VALUE_PACKAGE, BaseModel).model_validate(value["data"])
+    else:
+        return value
+
+
+def _get_class_name(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _load_class(name: str, package: str, base_class: type) -> Any:
+    module_name, _, class_name = name.partition(":")
+    if module_name != package and not module_name.startswith(f"{package}."):
+        raise ValueError(f"class '{name}' is not part of package '{package}'")
+
+    cls: Any = importlib.import_module(module_name)
+    for attr in class_name.split("."):
+        cls = getattr(cls, attr)
+
+    if not isinstance(cls, type) or not issubclass(cls, base_class):
+        raise TypeError(f"class '{name}' is not a subclass of '{base_class.__name__}'")
+
+    return cls
@@ -28,6 +28,7 @@ from otterdog.webapp.db.service import (
 )
 from otterdog.webapp.utils import (
     get_graphql_api_for_installation,
+    get_installation_identity,
     get_rest_api_for_installation,
     get_temporary_base_directory,
 )
@@ -51,9 +52,31 @@ class Task(ABC, Generic[T]):
     def create_task_model(self) -> TaskModel | None:
         return None
 
+    @property
+    def coalescing_key(self) -> str | None:
+        """
+        While queued, a task is replaced by a later task with the same key, None disables coalescing.
+        """
+        return None
+
+    @property
+    def retryable(self) -> bool:
+        """
+        Indicates whether a failed task can be executed again without side effects, e.g. on the live organization.
+        """
+        return False
+
     async def __call__(self, *args, **kwargs):
         await self.execute()
 
+    async def fail(self, reason: str) -> None:
+        """
+        Records the task as failed without executing it, e.g. when it has been interrupted.
+        """
+        task_model = self.create_task_model()
+        if task_model is not None:
+            await fail_task(task_model, RuntimeError(reason))
+
     async def execute(self) -> T | None:
         self.logger.debug(f"executing task '{self!r}'")
 
@@ -163,7 +186,7 @@ class InstallationBasedTask(Protocol):
         else:
             cache_stats = (
                 f"rest: {self.rest_statistics.cached_responses}/{self.rest_statistics.total_requests} "
-                f"request(s) cached"
+                f"request(s) cached, {self.rest_statistics.revalidated_responses} revalidated"
             )
 
         if self.rest_statistics.remaining_rate_limit != -1:
@@ -208,6 +231,15 @@ class InstallationBasedTask(Protocol):
 
             yield org_config
 
+    async def get_issue_comments(
+        self,
+        org_id: str,
+        repo_name: str,
+        pull_request_number: int,
+    ) -> list[dict[str, Any]]:
+        graphql_api = await self.graphql_api
+        return await graphql_api.get_issue_comments(org_id, repo_name, pull_request_number)
+
     async def minimize_outdated_comments(
         self,
         org_id: str,
@@ -215,15 +247,16 @@ class InstallationBasedTask(Protocol):
         pull_request_number: int,
         matching_header: str,
     ) -> None:
-        graphql_api = await self.graphql_api
-        comments = await graphql_api.get_issue_comments(org_id, repo_name, pull_request_number)
-        for comment in comments:
-            comment_id = comment["id"]
-            body = comment["body"]
-            is_minimized = comment["isMinimized"]
+        comments = await self.get_issue_comments(org_id, repo_name, pull_request_number)
+        outdated_comments = [
+            comment
+            for comment in comments
+            if bool(comment["isMinimized"]) is False and matching_header in comment["body"]
+        ]
 
-            if bool(is_minimized) is False and matching_header in body:
-                await graphql_api.minimize_comment(comment_id, "OUTDATED")
+        if len(outdated_comments) > 0:
+            graphql_api = await self.graphql_api
+            await graphql_api.minimize_comments([comment["id"] for comment in outdated_comments], "OUTDATED")
 
     async def comment_with_header_exists(
         self,
@@ -232,8 +265,7 @@ class InstallationBasedTask(Protocol):
         pull_request_number: int,
         matching_header: str,
     ):
-        graphql_api = await self.graphql_api
-        comments = await graphql_api.get_issue_comments(org_id, repo_name, pull_request_number)
+        comments = await self.get_issue_comments(org_id, repo_name, pull_request_number)
         for comment in comments:
             body = comment["body"]
             is_minimized = comment["isMinimized"]
@@ -275,7 +307,11 @@ async def get_organization_config(
         org_model.github_id,
         org_model.config_repo,
         org_model.base_template,
-        {"provider": "inmemory", "api_token": token},
+        {
+            "provider": "inmemory",
+            "api_token": token,
+            "api_token_identity": get_installation_identity(org_model.installation_id),
+        },
         base_dir,
         work_dir,
     )
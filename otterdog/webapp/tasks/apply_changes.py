@@ -22,6 +22,7 @@ from otterdog.webapp.utils import (
     get_admin_teams,
     get_full_admin_team_slugs,
     get_otterdog_config,
+    invalidate_live_org,
 )
 from otterdog.webapp.webhook.github_models import PullRequest
 
@@ -209,6 +210,9 @@ class ApplyChangesTask(InstallationBasedTask, Task[ApplyResult]):
 
                 apply_result.apply_output = str(ex)
                 apply_result.apply_success = False
+            finally:
+                # the live organization has potentially been modified, do not use it for sync checks anymore
+                invalidate_live_org(self.org_id)
 
             self.merge_statistics_from_provider(operation.gh_client)
 
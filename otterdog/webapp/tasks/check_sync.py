@@ -29,13 +29,17 @@ from otterdog.webapp.utils import (
     escape_for_github,
     fetch_config_from_github,
     get_full_admin_team_slugs,
+    get_live_org,
     get_otterdog_config,
+    has_live_org,
     make_aware_utc,
 )
 from otterdog.webapp.webhook.github_models import PullRequest
 
 if TYPE_CHECKING:
+    from otterdog.jsonnet import JsonnetConfig
     from otterdog.models import LivePatch
+    from otterdog.models.github_organization import GitHubOrganization
     from otterdog.operations.diff_operation import DiffStatus
 
 
@@ -62,6 +66,14 @@ class CheckConfigurationInSyncTask(InstallationBasedTask, Task[bool]):
         # created from a PR comment, this should be made cleaner
         return isinstance(self.pull_request_or_number, int)
 
+    @property
+    def coalescing_key(self) -> str | None:
+        return f"{type(self).__name__}:{self.org_id}/{self.repo_name}#{self.pull_request_number}"
+
+    @property
+    def retryable(self) -> bool:
+        return True
+
     def create_task_model(self):
         return TaskModel(
             type=type(self).__name__,
@@ -123,10 +135,12 @@ class CheckConfigurationInSyncTask(InstallationBasedTask, Task[bool]):
                         await self._update_final_status(commit_status[0]["state"] == "success")
                         return False
 
-        latest_sync_or_apply_task = await get_latest_sync_task_for_organization(self.org_id, self.repo_name)
         # to avoid secondary rate limit failures, backoff at least 1 min before running another sync task
-        if latest_sync_or_apply_task is not None:
-            await backoff_if_needed(latest_sync_or_apply_task.created_at, timedelta(minutes=1))
+        # unless the live organization retrieved by a recent sync task can be re-used
+        if not has_live_org(self.org_id):
+            latest_sync_or_apply_task = await get_latest_sync_task_for_organization(self.org_id, self.repo_name)
+            if latest_sync_or_apply_task is not None:
+                await backoff_if_needed(latest_sync_or_apply_task.created_at, timedelta(minutes=1))
 
         await self._create_pending_status()
 
@@ -156,7 +170,7 @@ class CheckConfigurationInSyncTask(InstallationBasedTask, Task[bool]):
 
             output = StringIO()
             printer = IndentingPrinter(output, log_level=LogLevel.ERROR)
-            operation = PlanOperation(True, "*", False, False, "")
+            operation = _SharedLiveOrgPlanOperation(True, "*", False, False, "")
             # set concurrency to 20 to avoid hitting secondary rate limits with installation tokens
             operation.concurrency = 20
 
@@ -262,3 +276,18 @@ class CheckConfigurationInSyncTask(InstallationBasedTask, Task[bool]):
 
 def _get_webhook_sync_context() -> str:
     return current_app.config["GITHUB_WEBHOOK_SYNC_CONTEXT"]
+
+
+class _SharedLiveOrgPlanOperation(PlanOperation):
+    """
+    A plan operation that shares the live organization with concurrent and subsequent sync checks.
+    """
+
+    def stream_current_org(self) -> bool:
+        return False
+
+    async def load_current_org(self, github_id: str, jsonnet_config: JsonnetConfig) -> GitHubOrganization:
+        async def load() -> GitHubOrganization:
+            return await super(_SharedLiveOrgPlanOperation, self).load_current_org(github_id, jsonnet_config)
+
+        return await get_live_org(github_id, load)
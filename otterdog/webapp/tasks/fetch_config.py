@@ -8,8 +8,9 @@
 
 from dataclasses import dataclass
 
+from otterdog.cache import get_jsonnet_cache
+from otterdog.jsonnet_cache import jsonnet_evaluate_file_cached
 from otterdog.models.github_organization import GitHubOrganization
-from otterdog.utils import jsonnet_evaluate_file
 from otterdog.webapp.db.models import ConfigurationModel, StatisticsModel, TaskModel
 from otterdog.webapp.db.service import save_config, save_statistics
 from otterdog.webapp.tasks import InstallationBasedTask, Task
@@ -49,7 +50,7 @@ class FetchConfigTask(InstallationBasedTask, Task[None]):
             )
 
             # save configuration
-            config_data = jsonnet_evaluate_file(config_file)
+            config_data = await jsonnet_evaluate_file_cached(config_file, get_jsonnet_cache())
             config = ConfigurationModel(  # type: ignore
                 github_id=self.org_id,
                 project_name=org_config.name,
@@ -24,12 +24,15 @@ from otterdog.webapp.tasks import InstallationBasedTask, Task
 from otterdog.webapp.utils import (
     escape_for_github,
     fetch_config_from_github,
+    get_base_org,
     get_full_admin_team_slugs,
     get_otterdog_config,
 )
 from otterdog.webapp.webhook.github_models import PullRequest
 
 if TYPE_CHECKING:
+    from otterdog.jsonnet import JsonnetConfig
+    from otterdog.models.github_organization import GitHubOrganization
     from otterdog.operations.diff_operation import DiffStatus
     from otterdog.providers.github.rest import RestApi
 
@@ -66,6 +69,14 @@ class ValidatePullRequestTask(InstallationBasedTask, Task[ValidationResult]):
     def check_base_config(self) -> bool:
         return True
 
+    @property
+    def coalescing_key(self) -> str | None:
+        return f"{type(self).__name__}:{self.org_id}/{self.repo_name}#{self.pull_request_number}"
+
+    @property
+    def retryable(self) -> bool:
+        return True
+
     def create_task_model(self):
         return TaskModel(
             type=type(self).__name__,
@@ -110,7 +121,7 @@ class ValidatePullRequestTask(InstallationBasedTask, Task[ValidationResult]):
 
             # get BASE config
             base_file = org_config_file + "-BASE"
-            await fetch_config_from_github(
+            base_sha = await fetch_config_from_github(
                 rest_api,
                 self.org_id,
                 self.org_id,
@@ -148,7 +159,7 @@ class ValidatePullRequestTask(InstallationBasedTask, Task[ValidationResult]):
             else:
                 output = StringIO()
                 printer = IndentingPrinter(output, log_level=self.log_level)
-                operation = LocalPlanOperation("-BASE", "*", False, False, "")
+                operation = _CachedBaseLocalPlanOperation(base_sha, "-BASE", "*", False, False, "")
 
                 def callback(org_id: str, diff_status: DiffStatus, patches: list[LivePatch]):
                     validation_result.requires_secrets = any(x.requires_secrets() for x in patches)
@@ -281,3 +292,28 @@ class ValidatePullRequestTask(InstallationBasedTask, Task[ValidationResult]):
 
 def _get_webhook_validation_context() -> str:
     return current_app.config["GITHUB_WEBHOOK_VALIDATION_CONTEXT"]
+
+
+class _CachedBaseLocalPlanOperation(LocalPlanOperation):
+    """
+    A local plan operation that re-uses the evaluated BASE configuration for all pull requests
+    as long as the configuration of the default branch does not change.
+    """
+
+    def __init__(
+        self,
+        base_sha: str,
+        suffix: str,
+        repo_filter: str,
+        update_webhooks: bool,
+        update_secrets: bool,
+        update_filter: str,
+    ) -> None:
+        super().__init__(suffix, repo_filter, update_webhooks, update_secrets, update_filter)
+        self.base_sha = base_sha
+
+    async def load_current_org(self, github_id: str, jsonnet_config: JsonnetConfig) -> GitHubOrganization:
+        async def load() -> GitHubOrganization:
+            return await super(_CachedBaseLocalPlanOperation, self).load_current_org(github_id, jsonnet_config)
+
+        return await get_base_org(github_id, self.base_sha, jsonnet_config.org_config_file + self.suffix, load)
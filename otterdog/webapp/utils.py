@@ -9,6 +9,8 @@
 import asyncio
 import re
 import sys
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from functools import cache
 from logging import getLogger
@@ -20,6 +22,8 @@ from quart_redis import get_redis  # type: ignore
 
 from otterdog.cache import get_github_cache
 from otterdog.config import OtterdogConfig
+from otterdog.jsonnet_cache import get_cache_key_async
+from otterdog.models.github_organization import GitHubOrganization
 from otterdog.providers.github.auth import app_auth, token_auth
 from otterdog.providers.github.cache.ghproxy import ghproxy_cache
 from otterdog.providers.github.cache.redis import redis_cache
@@ -31,10 +35,30 @@ from otterdog.webapp.policies import Policy, read_policy
 logger = getLogger(__name__)
 
 _OTTERDOG_CONFIG: OtterdogConfig | None = None
-_CREATE_INSTALLATION_TOKEN_LOCK = asyncio.Lock()
+
+# installation tokens are kept in memory in front of redis, tokens are only returned if they are valid
+# for at least the minimum validity, and are refreshed in the background if they expire soon
+_INSTALLATION_TOKENS_MAX_SIZE = 256
+_INSTALLATION_TOKEN_MIN_VALIDITY = timedelta(minutes=1)
+_INSTALLATION_TOKEN_REFRESH_VALIDITY = timedelta(minutes=10)
+_INSTALLATION_TOKENS: OrderedDict[int, tuple[str, datetime]] = OrderedDict()
+_INSTALLATION_TOKEN_LOCKS: dict[int, asyncio.Lock] = {}
+_INSTALLATION_TOKEN_REFRESHES: dict[int, asyncio.Task] = {}
 
 _GLOBAL_POLICIES: list[Policy] | None = None
 
+# time a live organization retrieved from GitHub is shared between subsequent sync checks
+_LIVE_ORG_EXPIRATION = timedelta(minutes=2)
+_LIVE_ORGS: dict[str, tuple[datetime, GitHubOrganization]] = {}
+# locks and generations are only retained while a retrieval of the organization is pending
+_LIVE_ORG_LOCKS: dict[str, asyncio.Lock] = {}
+_LIVE_ORG_LOCK_USERS: dict[str, int] = {}
+_LIVE_ORG_GENERATIONS: dict[str, int] = {}
+
+# number of evaluated configurations of the default branch that are shared between pull request validations
+_BASE_ORGS_MAX_SIZE = 32
+_BASE_ORGS: OrderedDict[tuple[str, str, str], GitHubOrganization] = OrderedDict()
+
 
 def get_github_redis_cache(app_config):
     return redis_cache(app_config["REDIS_URI"], get_redis())
@@ -60,47 +84,123 @@ def get_rest_api_for_app() -> RestApi:
 
 
 async def get_token_for_installation(installation_id: int) -> tuple[str, datetime]:
+    cached_token = _get_cached_installation_token(installation_id)
+    if cached_token is not None:
+        return cached_token
+
+    lock = _INSTALLATION_TOKEN_LOCKS.setdefault(installation_id, asyncio.Lock())
+    async with lock:
+        # the token might have been retrieved while waiting for the lock
+        cached_token = _get_cached_installation_token(installation_id)
+        if cached_token is not None:
+            return cached_token
+
+        token, expires_at = await _retrieve_token_for_installation(installation_id, _INSTALLATION_TOKEN_MIN_VALIDITY)
+        _cache_installation_token(installation_id, token, expires_at)
+        return token, expires_at
+
+
+def _get_cached_installation_token(installation_id: int) -> tuple[str, datetime] | None:
+    cached_token = _INSTALLATION_TOKENS.get(installation_id)
+    if cached_token is None:
+        return None
+
+    _, expires_at = cached_token
+    remaining_validity = expires_at - current_utc_time()
+
+    # add a buffer of 1 min for expiration to be safe
+    # the assumption is that any processing using the returned token
+    # will not take longer than 1 min (in fact will be much shorter)
+    if remaining_validity <= _INSTALLATION_TOKEN_MIN_VALIDITY:
+        del _INSTALLATION_TOKENS[installation_id]
+        return None
+
+    if remaining_validity <= _INSTALLATION_TOKEN_REFRESH_VALIDITY:
+        _schedule_installation_token_refresh(installation_id)
+
+    _INSTALLATION_TOKENS.move_to_end(installation_id)
+    return cached_token
+
+
+def _cache_installation_token(installation_id: int, token: str, expires_at: datetime) -> None:
+    _INSTALLATION_TOKENS[installation_id] = (token, expires_at)
+    _INSTALLATION_TOKENS.move_to_end(installation_id)
+
+    if len(_INSTALLATION_TOKENS) > _INSTALLATION_TOKENS_MAX_SIZE:
+        _INSTALLATION_TOKENS.popitem(last=False)
+
+
+def _schedule_installation_token_refresh(installation_id: int) -> None:
+    if installation_id in _INSTALLATION_TOKEN_REFRESHES:
+        return
+
+    async def refresh() -> None:
+        lock = _INSTALLATION_TOKEN_LOCKS.setdefault(installation_id, asyncio.Lock())
+        async with lock:
+            token, expires_at = await _retrieve_token_for_installation(
+                installation_id, _INSTALLATION_TOKEN_REFRESH_VALIDITY
+            )
+            _cache_installation_token(installation_id, token, expires_at)
+
+    def refresh_done(task: asyncio.Task) -> None:
+        del _INSTALLATION_TOKEN_REFRESHES[installation_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                f"failed to refresh installation token for installation '{installation_id}'",
+                exc_info=task.exception(),
+            )
+
+    refresh_task = asyncio.create_task(refresh())
+    _INSTALLATION_TOKEN_REFRESHES[installation_id] = refresh_task
+    refresh_task.add_done_callback(refresh_done)
+
+
+async def _retrieve_token_for_installation(installation_id: int, min_validity: timedelta) -> tuple[str, datetime]:
+    """
+    Returns the token for an installation stored in redis if it is still valid for
+    the given time, otherwise a new token is created and stored in redis.
+    """
+
     redis = get_redis()
 
-    async with _CREATE_INSTALLATION_TOKEN_LOCK:
-        installation_key = f"token:{installation_id}"
-        current_data = decode_bytes_dict(await redis.hgetall(installation_key))
-
-        cached_token = current_data.get("token", None)
-        expires_at_str = current_data.get("expires_at", None)
-
-        if cached_token is not None and expires_at_str is not None:
-            expires_at = datetime.fromisoformat(expires_at_str)
-            # add a buffer of 1 min for expiration to be safe
-            # the assumption is that any processing using the returned token
-            # will not take longer than 1 min (in fact will be much shorter)
-            if expires_at > (current_utc_time() + timedelta(minutes=1)):
-                logger.info(
-                    f"re-using installation token for installation '{installation_id}' expiring at '{expires_at}'"
-                )
-                return cached_token, expires_at
-
-        logger.info(f"creating new installation token for installation '{installation_id}'")
-        token, expires_at = await get_rest_api_for_app().app.create_installation_access_token(str(installation_id))
-        await redis.hset(
-            installation_key,
-            mapping={"token": token, "expires_at": expires_at.isoformat()},
-        )
-        return token, expires_at
+    installation_key = f"token:{installation_id}"
+    current_data = decode_bytes_dict(await redis.hgetall(installation_key))
+
+    cached_token = current_data.get("token", None)
+    expires_at_str = current_data.get("expires_at", None)
+
+    if cached_token is not None and expires_at_str is not None:
+        expires_at = datetime.fromisoformat(expires_at_str)
+        if expires_at > (current_utc_time() + min_validity):
+            logger.info(f"re-using installation token for installation '{installation_id}' expiring at '{expires_at}'")
+            return cached_token, expires_at
+
+    logger.info(f"creating new installation token for installation '{installation_id}'")
+    token, expires_at = await get_rest_api_for_app().app.create_installation_access_token(str(installation_id))
+    await redis.hset(
+        installation_key,
+        mapping={"token": token, "expires_at": expires_at.isoformat()},
+    )
+    return token, expires_at
 
 
 def decode_bytes_dict(data: dict[bytes, bytes]) -> dict[str, str]:
     return {k.decode("utf-8"): v.decode("utf-8") for k, v in data.items()}
 
 
+def get_installation_identity(installation_id: int) -> str:
+    """Returns an identity of the given installation that is retained when its token is renewed."""
+    return f"installation:{installation_id}"
+
+
 async def get_rest_api_for_installation(installation_id: int) -> RestApi:
     token, _ = await get_token_for_installation(installation_id)
-    return RestApi(token_auth(token), get_github_cache())
+    return RestApi(token_auth(token, get_installation_identity(installation_id)), get_github_cache())
 
 
 async def get_graphql_api_for_installation(installation_id: int) -> GraphQLClient:
     token, _ = await get_token_for_installation(installation_id)
-    return GraphQLClient(token_auth(token), get_github_cache())
+    return GraphQLClient(token_auth(token, get_installation_identity(installation_id)), get_github_cache())
 
 
 def get_app_root_directory(app: Quart | None = None) -> str:
@@ -196,6 +296,104 @@ async def _load_global_policies(ref: str | None = None) -> list[Policy]:
     return policies
 
 
+async def get_live_org(
+    org_id: str,
+    loader: Callable[[], Awaitable[GitHubOrganization]],
+) -> GitHubOrganization:
+    """
+    Returns the live organization with the given id, retrieving it with the given loader
+    only if it has not been retrieved recently.
+
+    Concurrent calls for the same organization wait for a single retrieval, the returned
+    organization is shared and must not be modified.
+    """
+
+    lock = _LIVE_ORG_LOCKS.setdefault(org_id, asyncio.Lock())
+    _LIVE_ORG_LOCK_USERS[org_id] = _LIVE_ORG_LOCK_USERS.get(org_id, 0) + 1
+
+    try:
+        async with lock:
+            now = current_utc_time()
+            _evict_expired_live_orgs(now)
+
+            cached = _LIVE_ORGS.get(org_id)
+            if cached is not None:
+                logger.debug(f"using live organization '{org_id}' retrieved at {cached[0]}")
+                return cached[1]
+
+            generation = _LIVE_ORG_GENERATIONS.get(org_id, 0)
+            live_org = await loader()
+
+            # the organization might have changed while it was retrieved, use the start time
+            # and do not store it at all if it has been invalidated in the meantime
+            if _LIVE_ORG_GENERATIONS.get(org_id, 0) == generation:
+                _LIVE_ORGS[org_id] = (now, live_org)
+
+            return live_org
+    finally:
+        users = _LIVE_ORG_LOCK_USERS.pop(org_id) - 1
+        if users > 0:
+            _LIVE_ORG_LOCK_USERS[org_id] = users
+        else:
+            del _LIVE_ORG_LOCKS[org_id]
+            _LIVE_ORG_GENERATIONS.pop(org_id, None)
+
+
+def has_live_org(org_id: str) -> bool:
+    _evict_expired_live_orgs(current_utc_time())
+    return org_id in _LIVE_ORGS
+
+
+def invalidate_live_org(org_id: str) -> None:
+    # only pending retrievals need to be aware of an invalidation
+    if org_id in _LIVE_ORG_LOCKS:
+        _LIVE_ORG_GENERATIONS[org_id] = _LIVE_ORG_GENERATIONS.get(org_id, 0) + 1
+
+    _LIVE_ORGS.pop(org_id, None)
+    _evict_expired_live_orgs(current_utc_time())
+
+
+def _evict_expired_live_orgs(now: datetime) -> None:
+    for expired_org_id in [k for k, (t, _) in _LIVE_ORGS.items() if now - t >= _LIVE_ORG_EXPIRATION]:
+        del _LIVE_ORGS[expired_org_id]
+
+
+async def get_base_org(
+    org_id: str,
+    config_sha: str,
+    config_file: str,
+    loader: Callable[[], Awaitable[GitHubOrganization]],
+) -> GitHubOrganization:
+    """
+    Returns the organization evaluated from the given configuration file of the default branch,
+    re-using a previous evaluation of the same configuration with the same template.
+
+    The returned organization is shared and must only be modified in an idempotent way.
+    """
+
+    # the cache key of the file covers its content and all its imports, including the template
+    key = (org_id, config_sha, await get_cache_key_async(config_file))
+
+    base_org = _BASE_ORGS.get(key)
+    if base_org is not None:
+        logger.debug(f"using evaluated configuration '{config_sha}' of organization '{org_id}'")
+        _BASE_ORGS.move_to_end(key)
+        return base_org
+
+    base_org = await loader()
+
+    _BASE_ORGS[key] = base_org
+    if len(_BASE_ORGS) > _BASE_ORGS_MAX_SIZE:
+        _BASE_ORGS.popitem(last=False)
+
+    return base_org
+
+
+def invalidate_base_orgs(org_id: str) -> None:
+    for key in [k for k in _BASE_ORGS if k[0] == org_id]:
+        del _BASE_ORGS[key]
+
+
 def get_admin_teams() -> list[str]:
     teams = str(current_app.config["GITHUB_ADMIN_TEAMS"])
     return teams.split(",")
@@ -11,6 +11,7 @@ from logging import getLogger
 from pydantic import ValidationError
 from quart import Response, current_app
 
+from otterdog.webapp import task_queue
 from otterdog.webapp.db.service import (
     get_installation,
     update_installation_status,
@@ -25,7 +26,7 @@ from otterdog.webapp.tasks.help_comment import HelpCommentTask
 from otterdog.webapp.tasks.retrieve_team_membership import RetrieveTeamMembershipTask
 from otterdog.webapp.tasks.update_pull_request import UpdatePullRequestTask
 from otterdog.webapp.tasks.validate_pull_request import ValidatePullRequestTask
-from otterdog.webapp.utils import refresh_global_policies, refresh_otterdog_config
+from otterdog.webapp.utils import invalidate_base_orgs, refresh_global_policies, refresh_otterdog_config
 
 from .comment_handlers import (
     ApplyCommentHandler,
@@ -86,7 +87,7 @@ async def on_pull_request_received(data):
         "reopened",
         "synchronize",
     ]:
-        current_app.add_background_task(
+        await task_queue.enqueue(
             UpdatePullRequestTask(
                 event.installation.id,
                 event.organization.login,
@@ -96,7 +97,7 @@ async def on_pull_request_received(data):
         )
 
     if event.action in ["opened", "ready_for_review"] and event.pull_request.draft is False:
-        current_app.add_background_task(
+        await task_queue.enqueue(
             HelpCommentTask(
                 event.installation.id,
                 event.organization.login,
@@ -105,7 +106,7 @@ async def on_pull_request_received(data):
             )
         )
 
-        current_app.add_background_task(
+        await task_queue.enqueue(
             RetrieveTeamMembershipTask(
                 event.installation.id,
                 event.organization.login,
@@ -120,7 +121,7 @@ async def on_pull_request_received(data):
         and event.pull_request.draft is False
     ):
         # schedule a validate task
-        current_app.add_background_task(
+        await task_queue.enqueue(
             ValidatePullRequestTask(
                 event.installation.id,
                 event.organization.login,
@@ -130,7 +131,7 @@ async def on_pull_request_received(data):
         )
 
         # schedule a check-sync task
-        current_app.add_background_task(
+        await task_queue.enqueue(
             CheckConfigurationInSyncTask(
                 event.installation.id,
                 event.organization.login,
@@ -143,7 +144,7 @@ async def on_pull_request_received(data):
         if event.pull_request.base.ref != event.repository.default_branch:
             return success()
 
-        current_app.add_background_task(
+        await task_queue.enqueue(
             ApplyChangesTask(
                 event.installation.id,
                 event.organization.login,
@@ -170,7 +171,7 @@ async def on_pull_request_review_received(data):
         return success()
 
     if event.action in ["submitted", "edited", "dismissed"]:
-        current_app.add_background_task(
+        await task_queue.enqueue(
             UpdatePullRequestTask(
                 event.installation.id,
                 event.organization.login,
@@ -205,7 +206,7 @@ async def on_issue_comment_received(data):
         for handler in comment_handlers:
             match = handler.matches(event.comment.body)
             if match is not None:
-                handler.process(match, event)
+                await handler.process(match, event)
                 break
 
     return success()
@@ -228,7 +229,10 @@ async def on_push_received(data):
         if not await targets_config_repo(event.repository.name, event.installation.id):
             return success()
 
-        current_app.add_background_task(
+        # pull requests need to be validated against the new configuration of the default branch
+        invalidate_base_orgs(event.organization.login)
+
+        await task_queue.enqueue(
             FetchConfigTask(
                 event.installation.id,
                 event.organization.login,
@@ -249,7 +253,7 @@ async def on_push_received(data):
         policies_modified = any(map(modifies_any_policy, event.commits))
         if policies_modified is True:
             global_policies = await refresh_global_policies()
-            current_app.add_background_task(
+            await task_queue.enqueue(
                 FetchPoliciesTask(
                     event.installation.id,
                     event.organization.login,
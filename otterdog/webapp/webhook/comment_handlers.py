@@ -13,9 +13,8 @@ from abc import ABC, abstractmethod
 from functools import cached_property
 from typing import TYPE_CHECKING
 
-from quart import current_app
-
 from otterdog.utils import LogLevel
+from otterdog.webapp import task_queue
 
 if TYPE_CHECKING:
     from re import Match, Pattern
@@ -37,25 +36,25 @@ class CommentHandler(ABC):
         return self.pattern.match(comment)
 
     @abstractmethod
-    def process(self, match: Match, event: IssueCommentEvent) -> None:
+    async def process(self, match: Match, event: IssueCommentEvent) -> None:
         pass
 
     @staticmethod
-    def schedule_task(task: Task) -> None:
-        current_app.add_background_task(task)
+    async def schedule_task(task: Task) -> None:
+        await task_queue.enqueue(task)
 
 
 class HelpCommentHandler(CommentHandler):
     def _create_pattern(self) -> re.Pattern:
         return re.compile(r"/otterdog\s+help")
 
-    def process(self, match: re.Match, event: IssueCommentEvent) -> None:
+    async def process(self, match: re.Match, event: IssueCommentEvent) -> None:
         from otterdog.webapp.tasks.help_comment import HelpCommentTask
 
         assert event.installation is not None
         assert event.organization is not None
 
-        self.schedule_task(
+        await self.schedule_task(
             HelpCommentTask(
                 event.installation.id,
                 event.organization.login,
@@ -69,7 +68,7 @@ class TeamInfoCommentHandler(CommentHandler):
     def _create_pattern(self) -> re.Pattern:
         return re.compile(r"/otterdog\s+team-info")
 
-    def process(self, match: re.Match, event: IssueCommentEvent) -> None:
+    async def process(self, match: re.Match, event: IssueCommentEvent) -> None:
         from otterdog.webapp.tasks.retrieve_team_membership import (
             RetrieveTeamMembershipTask,
         )
@@ -77,7 +76,7 @@ class TeamInfoCommentHandler(CommentHandler):
         assert event.installation is not None
         assert event.organization is not None
 
-        self.schedule_task(
+        await self.schedule_task(
             RetrieveTeamMembershipTask(
                 event.installation.id,
                 event.organization.login,
@@ -91,13 +90,13 @@ class CheckSyncCommentHandler(CommentHandler):
     def _create_pattern(self) -> re.Pattern:
         return re.compile(r"/otterdog\s+check-sync")
 
-    def process(self, match: re.Match, event: IssueCommentEvent) -> None:
+    async def process(self, match: re.Match, event: IssueCommentEvent) -> None:
         from otterdog.webapp.tasks.check_sync import CheckConfigurationInSyncTask
 
         assert event.installation is not None
         assert event.organization is not None
 
-        self.schedule_task(
+        await self.schedule_task(
             CheckConfigurationInSyncTask(
                 event.installation.id,
                 event.organization.login,
@@ -111,13 +110,13 @@ class DoneCommentHandler(CommentHandler):
     def _create_pattern(self) -> re.Pattern:
         return re.compile(r"/otterdog\s+done")
 
-    def process(self, match: re.Match, event: IssueCommentEvent) -> None:
+    async def process(self, match: re.Match, event: IssueCommentEvent) -> None:
         from otterdog.webapp.tasks.complete_pull_request import CompletePullRequestTask
 
         assert event.installation is not None
         assert event.organization is not None
 
-        self.schedule_task(
+        await self.schedule_task(
             CompletePullRequestTask(
                 event.installation.id,
                 event.organization.login,
@@ -132,13 +131,13 @@ class ApplyCommentHandler(CommentHandler):
     def _create_pattern(self) -> re.Pattern:
         return re.compile(r"/otterdog\s+apply")
 
-    def process(self, match: re.Match, event: IssueCommentEvent) -> None:
+    async def process(self, match: re.Match, event: IssueCommentEvent) -> None:
         from otterdog.webapp.tasks.apply_changes import ApplyChangesTask
 
         assert event.installation is not None
         assert event.organization is not None
 
-        self.schedule_task(
+        await self.schedule_task(
             ApplyChangesTask(
                 event.installation.id,
                 event.organization.login,
@@ -153,13 +152,13 @@ class MergeCommentHandler(CommentHandler):
     def _create_pattern(self) -> re.Pattern:
         return re.compile(r"/otterdog\s+merge")
 
-    def process(self, match: re.Match, event: IssueCommentEvent) -> None:
+    async def process(self, match: re.Match, event: IssueCommentEvent) -> None:
         from otterdog.webapp.tasks.merge_pull_request import MergePullRequestTask
 
         assert event.installation is not None
         assert event.organization is not None
 
-        self.schedule_task(
+        await self.schedule_task(
             MergePullRequestTask(
                 event.installation.id,
                 event.organization.login,
@@ -174,7 +173,7 @@ class ValidateCommentHandler(CommentHandler):
     def _create_pattern(self) -> re.Pattern:
         return re.compile(r"/otterdog\s+validate(\s+info)?")
 
-    def process(self, match: re.Match, event: IssueCommentEvent) -> None:
+    async def process(self, match: re.Match, event: IssueCommentEvent) -> None:
         from otterdog.webapp.tasks.validate_pull_request import ValidatePullRequestTask
 
         assert event.installation is not None
@@ -186,7 +185,7 @@ class ValidateCommentHandler(CommentHandler):
         if log_level_str is not None and log_level_str.strip() == "info":
             log_level = LogLevel.INFO
 
-        self.schedule_task(
+        await self.schedule_task(
             ValidatePullRequestTask(
                 event.installation.id,
                 event.organization.login,
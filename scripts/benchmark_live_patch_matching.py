@@ -0,0 +1,52 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+"""
+Measures the time to match current with expected objects that use wildcard and exact keys
+when generating live patches of a list.
+
+Usage: python scripts/benchmark_live_patch_matching.py [number of keys of each kind]
+"""
+
+import sys
+import time
+
+from otterdog.models import LivePatchContext
+from otterdog.models.branch_protection_rule import BranchProtectionRule
+from otterdog.models.organization_settings import OrganizationSettings
+from otterdog.models.repository import Repository
+
+
+def _rule(pattern: str) -> BranchProtectionRule:
+    return BranchProtectionRule.from_model_data({"pattern": pattern})
+
+
+def main(key_count: int) -> None:
+    expected_rules = [_rule(f"release-{i}/*") for i in range(key_count)]
+    expected_rules += [_rule(f"main-{i}") for i in range(key_count)]
+
+    # each current rule matches exactly one expected rule, either via a wildcard or its exact key
+    current_rules = [_rule(f"release-{i}/1.0") for i in range(key_count)]
+    current_rules += [_rule(f"main-{i}") for i in range(key_count)]
+
+    repo = Repository.from_model_data({"name": "test-repo"})
+    context = LivePatchContext("test-org", "*", False, False, "", None, OrganizationSettings.from_model_data({}))
+
+    patches = []
+    start = time.perf_counter()
+    BranchProtectionRule.generate_live_patch_of_list(expected_rules, current_rules, repo, context, patches.append)
+    elapsed = time.perf_counter() - start
+
+    sys.stdout.write(f"wildcard keys:     {key_count}\n")
+    sys.stdout.write(f"exact keys:        {key_count}\n")
+    sys.stdout.write(f"patches:           {len(patches)}\n")
+    sys.stdout.write(f"elapsed time:      {elapsed * 1000:.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,77 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+"""
+Measures the memory retained by the model objects of a synthetic organization.
+
+Usage: python scripts/benchmark_model_memory.py [number of repositories]
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+from otterdog.models.branch_protection_rule import BranchProtectionRule
+from otterdog.models.environment import Environment
+from otterdog.models.github_organization import GitHubOrganization
+from otterdog.models.organization_settings import OrganizationSettings
+from otterdog.models.repo_secret import RepositorySecret
+from otterdog.models.repo_webhook import RepositoryWebhook
+from otterdog.models.repo_workflow_settings import RepositoryWorkflowSettings
+from otterdog.models.repository import Repository
+
+_RESOURCE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "tests", "models", "resources")
+
+
+def _load_json_resource(file: str) -> dict:
+    with open(os.path.join(_RESOURCE_DIR, file)) as fp:
+        return json.load(fp)
+
+
+def create_org(repo_count: int) -> GitHubOrganization:
+    repo_data = _load_json_resource("otterdog-repo.json")
+    workflow_data = _load_json_resource("otterdog-repo-workflow-settings.json")
+    bpr_data = _load_json_resource("otterdog-bpr.json")
+    environment_data = _load_json_resource("otterdog-environment.json")
+    webhook_data = _load_json_resource("otterdog-webhook.json")
+
+    settings = OrganizationSettings.from_model_data(_load_json_resource("otterdog-org-settings.json"))
+    org = GitHubOrganization("test-org", settings)
+
+    for i in range(repo_count):
+        repo = Repository.from_model_data({**repo_data, "name": f"repo-{i}"})
+        repo.workflows = RepositoryWorkflowSettings.from_model_data(workflow_data)
+        repo.add_branch_protection_rule(BranchProtectionRule.from_model_data(bpr_data))
+        repo.add_environment(Environment.from_model_data(environment_data))
+        repo.add_webhook(RepositoryWebhook.from_model_data({**webhook_data, "url": f"https://example.org/{i}"}))
+        repo.add_secret(RepositorySecret.from_model_data({"name": "TOKEN", "value": "pass:bots/test/token"}))
+        org.add_repository(repo)
+
+    return org
+
+
+def main(repo_count: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+
+    org = create_org(repo_count)
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sys.stdout.write(f"repositories:      {len(org.repositories)}\n")
+    sys.stdout.write(f"retained memory:   {current / 1024 / 1024:.1f} MiB\n")
+    sys.stdout.write(f"peak memory:       {peak / 1024 / 1024:.1f} MiB\n")
+    sys.stdout.write(f"per repository:    {current / repo_count / 1024:.2f} KiB\n")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -13,6 +13,25 @@ from abc import ABC, abstractmethod
 from typing import Any
 from unittest.mock import MagicMock
 
+from otterdog.models.branch_protection_rule import BranchProtectionRule
+from otterdog.models.environment import Environment
+from otterdog.models.organization_secret import OrganizationSecret
+from otterdog.models.organization_settings import OrganizationSettings
+from otterdog.models.organization_webhook import OrganizationWebhook
+from otterdog.models.repo_workflow_settings import RepositoryWorkflowSettings
+from otterdog.models.repository import Repository
+
+# model classes together with their otterdog and GitHub json resources
+MODEL_RESOURCES = [
+    (BranchProtectionRule, "otterdog-bpr.json", "github-bpr.json"),
+    (Environment, "otterdog-environment.json", "github-environment.json"),
+    (OrganizationSecret, "otterdog-org-secret.json", "github-org-secret.json"),
+    (OrganizationSettings, "otterdog-org-settings.json", "github-org-settings.json"),
+    (OrganizationWebhook, "otterdog-webhook.json", "github-webhook.json"),
+    (RepositoryWorkflowSettings, "otterdog-repo-workflow-settings.json", "github-repo-workflow-settings.json"),
+    (Repository, "otterdog-repo.json", "github-repo.json"),
+]
+
 
 class ModelTest(ABC, unittest.IsolatedAsyncioTestCase):
     @property
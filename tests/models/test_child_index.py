@@ -0,0 +1,108 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import copy
+
+from otterdog.models.github_organization import GitHubOrganization
+from otterdog.models.organization_settings import OrganizationSettings
+from otterdog.models.repo_secret import RepositorySecret
+from otterdog.models.repository import Repository
+
+
+def _create_org(*repo_names: str) -> GitHubOrganization:
+    org = GitHubOrganization("test-org", OrganizationSettings.from_model_data({}))
+    for repo_name in repo_names:
+        org.add_repository(Repository.from_model_data({"name": repo_name}))
+    return org
+
+
+def test_lookup_after_add_and_set():
+    org = _create_org("repo-1", "repo-2")
+
+    assert org.get_repository("repo-1") is org.repositories[0]
+    assert org.get_repository("repo-3") is None
+
+    # adding a repo after the index has been built updates the index
+    org.add_repository(Repository.from_model_data({"name": "repo-3"}))
+    assert org.get_repository("repo-3") is org.repositories[2]
+
+    org.set_repositories([Repository.from_model_data({"name": "repo-4"})])
+    assert org.get_repository("repo-1") is None
+    assert org.get_repository("repo-4") is org.repositories[0]
+
+
+def test_lookup_returns_first_match():
+    org = _create_org("repo-1", "repo-1")
+
+    assert org.get_repository("repo-1") is org.repositories[0]
+    assert [repo.name for repo in org.repositories] == ["repo-1", "repo-1"]
+
+
+def test_lookup_after_direct_modification():
+    org = _create_org("repo-1")
+    assert org.get_repository("repo-2") is None
+
+    org.repositories.append(Repository.from_model_data({"name": "repo-2"}))
+    assert org.get_repository("repo-2") is org.repositories[1]
+
+    org.repositories = [Repository.from_model_data({"name": "repo-3"})]
+    assert org.get_repository("repo-2") is None
+    assert org.get_repository("repo-3") is org.repositories[0]
+
+
+def test_lookup_after_key_change_requires_reset():
+    org = _create_org("repo-1")
+    assert org.get_repository("repo-1") is org.repositories[0]
+
+    org.repositories[0].name = "renamed"
+    org.set_repositories(org.repositories)
+
+    assert org.get_repository("repo-1") is None
+    assert org.get_repository("renamed") is org.repositories[0]
+
+
+def test_lookup_after_key_change():
+    org = _create_org("repo-1", "repo-2")
+    assert org.get_repository("repo-1") is org.repositories[0]
+
+    # a renamed child is not returned for its previous key anymore
+    org.repositories[0].name = "repo-2"
+    assert org.get_repository("repo-1") is None
+    assert org.get_repository("repo-2") is org.repositories[0]
+
+    # a child replaced in place is re-indexed as well
+    org.repositories[0] = Repository.from_model_data({"name": "repo-3"})
+    assert org.get_repository("repo-2") is org.repositories[1]
+    assert org.get_repository("repo-3") is org.repositories[0]
+
+    # children that have been reordered are found at their new position
+    org.repositories.reverse()
+    assert org.get_repository("repo-2") is org.repositories[0]
+    assert org.get_repository("repo-3") is org.repositories[1]
+
+
+def test_index_is_not_part_of_equality():
+    org = _create_org("repo-1")
+    other_org = _create_org("repo-1")
+
+    org.get_repository("repo-1")
+    assert org == other_org
+    assert "_children" not in repr(org)
+
+
+def test_copy_secrets():
+    org = _create_org("repo-1", "repo-2")
+    other_org = copy.deepcopy(org)
+
+    for repo, other_repo in zip(org.repositories, other_org.repositories, strict=True):
+        repo.add_secret(RepositorySecret.from_model_data({"name": "TOKEN", "value": "********"}))
+        other_repo.add_secret(RepositorySecret.from_model_data({"name": "TOKEN", "value": f"{repo.name}-token"}))
+
+    org.copy_secrets(other_org)
+
+    assert [repo.get_secret("TOKEN").value for repo in org.repositories] == ["repo-1-token", "repo-2-token"]
@@ -0,0 +1,100 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import dataclasses
+import itertools
+
+import pytest
+
+from otterdog.models import ModelObject
+from otterdog.models.environment import Environment
+from otterdog.models.organization_settings import OrganizationSettings
+from otterdog.models.repository import Repository
+from otterdog.models.ruleset import Ruleset
+from otterdog.utils import is_unset
+
+from . import MODEL_RESOURCES, ModelTest
+
+_MODELS = [(model_class, model_file) for model_class, model_file, _ in MODEL_RESOURCES]
+
+
+def _expected_keys(
+    model: ModelObject,
+    for_diff: bool,
+    for_patch: bool,
+    include_model_only_fields: bool,
+    include_nested_models: bool,
+) -> list[str]:
+    result = []
+
+    for field in dataclasses.fields(model):
+        if not field.init or field.metadata.get("external_only", False):
+            continue
+
+        if for_diff and not model.include_field_for_diff_computation(field):
+            continue
+
+        if for_patch and not model.include_field_for_patch_computation(field):
+            continue
+
+        if (for_diff or for_patch) and not include_model_only_fields and field.metadata.get("model_only", False):
+            continue
+
+        if not include_nested_models and field.metadata.get("nested_model", False):
+            continue
+
+        if not is_unset(model.__getattribute__(field.name)):
+            result.append(field.name)
+
+    return result
+
+
+@pytest.mark.parametrize("model_class, model_file", _MODELS)
+def test_keys_match_field_metadata(model_class, model_file):
+    model = model_class.from_model_data(ModelTest.load_json_resource(model_file))
+
+    for for_diff, for_patch, include_model_only_fields, include_nested_models in itertools.product(
+        [False, True], repeat=4
+    ):
+        assert model.keys(
+            for_diff=for_diff,
+            for_patch=for_patch,
+            include_model_only_fields=include_model_only_fields,
+            include_nested_models=include_nested_models,
+        ) == _expected_keys(model, for_diff, for_patch, include_model_only_fields, include_nested_models)
+
+
+def test_keys_apply_value_dependent_filters():
+    environment = Environment.from_model_data(ModelTest.load_json_resource("otterdog-environment.json"))
+
+    environment.deployment_branch_policy = "selected"
+    assert "branch_policies" in environment.keys(for_diff=True)
+
+    # the same class must still consult the value of each instance
+    environment.deployment_branch_policy = "all"
+    assert "branch_policies" not in environment.keys(for_diff=True)
+    assert "branch_policies" in environment.keys(for_patch=True)
+
+
+def test_field_classification():
+    assert Repository.is_nested_model_key("webhooks")
+    assert not Repository.is_nested_model_key("name")
+    assert Repository.is_nested_model_key("workflows")
+    assert not Repository.is_embedded_model_key("workflows")
+    assert Ruleset.is_embedded_model_key("required_pull_request")
+    assert Repository.is_read_only_key("archived") == Repository._get_field("archived").metadata.get("read_only", False)
+
+    with pytest.raises(ValueError):
+        Repository.is_read_only_key("unknown")
+
+    repo = Repository.from_model_data(ModelTest.load_json_resource("otterdog-repo.json"))
+    assert repo.is_keyed()
+    assert repo.get_key() == "name"
+    assert not OrganizationSettings.from_model_data(
+        ModelTest.load_json_resource("otterdog-org-settings.json")
+    ).is_keyed()
@@ -6,11 +6,21 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+import asyncio
+import copy
+import dataclasses
 import os
+import tempfile
 import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from otterdog.cache import get_jsonnet_cache, set_jsonnet_cache
 from otterdog.config import OtterdogConfig
+from otterdog.jsonnet_cache import file_jsonnet_cache
+from otterdog.models import LivePatch, LivePatchContext
+from otterdog.models import github_organization as github_organization_module
 from otterdog.models.github_organization import GitHubOrganization
+from otterdog.models.repository import Repository
 
 
 class GitHubOrganizationTest(unittest.IsolatedAsyncioTestCase):
@@ -26,11 +36,99 @@ class GitHubOrganizationTest(unittest.IsolatedAsyncioTestCase):
         self.jsonnet_config = self.org_config.jsonnet_config
         await self.jsonnet_config.init_template()
 
-    def test_load_from_file(self):
-        organization = GitHubOrganization.load_from_file(
+        self.jsonnet_cache_dir = tempfile.TemporaryDirectory()
+        self.jsonnet_cache = get_jsonnet_cache()
+        set_jsonnet_cache(file_jsonnet_cache(self.jsonnet_cache_dir.name))
+
+    async def asyncTearDown(self):
+        set_jsonnet_cache(self.jsonnet_cache)
+        self.jsonnet_cache_dir.cleanup()
+
+    async def test_load_from_file(self):
+        organization = await GitHubOrganization.load_from_file(
             self.TEST_ORG, self.jsonnet_config.org_config_file, self.otterdog_config
         )
 
         assert organization.github_id == "test-org"
         assert len(organization.webhooks) == 1
         assert len(organization.repositories) == 2
+
+    async def test_generate_live_patch_from_provider(self):
+        expected_org = await GitHubOrganization.load_from_file(
+            self.TEST_ORG, self.jsonnet_config.org_config_file, self.otterdog_config
+        )
+
+        current_org = copy.deepcopy(expected_org)
+        current_org.settings.description = "outdated"
+        current_org.repositories[0].description = "outdated"
+        current_org.set_repositories(
+            [current_org.repositories[0], Repository.from_model_data({"name": "obsolete", "archived": False})]
+        )
+
+        def create_context(org: GitHubOrganization) -> LivePatchContext:
+            return LivePatchContext(self.TEST_ORG, "*", False, False, "", None, expected_org.settings)
+
+        def describe(patch: LivePatch) -> str:
+            model_object = patch.expected_object if patch.expected_object is not None else patch.current_object
+            assert model_object is not None
+            key = model_object.get_key_value() if model_object.is_keyed() else ""
+            return f"{patch.patch_type.name} {model_object.model_object_name} {key}".strip()
+
+        events: list[str] = []
+
+        async def load_org_resources(*args):
+            return dataclasses.replace(current_org, repositories=[])
+
+        async def load_repos(*args):
+            repo_handler = args[-1]
+            for repo in reversed(current_org.repositories):
+                events.append(f"loaded {repo.name}")
+                repo_handler(repo)
+            return []
+
+        with (
+            patch.object(GitHubOrganization, "_load_org_resources_from_provider", side_effect=load_org_resources),
+            patch.object(github_organization_module, "_load_repos_from_provider", side_effect=load_repos),
+        ):
+            await expected_org.generate_live_patch_from_provider(
+                self.jsonnet_config, MagicMock(), create_context, lambda x: events.append(describe(x))
+            )
+
+        # patches of each repository follow immediately after it has been loaded
+        assert [event.split(" ")[0] for event in events] == ["CHANGE", "loaded", "REMOVE", "loaded", "CHANGE", "ADD"]
+        assert events[1:3] == ["loaded obsolete", "REMOVE repository obsolete"]
+
+        # the same patches are generated as for a fully loaded organization
+        patches: list[str] = []
+        context = create_context(current_org)
+        expected_org.generate_live_patch(current_org, context, lambda x: patches.append(describe(x)))
+        assert sorted(patches) == sorted(event for event in events if not event.startswith("loaded"))
+
+    async def test_repositories_are_handled_in_order(self):
+        repo_names = ["first", "second", "third"]
+
+        provider = MagicMock()
+        provider.get_repos_data = AsyncMock(return_value={name: {} for name in repo_names})
+        provider.rest_api.org.get_teams = AsyncMock(return_value=[])
+        provider.rest_api.org.get_app_installations = AsyncMock(return_value=[])
+
+        jsonnet_config = MagicMock()
+        jsonnet_config.default_branch_protection_rule_config = None
+
+        async def process_single_repo(provider, github_id, repo_name, *args):
+            # earlier repositories take longer to be retrieved
+            await asyncio.sleep(0.01 * (len(repo_names) - repo_names.index(repo_name)))
+            return repo_name, Repository.from_model_data({"name": repo_name, "archived": False})
+
+        handled: list[str] = []
+
+        with patch.object(github_organization_module, "_process_single_repo", side_effect=process_single_repo):
+            repos = await github_organization_module._load_repos_from_provider(
+                self.TEST_ORG,
+                provider,
+                jsonnet_config,
+                repo_handler=lambda repo: handled.append(repo.name),
+            )
+
+        assert repos == []
+        assert handled == repo_names
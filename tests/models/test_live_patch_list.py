@@ -0,0 +1,72 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import random
+
+from otterdog.models import LivePatch, LivePatchContext, LivePatchListGenerator, LivePatchType
+from otterdog.models.branch_protection_rule import BranchProtectionRule
+from otterdog.models.organization_settings import OrganizationSettings
+from otterdog.models.repository import Repository
+
+
+def _rule(pattern: str) -> BranchProtectionRule:
+    return BranchProtectionRule.from_model_data({"pattern": pattern})
+
+
+def _context() -> LivePatchContext:
+    return LivePatchContext("test-org", "*", False, False, "", None, OrganizationSettings.from_model_data({}))
+
+
+def _find_linear(expected_objects: list[BranchProtectionRule], key: str) -> BranchProtectionRule | None:
+    for obj in expected_objects:
+        stripped_key = obj.get_key_value().rstrip("*")
+        if stripped_key and key.startswith(stripped_key):
+            return obj
+    return None
+
+
+def test_prefix_matching_is_equivalent_to_linear_scan():
+    rnd = random.Random(42)
+
+    def random_key() -> str:
+        return "".join(rnd.choice("ab/") for _ in range(rnd.randint(0, 6)))
+
+    patterns = sorted({random_key() + rnd.choice(["", "*", "**"]) for _ in range(200)})
+    rnd.shuffle(patterns)
+    expected_objects = [_rule(pattern) for pattern in patterns]
+    generator = LivePatchListGenerator(BranchProtectionRule, expected_objects, None, _context(), lambda x: None)
+
+    for _ in range(1000):
+        key = random_key()
+        assert generator._find_by_prefix(key) is _find_linear(expected_objects, key)
+
+
+def test_wildcard_keys_match_first_expected_object():
+    expected_objects = [_rule("main"), _rule("release/*"), _rule("release/1.*"), _rule("feature*")]
+    current_objects = [_rule("release/1.0"), _rule("main"), _rule("hotfix")]
+
+    patches: list[LivePatch] = []
+    BranchProtectionRule.generate_live_patch_of_list(
+        expected_objects, current_objects, Repository.from_model_data({"name": "repo"}), _context(), patches.append
+    )
+
+    changes = {
+        (
+            patch.patch_type,
+            patch.expected_object.pattern if patch.expected_object is not None else None,
+            patch.current_object.pattern if patch.current_object is not None else None,
+        )
+        for patch in patches
+    }
+
+    assert changes == {
+        (LivePatchType.CHANGE, "release/*", "release/1.0"),
+        (LivePatchType.REMOVE, None, "hotfix"),
+        (LivePatchType.ADD, "release/1.*", None),
+        (LivePatchType.ADD, "feature*", None),
+    }
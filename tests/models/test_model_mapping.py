@@ -0,0 +1,42 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+
+import pytest
+from jsonbender import K, OptionalS, S, bend  # type: ignore
+
+from otterdog.models import _compile_mapping
+from otterdog.models.repository import Repository
+
+from . import MODEL_RESOURCES, ModelTest
+
+
+@pytest.mark.parametrize("model_class, model_file, provider_file", MODEL_RESOURCES)
+def test_compiled_mapping_matches_bend(model_class, model_file, provider_file):
+    model_data = ModelTest.load_json_resource(model_file)
+    assert model_class.from_model_data(model_data) == model_class(
+        **bend(model_class.get_mapping_from_model(), model_data)
+    )
+
+    provider_data = ModelTest.load_json_resource(provider_file)
+    assert model_class.from_provider_data("OtterdogTest", provider_data) == model_class(
+        **bend(model_class.get_mapping_from_provider("OtterdogTest", provider_data), provider_data)
+    )
+
+
+def test_mutable_defaults_are_not_shared():
+    apply = _compile_mapping(
+        {"name": S("name"), "topics": OptionalS("topics", default=[]), "webhooks": K([])}, Repository
+    )
+
+    first = apply({"name": "repo-1"})
+    second = apply({"name": "repo-2"})
+
+    assert first == {"name": "repo-1", "topics": [], "webhooks": []}
+    assert first["topics"] is not second["topics"]
+    assert first["webhooks"] is not second["webhooks"]
@@ -0,0 +1,47 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import copy
+
+import pytest
+
+from otterdog.models.organization_secret import OrganizationSecret
+from otterdog.models.repository import Repository
+from otterdog.utils import UNSET
+
+from . import MODEL_RESOURCES, ModelTest
+
+_MODELS = [(model_class, model_file) for model_class, model_file, _ in MODEL_RESOURCES]
+
+
+@pytest.mark.parametrize("model_class, model_file", _MODELS)
+def test_model_objects_are_slotted(model_class, model_file):
+    model_object = model_class.from_model_data(ModelTest.load_json_resource(model_file))
+
+    assert not hasattr(model_object, "__dict__")
+    with pytest.raises(AttributeError):
+        model_object.unknown_attribute = True
+
+    assert copy.copy(model_object) == model_object
+    assert copy.deepcopy(model_object) == model_object
+
+
+def test_unset_values_are_retained():
+    repo = Repository.from_model_data({"name": "test-repo"})
+
+    assert repo.description is UNSET
+    assert "description" not in repo.keys(for_diff=False)
+
+
+def test_copy_secrets():
+    secret = OrganizationSecret.from_model_data(ModelTest.load_json_resource("otterdog-org-secret.json"))
+    other = copy.copy(secret)
+    other.value = "********"
+
+    other.copy_secrets(secret)
+    assert other.value == secret.value
@@ -7,6 +7,7 @@
 #  *******************************************************************************
 
 from otterdog.models.repository import Repository
+from otterdog.providers.github.graphql import GraphQLClient
 from otterdog.utils import UNSET, Change, query_json
 
 from . import ModelTest
@@ -83,6 +84,21 @@ class RepositoryTest(ModelTest):
         assert repo.secret_scanning_push_protection == "disabled"
         assert repo.dependabot_alerts_enabled is True
 
+    def test_load_from_graphql_provider(self):
+        provider_data = GraphQLClient._transform_repository(self.load_json_resource("github-repo-graphql.json"))
+        repo = Repository.from_provider_data(self.org_id, provider_data)
+        expected_repo = Repository.from_provider_data(self.org_id, self.provider_data)
+
+        assert repo.id == 605555050
+        assert repo.node_id == "R_kgDOJBgJag"
+        assert repo.topics == ["otterdog"]
+        assert repo.template_repository is None
+        assert repo.dependabot_alerts_enabled is True
+
+        for key in provider_data:
+            if key not in {"topics", "template_repository"}:
+                assert getattr(repo, key) == getattr(expected_repo, key), key
+
     async def test_to_provider(self):
         repo = Repository.from_model_data(self.model_data)
 
@@ -0,0 +1,139 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+import unittest
+from io import StringIO
+from unittest.mock import MagicMock
+
+from otterdog.models import LivePatch
+from otterdog.operations.apply import ApplyOperation
+from otterdog.utils import IndentingPrinter, LogLevel
+
+
+def _model_object(name: str, keyed: bool = True, before_repositories: bool = False) -> MagicMock:
+    model_object = MagicMock(name=name)
+    model_object.is_keyed.return_value = keyed
+    model_object.apply_live_patch_before_repositories.return_value = before_repositories
+    model_object.get_model_header.return_value = name
+    return model_object
+
+
+class ApplyOperationTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.operation = ApplyOperation(
+            force_processing=True,
+            no_web_ui=True,
+            repo_filter="*",
+            update_webhooks=False,
+            update_secrets=False,
+            update_filter="*",
+            delete_resources=True,
+            apply_concurrency=4,
+        )
+
+        self.operation.init(None, IndentingPrinter(StringIO(), log_level=LogLevel.ERROR))  # type: ignore
+        self.operation._gh_client = MagicMock()
+
+        self.started: list[str] = []
+        self.finished: list[str] = []
+
+    def _patch(self, name: str, model_object, parent_object=None, delay: float = 0, fail: bool = False) -> LivePatch:
+        async def apply(patch, org_id, provider):
+            self.started.append(name)
+            await asyncio.sleep(delay)
+            self.finished.append(name)
+
+            if fail:
+                raise RuntimeError(f"failed {name}")
+
+        return LivePatch.of_addition(model_object, parent_object, apply)
+
+    async def test_apply_patches_respects_dependencies(self):
+        settings = _model_object("settings", keyed=False)
+        repo = _model_object("repo")
+        other_repo = _model_object("other-repo")
+
+        patches = [
+            self._patch("settings", settings, delay=0.02),
+            self._patch("workflows", _model_object("workflows", keyed=False), settings),
+            self._patch("repo", repo, delay=0.02),
+            self._patch("repo-secret", _model_object("secret"), repo),
+            self._patch("other-repo", other_repo),
+            self._patch("other-repo-ruleset", _model_object("ruleset"), other_repo),
+        ]
+
+        progress = []
+        errors = await self.operation.apply_patches("org", patches, progress.append)
+
+        assert errors == 0
+        assert len(progress) == len(patches)
+
+        # org settings are applied sequentially before anything else
+        assert self.started[:2] == ["settings", "workflows"]
+        assert self.finished[:2] == ["settings", "workflows"]
+
+        # independent patches run concurrently, children wait for their parent
+        assert self.started[2:4] == ["repo", "other-repo"]
+        assert self.finished.index("repo") < self.started.index("repo-secret")
+        assert self.finished.index("other-repo") < self.started.index("other-repo-ruleset")
+
+    async def test_apply_patches_reports_errors_per_patch(self):
+        repo = _model_object("repo")
+
+        patches = [
+            self._patch("repo", repo, fail=True),
+            self._patch("repo-secret", _model_object("secret"), repo, fail=True),
+            self._patch("other-repo", _model_object("other-repo")),
+        ]
+
+        errors = await self.operation.apply_patches("org", patches)
+
+        assert errors == 2
+        assert sorted(self.finished) == ["other-repo", "repo", "repo-secret"]
+
+    async def test_apply_patches_creates_custom_properties_first(self):
+        settings = _model_object("settings", keyed=False)
+        custom_property = _model_object("custom-property", before_repositories=True)
+        repo = _model_object("repo")
+
+        patches = [
+            self._patch("custom-property", custom_property, settings, delay=0.02),
+            self._patch("repo", repo),
+            self._patch("other-repo", _model_object("other-repo")),
+        ]
+
+        errors = await self.operation.apply_patches("org", patches)
+
+        assert errors == 0
+
+        # repositories using the added property are only changed once it has been created
+        assert self.finished.index("custom-property") < self.started.index("repo")
+        assert self.finished.index("custom-property") < self.started.index("other-repo")
+
+    async def test_apply_patches_of_siblings_in_order(self):
+        repo = _model_object("repo")
+        other_repo = _model_object("other-repo")
+
+        patches = [
+            self._patch("repo", repo),
+            self._patch("environment", _model_object("environment"), repo, delay=0.02),
+            self._patch("bpr", _model_object("bpr"), repo),
+            self._patch("other-repo", other_repo),
+            self._patch("other-repo-secret", _model_object("secret"), other_repo),
+        ]
+
+        errors = await self.operation.apply_patches("org", patches)
+
+        assert errors == 0
+
+        # a branch protection rule can require an environment created in the same apply
+        assert self.finished.index("environment") < self.started.index("bpr")
+
+        # siblings of different parents do not wait for each other
+        assert self.finished.index("other-repo-secret") < self.finished.index("environment")
@@ -0,0 +1,155 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import json
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from otterdog.providers.github.auth import token_auth
+from otterdog.providers.github.graphql import GraphQLClient
+from otterdog.providers.github.session import close_shared_session
+
+
+def _allowances(logins: list[str], end_cursor: str | None = None) -> dict[str, Any]:
+    return {
+        "nodes": [{"actor": {"__typename": "User", "id": login, "login": login}} for login in logins],
+        "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+    }
+
+
+def _rule(rule_id: str, pattern: str, push_allowances: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": rule_id,
+        "pattern": pattern,
+        "pushAllowances": push_allowances,
+        "reviewDismissalAllowances": _allowances([]),
+        "bypassPullRequestAllowances": _allowances(["bypass"]),
+        "bypassForcePushAllowances": _allowances([]),
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_branch_protection_rules_for_repos():
+    graphql = pytest.importorskip("graphql")
+
+    queries = []
+
+    async def request_raw(method: str, query: str, variables: dict[str, Any]) -> tuple[int, str]:
+        # the generated queries must be syntactically valid
+        graphql.parse(query)
+        queries.append(variables)
+
+        if "organization" in variables:
+            data = {
+                "repo0": {
+                    "branchProtectionRules": {
+                        "nodes": [_rule("rule-1", "main", _allowances(["user1"], "cursor-1"))],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                },
+                "repo1": {
+                    "branchProtectionRules": {
+                        "nodes": [_rule("rule-2", "dev", _allowances(["user3"]))],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                },
+            }
+        else:
+            assert variables == {"id0": "rule-1", "cursor0": "cursor-1"}
+            data = {"rule0": {"pushAllowances": _allowances(["user2"])}}
+
+        return 200, json.dumps({"data": data})
+
+    client = GraphQLClient(token_auth("token"))
+    client._request_raw = request_raw  # type: ignore
+
+    result = await client.get_branch_protection_rules_for_repos("org", ["repo-a", "repo-b"])
+
+    # one query for all repos and one for the overflowing allowances
+    assert len(queries) == 2
+    assert queries[0] == {"organization": "org", "repo0": "repo-a", "repo1": "repo-b"}
+
+    assert result["repo-a"][0]["pushRestrictions"] == ["@user1", "@user2"]
+    assert result["repo-a"][0]["bypassPullRequestAllowances"] == ["@bypass"]
+    assert result["repo-b"][0]["pushRestrictions"] == ["@user3"]
+    assert "pushAllowances" not in result["repo-b"][0]
+
+
+@pytest.mark.asyncio
+async def test_minimize_comments(monkeypatch):
+    graphql = pytest.importorskip("graphql")
+
+    from otterdog.providers.github import graphql as graphql_module
+
+    monkeypatch.setattr(graphql_module, "_MINIMIZE_COMMENTS_BATCH_SIZE", 2)
+
+    queries = []
+
+    async def request_raw(method: str, query: str, variables: dict[str, Any]) -> tuple[int, str]:
+        graphql.parse(query)
+        queries.append(variables)
+        return 200, json.dumps({"data": {}})
+
+    client = GraphQLClient(token_auth("token"))
+    client._request_raw = request_raw  # type: ignore
+
+    await client.minimize_comments(["c1", "c2", "c3"], "OUTDATED")
+
+    # comments are minimized in batches using a separate alias for each comment
+    assert queries == [
+        {
+            "input0": {"subjectId": "c1", "classifier": "OUTDATED"},
+            "input1": {"subjectId": "c2", "classifier": "OUTDATED"},
+        },
+        {"input0": {"subjectId": "c3", "classifier": "OUTDATED"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_minimize_comments_with_errors():
+    async def request_raw(method: str, query: str, variables: dict[str, Any]) -> tuple[int, str]:
+        # GraphQL reports failed mutations with a status of 200
+        errors = [{"type": "NOT_FOUND", "path": ["comment0"], "message": "Could not resolve to a node"}]
+        return 200, json.dumps({"data": {"comment0": None}, "errors": errors})
+
+    client = GraphQLClient(token_auth("token"))
+    client._request_raw = request_raw  # type: ignore
+
+    with pytest.raises(RuntimeError, match="failed minimizing comments"):
+        await client.minimize_comments(["c1"], "OUTDATED")
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_queries_are_retried():
+    responses = [
+        {"data": None, "errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]},
+        {"data": {"viewer": {"login": "user"}}},
+    ]
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response(responses.pop(0), headers={"retry-after": "0"})
+
+    app = web.Application()
+    app.router.add_post("/graphql", handler)
+
+    async with TestServer(app) as server:
+        client = GraphQLClient(token_auth("token"))
+        client._base_url = str(server.make_url("/graphql"))
+
+        try:
+            status, body = await client._request_raw("POST", "query { viewer { login } }", {})
+        finally:
+            await client.close()
+            await close_shared_session()
+
+    assert status == 200
+    assert json.loads(body) == {"data": {"viewer": {"login": "user"}}}
+    assert client.rate_limiter.concurrency < client.rate_limiter.max_concurrency
@@ -0,0 +1,75 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from otterdog import jsonnet
+from otterdog.jsonnet import JsonnetConfig
+
+_TEMPLATE = """
+{
+  newOrg(id):: { id: id, settings: { name: null } },
+  newRepo(name):: { name: name, private: false },
+  newRepoWebhook(url):: error "not supported",
+  newPullRequest():: { draft: false },
+}
+"""
+
+
+def _create_config(tmp_path, template: str) -> JsonnetConfig:
+    config = JsonnetConfig(
+        "test-org",
+        str(tmp_path),
+        "https://github.com/eclipse-csi/otterdog-defaults#otterdog-defaults.libsonnet@main",
+        local_only=True,
+    )
+
+    os.makedirs(config.template_dir)
+    with open(config.template_file, "w") as file:
+        file.write(template)
+
+    return config
+
+
+def test_default_configs_are_evaluated_once(tmp_path):
+    config = _create_config(tmp_path, _TEMPLATE.replace('newRepoWebhook(url):: error "not supported",', ""))
+
+    with patch.object(jsonnet, "jsonnet_evaluate_snippet", wraps=jsonnet.jsonnet_evaluate_snippet) as evaluate:
+        assert config.default_org_config == {"id": "default", "settings": {"name": None}}
+        assert config.default_repo_config == {"name": "default", "private": False}
+        assert config.default_pull_request_config == {"draft": False}
+        assert config.default_repo_webhook_config is None
+        assert config.default_environment_config is None
+        assert config.default_merge_queue_config is None
+
+    assert evaluate.call_count == 1
+
+
+def test_failing_constructor_falls_back_to_separate_evaluation(tmp_path):
+    config = _create_config(tmp_path, _TEMPLATE)
+
+    assert config.default_org_config == {"id": "default", "settings": {"name": None}}
+    assert config.default_repo_config == {"name": "default", "private": False}
+    assert config.default_repo_webhook_config is None
+    assert config.default_environment_config is None
+
+
+@pytest.mark.asyncio
+async def test_default_configs_are_evaluated_during_init(tmp_path):
+    config = _create_config(tmp_path, _TEMPLATE.replace('newRepoWebhook(url):: error "not supported",', ""))
+
+    await config.init_template()
+
+    with patch.object(jsonnet, "jsonnet_evaluate_snippet") as evaluate:
+        assert config.default_org_config == {"id": "default", "settings": {"name": None}}
+        assert config.default_pull_request_config == {"draft": False}
+
+    evaluate.assert_not_called()
@@ -0,0 +1,87 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from otterdog import jsonnet_cache
+from otterdog.jsonnet_cache import (
+    file_jsonnet_cache,
+    get_cache_key,
+    jsonnet_evaluate_file_cached,
+    redis_jsonnet_cache,
+)
+
+
+def _write(file: str, content: str) -> None:
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+    with open(file, "w") as f:
+        f.write(content)
+
+
+def _create_config(base_dir: str) -> str:
+    org_file = os.path.join(base_dir, "orgs", "test-org.jsonnet")
+    _write(org_file, "local orgs = import 'vendor/defaults.libsonnet';\norgs.newOrg('test-org')\n")
+    _write(
+        os.path.join(base_dir, "orgs", "vendor", "defaults.libsonnet"),
+        "local repo = import 'repo.libsonnet';\n{ newOrg(id):: { id: id, repo: repo } }\n",
+    )
+    _write(os.path.join(base_dir, "orgs", "vendor", "repo.libsonnet"), "{ private: false }\n")
+    return org_file
+
+
+def test_cache_key(tmp_path):
+    org_file = _create_config(str(tmp_path / "a"))
+    other_org_file = _create_config(str(tmp_path / "b"))
+
+    # the key only depends on the content and not on the location of the files
+    key = get_cache_key(org_file)
+    assert key == get_cache_key(other_org_file)
+
+    # changing a transitive import changes the key
+    _write(os.path.join(str(tmp_path / "b"), "orgs", "vendor", "repo.libsonnet"), "{ private: true }\n")
+    assert key != get_cache_key(other_org_file)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_file_cached(tmp_path):
+    org_file = _create_config(str(tmp_path / "config"))
+    cache = file_jsonnet_cache(str(tmp_path / "cache"))
+
+    expected = {"id": "test-org", "repo": {"private": False}}
+
+    evaluate_file = jsonnet_cache.jsonnet_evaluate_file_async
+    with patch.object(jsonnet_cache, "jsonnet_evaluate_file_async", wraps=evaluate_file) as evaluate:
+        assert await jsonnet_evaluate_file_cached(org_file, cache) == expected
+        assert await jsonnet_evaluate_file_cached(org_file, cache) == expected
+        assert evaluate.call_count == 1
+
+        _write(os.path.join(str(tmp_path / "config"), "orgs", "vendor", "repo.libsonnet"), "{ private: true }\n")
+        assert await jsonnet_evaluate_file_cached(org_file, cache) == {"id": "test-org", "repo": {"private": True}}
+        assert evaluate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_uses_provided_connection():
+    entries: dict[str, bytes] = {}
+
+    async def set_value(key, value, ex=None):
+        entries[key] = value.encode("utf-8")
+
+    connection = MagicMock()
+    connection.get = AsyncMock(side_effect=lambda key: entries.get(key))
+    connection.set = AsyncMock(side_effect=set_value)
+
+    cache = redis_jsonnet_cache("redis://localhost", lambda: connection)
+
+    assert await cache.get("key") is None
+    await cache.put("key", {"id": "test-org"})
+    assert await cache.get("key") == {"id": "test-org"}
+    assert connection.set.call_args.kwargs["ex"] > 0
@@ -0,0 +1,25 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+
+import pytest
+
+from otterdog.jsonnet_evaluator import jsonnet_evaluate_snippet_async, shutdown_jsonnet_evaluator
+
+
+@pytest.mark.asyncio
+async def test_evaluate_snippets_concurrently():
+    try:
+        results = await asyncio.gather(*[jsonnet_evaluate_snippet_async(f"{{ id: {i} }}") for i in range(4)])
+        assert results == [{"id": i} for i in range(4)]
+
+        with pytest.raises(RuntimeError):
+            await jsonnet_evaluate_snippet_async("{ id: error 'failed' }")
+    finally:
+        shutdown_jsonnet_evaluator()
@@ -0,0 +1,91 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+import time
+
+import pytest
+
+from otterdog.providers.github.rate_limit import RateLimiter, get_rate_limiter
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_narrowed_on_secondary_rate_limit():
+    limiter = RateLimiter(max_concurrency=8)
+
+    async with limiter.throttle() as request:
+        request.update(403, {"retry-after": "0"}, "You have exceeded a secondary rate limit.")
+
+    assert request.retry is True
+    assert limiter.concurrency == 4
+
+    async with limiter.throttle() as request:
+        request.update(200, {"x-ratelimit-remaining": "4000"}, "{}")
+
+    assert request.retry is False
+    assert limiter.concurrency == 5
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried():
+    limiter = RateLimiter(max_concurrency=8)
+
+    async with limiter.throttle() as request:
+        request.update(403, {}, "Resource not accessible by integration")
+
+    assert request.retry is False
+    assert limiter.concurrency == 8
+
+
+@pytest.mark.asyncio
+async def test_requests_are_spread_when_budget_is_low():
+    limiter = RateLimiter(max_concurrency=2, low_budget_threshold=100)
+
+    reset = str(int(time.time()) + 1)
+    async with limiter.throttle() as request:
+        request.update(200, {"x-ratelimit-remaining": "20", "x-ratelimit-reset": reset}, "{}")
+
+    assert limiter._rate is not None
+    assert limiter._rate > 0
+
+    start = time.monotonic()
+    for _ in range(4):
+        async with limiter.throttle():
+            pass
+
+    # the bucket holds at most 2 tokens, the remaining requests have to wait for a refill
+    assert time.monotonic() - start > 0.05
+
+
+@pytest.mark.asyncio
+async def test_requests_are_bounded_by_max_concurrency():
+    limiter = RateLimiter(max_concurrency=8)
+    limiter.max_concurrency = 3
+
+    max_in_flight = 0
+
+    async def request():
+        nonlocal max_in_flight
+        async with limiter.throttle() as throttled_request:
+            max_in_flight = max(max_in_flight, limiter.in_flight)
+            await asyncio.sleep(0.001)
+            throttled_request.update(200, {}, "{}")
+
+    await asyncio.gather(*[request() for _ in range(50)])
+
+    assert limiter.concurrency == 3
+    assert max_in_flight == 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiters_are_shared_per_identity():
+    assert get_rate_limiter("installation:1") is get_rate_limiter("installation:1")
+    assert get_rate_limiter("installation:1") is not get_rate_limiter("installation:2")
+    assert get_rate_limiter(None) is not get_rate_limiter(None)
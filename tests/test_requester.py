@@ -0,0 +1,145 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from otterdog.providers.github.auth import token_auth
+from otterdog.providers.github.cache.file import file_cache
+from otterdog.providers.github.rest import requester as requester_module
+from otterdog.providers.github.rest.requester import Requester
+from otterdog.providers.github.session import close_shared_session
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests(tmp_path):
+    received_headers = []
+
+    async def handler(request: web.Request) -> web.Response:
+        received_headers.append(request.headers.copy())
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response({"name": "otterdog"}, headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/repos/test/otterdog", handler)
+
+    async with TestServer(app) as server:
+        requester = Requester(token_auth("token"), file_cache(str(tmp_path)), "localhost", "2022-11-28")
+        requester._base_url = str(server.make_url("")).rstrip("/")
+
+        try:
+            assert await requester.request_json("GET", "/repos/test/otterdog") == {"name": "otterdog"}
+            assert await requester.request_json("GET", "/repos/test/otterdog") == {"name": "otterdog"}
+        finally:
+            await requester.close()
+
+        # another identity must not reuse the stored validators
+        other_requester = Requester(token_auth("other"), file_cache(str(tmp_path)), "localhost", "2022-11-28")
+        other_requester._base_url = requester._base_url
+
+        try:
+            assert await other_requester.request_json("GET", "/repos/test/otterdog") == {"name": "otterdog"}
+        finally:
+            await other_requester.close()
+            await close_shared_session()
+
+    assert "If-None-Match" not in received_headers[0]
+    assert received_headers[1]["If-None-Match"] == '"v1"'
+    assert "If-None-Match" not in received_headers[2]
+
+    assert requester.statistics.total_requests == 2
+    assert requester.statistics.revalidated_responses == 1
+    assert other_requester.statistics.revalidated_responses == 0
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_with_renewed_token(tmp_path):
+    received_headers = []
+
+    async def handler(request: web.Request) -> web.Response:
+        received_headers.append(request.headers.copy())
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response({"name": "otterdog"}, headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/repos/test/otterdog", handler)
+
+    async def request(token: str) -> None:
+        requester = Requester(token_auth(token, "installation:1"), file_cache(str(tmp_path)), "localhost", "2022-11-28")
+        requester._base_url = str(server.make_url("")).rstrip("/")
+
+        try:
+            assert await requester.request_json("GET", "/repos/test/otterdog") == {"name": "otterdog"}
+        finally:
+            await requester.close()
+
+    async with TestServer(app) as server:
+        try:
+            # expired entries are not used anymore
+            with patch.object(requester_module, "_CONDITIONAL_ENTRY_EXPIRATION", -1):
+                await request("token")
+            await request("token")
+
+            # a renewed token of the same installation reuses the stored validators
+            await request("renewed-token")
+        finally:
+            await close_shared_session()
+
+    assert "If-None-Match" not in received_headers[0]
+    assert "If-None-Match" not in received_headers[1]
+    assert received_headers[2]["If-None-Match"] == '"v1"'
+
+
+def _paged_app(num_items: int, requested_pages: list[int]) -> web.Application:
+    async def handler(request: web.Request) -> web.Response:
+        page = int(request.query["page"])
+        per_page = int(request.query["per_page"])
+        requested_pages.append(page)
+
+        last_page = max(1, -(-num_items // per_page))
+        items = [{"id": i} for i in range((page - 1) * per_page, min(page * per_page, num_items))]
+
+        headers = {}
+        if last_page > 1:
+            links = [f'<{request.url.with_query(page=last_page, per_page=per_page)}>; rel="last"']
+            if page < last_page:
+                links.insert(0, f'<{request.url.with_query(page=page + 1, per_page=per_page)}>; rel="next"')
+            headers["Link"] = ", ".join(links)
+
+        return web.json_response(items, headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/orgs/test/members", handler)
+    return app
+
+
+@pytest.mark.asyncio
+# a full page without Link header is followed by another request to be safe
+@pytest.mark.parametrize("num_items, expected_requests", [(30, 1), (100, 2), (450, 5)])
+async def test_paged_requests(tmp_path, num_items, expected_requests):
+    requested_pages: list[int] = []
+
+    async with TestServer(_paged_app(num_items, requested_pages)) as server:
+        requester = Requester(token_auth("token"), file_cache(str(tmp_path)), "localhost", "2022-11-28")
+        requester._base_url = str(server.make_url("")).rstrip("/")
+
+        try:
+            items = await requester.request_paged_json("GET", "/orgs/test/members")
+            streamed_items = [item async for item in requester.request_paged_json_stream("GET", "/orgs/test/members")]
+        finally:
+            await requester.close()
+            await close_shared_session()
+
+    assert len(requested_pages) == 2 * expected_requests
+    assert [x["id"] for x in items] == list(range(num_items))
+    assert streamed_items == items
@@ -0,0 +1,62 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import pytest
+
+from otterdog.schemas import get_schema_validator, validate_org_data, validate_repo_data
+
+from .models import ModelTest
+
+
+def _load_repo_data() -> dict:
+    return ModelTest.load_json_resource("otterdog-repo.json")
+
+
+def test_validator_is_cached():
+    assert get_schema_validator("organization.json") is get_schema_validator("organization.json")
+
+
+def test_valid_org_data():
+    validate_org_data({"github_id": "test-org", "settings": {}, "repositories": [_load_repo_data()]})
+
+
+def test_errors_are_reported_per_repository():
+    repo_data = _load_repo_data()
+    data = {
+        "github_id": "test-org",
+        "settings": {},
+        "repositories": [
+            repo_data,
+            dict(repo_data, name="repo-1", private="yes"),
+            dict(repo_data, name="repo-2", unknown=True),
+        ],
+    }
+
+    with pytest.raises(RuntimeError) as ex:
+        validate_org_data(data)
+
+    message = str(ex.value)
+    assert "found 2 error(s)" in message
+    assert "repository 'repo-1' at 'private': 'yes' is not of type 'boolean'" in message
+    assert "repository 'repo-2': Additional properties are not allowed ('unknown' was unexpected)" in message
+
+
+def test_repositories_can_be_validated_individually():
+    repo_data = _load_repo_data()
+    invalid_repo_data = dict(repo_data, name="repo-1", private="yes")
+    data = {"github_id": "test-org", "settings": {}, "repositories": [repo_data, invalid_repo_data]}
+
+    validate_org_data(data, validate_repositories=False)
+    validate_repo_data(repo_data)
+
+    with pytest.raises(RuntimeError) as ex:
+        validate_repo_data(invalid_repo_data)
+
+    message = str(ex.value)
+    assert "found 1 error(s)" in message
+    assert "repository 'repo-1' at 'private': 'yes' is not of type 'boolean'" in message
@@ -0,0 +1,52 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from otterdog.providers.github.auth import token_auth
+from otterdog.providers.github.cache.file import file_cache
+from otterdog.providers.github.rest.requester import Requester
+from otterdog.providers.github.session import close_shared_session, get_shared_session
+
+
+@pytest.mark.asyncio
+async def test_connections_are_shared_between_requesters(tmp_path):
+    received_auth_headers = []
+    peers = set()
+
+    async def handler(request: web.Request) -> web.Response:
+        received_auth_headers.append(request.headers.get("Authorization"))
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/user", handler)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+
+        try:
+            for token in ["first", "second"]:
+                requester = Requester(token_auth(token), file_cache(str(tmp_path)), "localhost", "2022-11-28")
+                requester._base_url = base_url
+
+                assert await requester.request_json("GET", "/user") == {}
+
+                # closing a requester must keep the shared session open
+                await requester.close()
+                assert get_shared_session().closed is False
+        finally:
+            session = get_shared_session()
+            await close_shared_session()
+
+    assert session.closed is True
+    assert received_auth_headers == ["Bearer first", "Bearer second"]
+    # the connection has been kept alive and re-used by the second requester
+    assert len(peers) == 1
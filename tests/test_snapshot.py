@@ -0,0 +1,74 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from datetime import datetime, timedelta, timezone
+
+from otterdog.models.repository import Repository
+from otterdog.snapshot import OrganizationSnapshot, RepositorySnapshot, SnapshotStore
+from otterdog.utils import UNSET
+
+from .models import ModelTest
+
+
+def _load_repo_data() -> dict:
+    return ModelTest.load_json_resource("github-repo.json")
+
+
+def _create_snapshot(repo_data: dict, created_at: datetime, fetched_at: datetime | None = None) -> OrganizationSnapshot:
+    repo = Repository.from_provider_data("OtterdogTest", repo_data)
+    snapshot = OrganizationSnapshot("hash", created_at)
+    snapshot.repositories[repo.name] = RepositorySnapshot(
+        repo_data["pushed_at"], repo_data["updated_at"], repo, fetched_at if fetched_at is not None else created_at
+    )
+    return snapshot
+
+
+def test_store_and_load(tmp_path):
+    repo_data = _load_repo_data()
+    store = SnapshotStore(str(tmp_path))
+
+    store.save("OtterdogTest", _create_snapshot(repo_data, datetime.now(timezone.utc)))
+
+    assert store.load("OtterdogTest", "other-hash") is None
+
+    snapshot = store.load("OtterdogTest", "hash")
+    assert snapshot is not None
+
+    repo = snapshot.repositories[repo_data["name"]].repository
+    assert repo == Repository.from_provider_data("OtterdogTest", repo_data)
+    # the UNSET singleton must be retained
+    assert repo.forked_repository is UNSET
+
+    store.invalidate("OtterdogTest")
+    assert store.load("OtterdogTest", "hash") is None
+
+
+def test_unchanged_repository():
+    repo_data = _load_repo_data()
+    repo_name = repo_data["name"]
+    max_age = timedelta(hours=1)
+
+    snapshot = _create_snapshot(repo_data, datetime.now(timezone.utc))
+
+    assert snapshot.get_unchanged_repository(repo_name, repo_data, set(), max_age) is not None
+    assert snapshot.get_unchanged_repository(repo_name, repo_data, None, max_age) is not None
+    assert snapshot.get_unchanged_repository(repo_name, repo_data, {repo_name}, max_age) is None
+    assert snapshot.get_unchanged_repository("unknown", repo_data, set(), max_age) is None
+
+    pushed_repo_data = dict(repo_data, pushed_at="2024-02-23T12:08:35Z")
+    assert snapshot.get_unchanged_repository(repo_name, pushed_repo_data, set(), max_age) is None
+
+    # without audit log, outdated snapshots are not re-used
+    old_snapshot = _create_snapshot(repo_data, datetime.now(timezone.utc) - timedelta(hours=2))
+    assert old_snapshot.get_unchanged_repository(repo_name, repo_data, None, max_age) is None
+    assert old_snapshot.get_unchanged_repository(repo_name, repo_data, set(), max_age) is not None
+
+    # the age of a repository is determined by the time it has been loaded, not by the time of the snapshot
+    now = datetime.now(timezone.utc)
+    reused_snapshot = _create_snapshot(repo_data, now, now - timedelta(hours=2))
+    assert reused_snapshot.get_unchanged_repository(repo_name, repo_data, None, max_age) is None
@@ -0,0 +1,225 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import contextlib
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from otterdog.utils import LogLevel
+from otterdog.webapp import queue as task_queue
+from otterdog.webapp import webhook  # noqa: F401
+from otterdog.webapp.policies import read_policy
+from otterdog.webapp.queue import TaskQueue, _deserialize_task, _serialize_task
+from otterdog.webapp.tasks.apply_changes import ApplyChangesTask
+from otterdog.webapp.tasks.check_sync import CheckConfigurationInSyncTask
+from otterdog.webapp.tasks.fetch_policies import FetchPoliciesTask
+from otterdog.webapp.tasks.help_comment import HelpCommentTask
+from otterdog.webapp.tasks.validate_pull_request import ValidatePullRequestTask
+from otterdog.webapp.webhook.github_models import PullRequest
+
+
+def test_coalescing_keys():
+    validate = ValidatePullRequestTask(1, "test-org", ".otterdog", 10)
+
+    assert validate.coalescing_key == ValidatePullRequestTask(1, "test-org", ".otterdog", 10).coalescing_key
+    assert validate.coalescing_key != ValidatePullRequestTask(1, "test-org", ".otterdog", 11).coalescing_key
+    assert validate.coalescing_key != CheckConfigurationInSyncTask(1, "test-org", ".otterdog", 10).coalescing_key
+
+    assert HelpCommentTask(1, "test-org", ".otterdog", 10).coalescing_key is None
+
+
+def test_retryable_tasks():
+    assert ValidatePullRequestTask(1, "test-org", ".otterdog", 10).retryable
+    assert CheckConfigurationInSyncTask(1, "test-org", ".otterdog", 10).retryable
+
+    assert not ApplyChangesTask(1, "test-org", ".otterdog", 10).retryable
+    assert not HelpCommentTask(1, "test-org", ".otterdog", 10).retryable
+
+
+def _pull_request() -> PullRequest:
+    actor = {"login": "user", "id": 1, "node_id": "U_1", "type": "User"}
+    ref = {"label": "test-org:main", "ref": "main", "sha": "abc", "user": actor, "repo": None}
+    return PullRequest.model_validate(
+        {
+            "id": 1,
+            "node_id": "PR_1",
+            "number": 10,
+            "state": "open",
+            "locked": False,
+            "title": "Update configuration",
+            "draft": False,
+            "user": actor,
+            "author_association": "MEMBER",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "head": ref,
+            "base": ref,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "task",
+    [
+        ValidatePullRequestTask(1, "test-org", ".otterdog", 10),
+        ValidatePullRequestTask(1, "test-org", ".otterdog", _pull_request(), LogLevel.INFO),
+        FetchPoliciesTask(
+            1,
+            "test-org",
+            ".otterdog",
+            [read_policy({"type": "required_file", "config": {"files": []}})],
+        ),
+    ],
+)
+def test_tasks_can_be_serialized(task):
+    loaded_task = _deserialize_task(_serialize_task(task).encode("utf-8"))
+
+    assert loaded_task == task
+    assert loaded_task.coalescing_key == task.coalescing_key
+
+
+@pytest.mark.parametrize(
+    "task_type, error",
+    [
+        ("os:system", ValueError),
+        ("otterdog.webapp.tasks:get_organization_config", TypeError),
+    ],
+)
+def test_only_tasks_can_be_deserialized(task_type, error):
+    with pytest.raises(error):
+        _deserialize_task(json.dumps({"type": task_type, "args": {}}).encode("utf-8"))
+
+
+def _create_queue(max_attempts: int) -> TaskQueue:
+    queue = TaskQueue()
+    queue._max_attempts = max_attempts
+    queue._retry = AsyncMock()  # type: ignore
+    queue._complete = AsyncMock()  # type: ignore
+    return queue
+
+
+def _payload(task) -> bytes:
+    return _serialize_task(task).encode("utf-8")
+
+
+def _create_app() -> MagicMock:
+    app = MagicMock()
+    app.app_context.return_value = contextlib.nullcontext()
+    return app
+
+
+@pytest.mark.asyncio
+async def test_failed_task_is_retried(monkeypatch):
+    queue = _create_queue(max_attempts=3)
+    execute = AsyncMock(return_value=RuntimeError("failure"))
+    monkeypatch.setattr(ValidatePullRequestTask, "execute", execute)
+
+    payload = _payload(ValidatePullRequestTask(1, "test-org", ".otterdog", 10))
+
+    await queue._process(_create_app(), "1", payload, 2)
+
+    execute.assert_awaited_once()
+    queue._retry.assert_awaited_once_with("1", 60)
+    queue._complete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_task_is_completed_after_last_attempt(monkeypatch):
+    queue = _create_queue(max_attempts=3)
+    execute = AsyncMock(return_value=RuntimeError("failure"))
+    monkeypatch.setattr(ValidatePullRequestTask, "execute", execute)
+
+    payload = _payload(ValidatePullRequestTask(1, "test-org", ".otterdog", 10))
+
+    await queue._process(_create_app(), "1", payload, 3)
+
+    execute.assert_awaited_once()
+    queue._retry.assert_not_awaited()
+    queue._complete.assert_awaited_once_with("1")
+
+
+@pytest.mark.asyncio
+async def test_interrupted_task_is_discarded_after_last_attempt(monkeypatch):
+    queue = _create_queue(max_attempts=3)
+    execute = AsyncMock()
+    monkeypatch.setattr(ValidatePullRequestTask, "execute", execute)
+
+    payload = _payload(ValidatePullRequestTask(1, "test-org", ".otterdog", 10))
+
+    await queue._process(_create_app(), "1", payload, 4)
+
+    execute.assert_not_awaited()
+    queue._complete.assert_awaited_once_with("1")
+
+
+@pytest.mark.asyncio
+async def test_enqueue_falls_back_to_background_task(monkeypatch):
+    from redis import RedisError
+
+    queue = TaskQueue()
+    queue._run_script = AsyncMock(side_effect=RedisError("unavailable"))  # type: ignore
+
+    current_app = MagicMock()
+    monkeypatch.setattr(task_queue, "current_app", current_app)
+
+    task = ValidatePullRequestTask(1, "test-org", ".otterdog", 10)
+    await queue.enqueue(task)
+
+    current_app.add_background_task.assert_called_once_with(task)
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_failing_task():
+    queue = TaskQueue()
+    queue._recover_expired_tasks = AsyncMock()  # type: ignore
+    queue._claim = AsyncMock(return_value=("1", b"", 1))  # type: ignore
+
+    async def process(app, task_id, payload, attempts):
+        if queue._process.await_count == 2:
+            queue._stopping.set()
+        raise RuntimeError("failed to record task")
+
+    queue._process = AsyncMock(side_effect=process)  # type: ignore
+
+    await queue._work(_create_app())
+
+    assert queue._process.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_task_is_not_retried_if_not_retryable(monkeypatch):
+    queue = _create_queue(max_attempts=3)
+    execute = AsyncMock(return_value=RuntimeError("failure"))
+    monkeypatch.setattr(ApplyChangesTask, "execute", execute)
+
+    payload = _payload(ApplyChangesTask(1, "test-org", ".otterdog", 10))
+
+    await queue._process(_create_app(), "1", payload, 1)
+
+    execute.assert_awaited_once()
+    queue._retry.assert_not_awaited()
+    queue._complete.assert_awaited_once_with("1")
+
+
+@pytest.mark.asyncio
+async def test_interrupted_task_is_discarded_if_not_retryable(monkeypatch):
+    queue = _create_queue(max_attempts=3)
+    execute = AsyncMock()
+    fail = AsyncMock()
+    monkeypatch.setattr(ApplyChangesTask, "execute", execute)
+    monkeypatch.setattr(ApplyChangesTask, "fail", fail)
+
+    payload = _payload(ApplyChangesTask(1, "test-org", ".otterdog", 10))
+
+    await queue._process(_create_app(), "1", payload, 2)
+
+    execute.assert_not_awaited()
+    fail.assert_awaited_once()
+    queue._complete.assert_awaited_once_with("1")
@@ -0,0 +1,39 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from otterdog.webapp import webhook  # noqa: F401
+from otterdog.webapp.tasks.help_comment import HelpCommentTask
+
+
+@pytest.mark.asyncio
+async def test_outdated_comments_are_minimized_in_a_single_batch():
+    graphql_api = MagicMock()
+    graphql_api.get_issue_comments = AsyncMock(
+        return_value=[
+            {"id": "c1", "body": "<!-- header -->\nold", "isMinimized": False},
+            {"id": "c2", "body": "other", "isMinimized": False},
+            {"id": "c3", "body": "<!-- header -->\nolder", "isMinimized": True},
+            {"id": "c4", "body": "<!-- header -->\nnew", "isMinimized": False},
+        ]
+    )
+    graphql_api.minimize_comments = AsyncMock()
+
+    task = HelpCommentTask(1, "test-org", ".otterdog", 10)
+    task._InstallationBasedTask__graphql_api = graphql_api  # type: ignore
+
+    assert await task.comment_with_header_exists("test-org", ".otterdog", 10, "<!-- header -->")
+
+    await task.minimize_outdated_comments("test-org", ".otterdog", 10, "<!-- header -->")
+    graphql_api.minimize_comments.assert_awaited_once_with(["c1", "c4"], "OUTDATED")
+
+    # comments are retrieved anew to include comments created in the meantime
+    assert graphql_api.get_issue_comments.await_count == 2
@@ -6,11 +6,23 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+import asyncio
 from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from otterdog.webapp.utils import backoff_if_needed, current_utc_time
+from otterdog.webapp import utils
+from otterdog.webapp.utils import (
+    backoff_if_needed,
+    current_utc_time,
+    get_base_org,
+    get_live_org,
+    get_token_for_installation,
+    has_live_org,
+    invalidate_base_orgs,
+    invalidate_live_org,
+)
 
 
 @pytest.mark.asyncio
@@ -26,3 +38,140 @@ async def test_backoff_if_needed():
     await backoff_if_needed(start - timedelta(seconds=60), timedelta(seconds=3))
     end = current_utc_time()
     assert end - start < timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_get_live_org_loads_once():
+    loaded_orgs = []
+
+    async def load():
+        await asyncio.sleep(0.1)
+        org = MagicMock()
+        loaded_orgs.append(org)
+        return org
+
+    # concurrent and subsequent calls share a single retrieval
+    orgs = await asyncio.gather(*[get_live_org("single-flight-org", load) for _ in range(5)])
+    assert len(loaded_orgs) == 1
+    assert all(org is loaded_orgs[0] for org in orgs)
+
+    assert await get_live_org("single-flight-org", load) is loaded_orgs[0]
+    assert has_live_org("single-flight-org")
+
+    # other organizations are retrieved separately
+    assert await get_live_org("other-org", load) is loaded_orgs[1]
+
+    invalidate_live_org("single-flight-org")
+    assert not has_live_org("single-flight-org")
+    assert await get_live_org("single-flight-org", load) is loaded_orgs[2]
+
+    with patch.object(utils, "_LIVE_ORG_EXPIRATION", timedelta(0)):
+        assert not has_live_org("single-flight-org")
+        assert await get_live_org("single-flight-org", load) is loaded_orgs[3]
+
+
+@pytest.mark.asyncio
+async def test_get_live_org_retains_no_idle_state():
+    async def load():
+        await asyncio.sleep(0.1)
+        return MagicMock()
+
+    async def invalidate():
+        await asyncio.sleep(0.05)
+        invalidate_live_org("idle-org")
+
+    # an organization that is invalidated while being retrieved is not stored
+    await asyncio.gather(get_live_org("idle-org", load), invalidate())
+    assert not has_live_org("idle-org")
+
+    await get_live_org("idle-org", load)
+    assert has_live_org("idle-org")
+
+    # locks and generations are dropped once no retrieval is pending anymore
+    invalidate_live_org("idle-org")
+    assert "idle-org" not in utils._LIVE_ORG_LOCKS
+    assert "idle-org" not in utils._LIVE_ORG_LOCK_USERS
+    assert "idle-org" not in utils._LIVE_ORG_GENERATIONS
+
+    # expired organizations are evicted when checking for any organization
+    await get_live_org("idle-org", load)
+    with patch.object(utils, "_LIVE_ORG_EXPIRATION", timedelta(0)):
+        assert not has_live_org("other-idle-org")
+    assert "idle-org" not in utils._LIVE_ORGS
+
+
+@pytest.mark.asyncio
+async def test_get_base_org_reuses_evaluation(tmp_path):
+    config_file = tmp_path / "test-org.jsonnet-BASE"
+    template_file = tmp_path / "template.libsonnet"
+    config_file.write_text("local orgs = import 'template.libsonnet';\norgs.newOrg('test-org')\n")
+    template_file.write_text("{ newOrg(id):: { id: id } }\n")
+
+    loaded_orgs = []
+
+    async def load():
+        org = MagicMock()
+        loaded_orgs.append(org)
+        return org
+
+    base_org = await get_base_org("base-org", "sha1", str(config_file), load)
+    assert await get_base_org("base-org", "sha1", str(config_file), load) is base_org
+
+    # a change of the template leads to a new evaluation
+    template_file.write_text("{ newOrg(id):: { id: id, settings: {} } }\n")
+    assert await get_base_org("base-org", "sha1", str(config_file), load) is loaded_orgs[1]
+    assert await get_base_org("base-org", "sha2", str(config_file), load) is loaded_orgs[2]
+
+    invalidate_base_orgs("base-org")
+    assert await get_base_org("base-org", "sha2", str(config_file), load) is loaded_orgs[3]
+
+
+@pytest.mark.asyncio
+async def test_get_token_for_installation():
+    redis = AsyncMock()
+    redis.hgetall.return_value = {}
+
+    tokens = iter(["token-1", "token-2"])
+
+    async def create_token(installation_id):
+        await asyncio.sleep(0.1)
+        return next(tokens), current_utc_time() + timedelta(hours=1)
+
+    rest_api = MagicMock()
+    rest_api.app.create_installation_access_token = AsyncMock(side_effect=create_token)
+
+    with (
+        patch.object(utils, "get_redis", return_value=redis),
+        patch.object(utils, "get_rest_api_for_app", return_value=rest_api),
+    ):
+        # concurrent requests for the same installation create a single token
+        results = await asyncio.gather(*[get_token_for_installation(1001) for _ in range(5)])
+        assert all(token == "token-1" for token, _ in results)
+        assert rest_api.app.create_installation_access_token.await_count == 1
+        assert redis.hgetall.await_count == 1
+
+        # subsequent requests are served from memory
+        token, _ = await get_token_for_installation(1001)
+        assert token == "token-1"
+        assert redis.hgetall.await_count == 1
+
+        # a token that expires soon is still returned but refreshed in the background
+        with patch.object(utils, "_INSTALLATION_TOKEN_REFRESH_VALIDITY", timedelta(hours=2)):
+            token, _ = await get_token_for_installation(1001)
+            assert token == "token-1"
+            await asyncio.gather(*utils._INSTALLATION_TOKEN_REFRESHES.values())
+
+        token, _ = await get_token_for_installation(1001)
+        assert token == "token-2"
+        assert rest_api.app.create_installation_access_token.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_live_org_discards_invalidated_load():
+    async def load():
+        # changes are applied while the organization is being retrieved
+        invalidate_live_org("invalidated-org")
+        return MagicMock()
+
+    await get_live_org("invalidated-org", load)
+    assert not has_live_org("invalidated-org")